@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+
+###############################################################################
+"""
+Script Name:    CoolCall Benchmarks
+
+Description:    Times the main operations of CoolCall on synthetic rosters of
+                increasing size: importing a roster file, building the queue,
+                getting the on-deck students, cold calling a student, logging
+                the cold call, and a full Random Distribution Verification run.
+
+                Each roster size is benchmarked in a fresh process, so that its
+                peak memory use (RSS) is measured on its own. For each operation
+                the number of operations per second, and the median (p50) and
+                99th percentile (p99) latency are recorded. The results are
+                printed, and written as JSON so that commits can be compared.
+                All files are created in a temporary directory.
+
+                Usage:
+                    python3 benchmark.py [--sizes 30,1000] [--calls 1000]
+                                         [--output benchmark_results.json]
+
+Authors:        CoolCall Team
+
+Last Edited:    10/18/2026
+Last Edit By:   CoolCall Team
+"""
+###############################################################################
+from concurrent.futures import ProcessPoolExecutor
+from student_roster import StudentRoster
+from weighted_student_queue import make_student_queue
+from log_manager import LogManager
+from rdv_simulation import simulate
+from constants import *
+import multiprocessing
+import subprocess
+import tempfile
+import argparse
+import platform
+import resource
+import random
+import json
+import time
+import sys
+###############################################################################
+
+def write_synthetic_roster(filename, size):
+    """
+    Write a roster file of <size> made-up students, in the same format as
+    input_data/roster.txt.
+
+    filename: (string) the file to write
+    size: (int) the number of students
+    """
+    with open(filename, "w") as f:
+        f.write("Synthetic Roster\n")
+        for i in range(size):
+            f.write(f"First{i}\tLast{i}\t{951000000 + i}\ts{i}@uoregon.edu\tfirst-{i}\t0\n")
+
+
+def summarize(latencies_ns):
+    """
+    Summarize the latencies of a timed operation.
+
+    latencies_ns: (list) the time each operation took, in nanoseconds
+    returns: (dict) the number of operations, the total time, operations per
+    second, and p50 and p99 latency in microseconds
+    """
+    latencies = sorted(latencies_ns)
+    total = sum(latencies)
+
+    def percentile(p):
+        # Nearest-rank percentile
+        return latencies[max(0, -(-len(latencies) * p // 100) - 1)] / 1000
+
+    return {
+        "ops": len(latencies),
+        "seconds": total / 1e9,
+        "ops_per_sec": len(latencies) * 1e9 / total if total else None,
+        "p50_us": percentile(50),
+        "p99_us": percentile(99),
+    }
+
+
+def timed(function, *args):
+    """
+    returns: (tuple) the time taken by function(*args) in nanoseconds, and
+    whatever the function returns
+    """
+    start = time.perf_counter_ns()
+    result = function(*args)
+    return time.perf_counter_ns() - start, result
+
+
+def peak_rss_bytes():
+    """
+    returns: (int) the peak resident memory of this process, in bytes
+    """
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def benchmark_size(size, calls, seed=0, directory=None):
+    """
+    Benchmark every operation on a synthetic roster of <size> students.
+
+    size: (int) the number of students in the roster
+    calls: (int) the number of cold calls to time
+    seed: (int) seeds the shuffles, so runs are comparable
+    directory: (string) where to write the roster, queue and logs; by
+    default, a temporary directory that is removed afterwards
+    returns: (dict) the results for each operation, and the peak RSS
+    """
+    if directory is None:
+        with tempfile.TemporaryDirectory() as directory:
+            return benchmark_size(size, calls, seed, directory)
+    random.seed(seed)
+    roster_file = os.path.join(directory, "roster.txt")
+    write_synthetic_roster(roster_file, size)
+    stages = {}
+
+    roster = StudentRoster(os.path.join(directory, "internal_roster.txt"))
+    elapsed, error = timed(roster.import_roster_from_file, roster_file)
+    if error:
+        raise RuntimeError(error)
+    stages["import_roster_from_file"] = summarize([elapsed])
+
+    queue = make_student_queue(os.path.join(directory, "student_queue"))
+    elapsed, _ = timed(queue.queue_from_roster, roster)
+    stages["queue_from_roster"] = summarize([elapsed])
+
+    logs_location = os.path.join(directory, "logs")
+    os.makedirs(logs_location)
+    log_manager = LogManager("summary.txt", logs_location)
+    # The first write sets up the summary store for the whole class; it is
+    # timed on its own, so that the per-call numbers aren't skewed.
+    first = queue.get_on_deck()[0]
+    elapsed, _ = timed(log_manager.write, queue.student_queue, first, False)
+    stages["log_manager_bind"] = summarize([elapsed])
+
+    on_deck_times, take_off_times, write_times = [], [], []
+    for _ in range(calls):
+        elapsed, on_deck = timed(queue.get_on_deck)
+        on_deck_times.append(elapsed)
+        student = random.choice(on_deck)
+        flag = random.random() < 0.1
+        student.call_on(flag)
+        elapsed, _ = timed(queue.take_off_deck, student, flag)
+        take_off_times.append(elapsed)
+        elapsed, _ = timed(log_manager.write, queue.student_queue, student, flag)
+        write_times.append(elapsed)
+    stages["get_on_deck"] = summarize(on_deck_times)
+    stages["take_off_deck"] = summarize(take_off_times)
+    stages["log_manager_write"] = summarize(write_times)
+
+    elapsed, _ = timed(log_manager.close)
+    stages["log_manager_close"] = summarize([elapsed])
+    queue.close()
+
+    elapsed, _ = timed(simulate, list(range(size)), RDV_NUM_RESTARTS,
+                       RDV_CALLS_PER_RESTART, NUM_ON_DECK, INSERT_DELAY, random.Random(seed))
+    stages["rdv_run"] = summarize([elapsed])
+
+    return {"size": size, "calls": calls, "stages": stages, "peak_rss_bytes": peak_rss_bytes()}
+
+
+def git_commit():
+    """
+    returns: (string) the commit being benchmarked, or None if unknown
+    """
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)),
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(sizes, calls):
+    """
+    Benchmark each roster size in its own fresh process.
+
+    returns: (dict) the machine-readable results of the whole run
+    """
+    results = []
+    context = multiprocessing.get_context("spawn")
+    for size in sizes:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            results.append(executor.submit(benchmark_size, size, calls).result())
+    return {
+        "commit": git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def print_results(report):
+    print(f"{'size':>9}  {'operation':<24}{'ops/s':>12}{'p50 us':>12}{'p99 us':>12}")
+    for result in report["results"]:
+        for name, stage in result["stages"].items():
+            ops_per_sec = stage["ops_per_sec"] or float("inf")
+            print(f"{result['size']:>9}  {name:<24}{ops_per_sec:>12.1f}"
+                  f"{stage['p50_us']:>12.1f}{stage['p99_us']:>12.1f}")
+        print(f"{result['size']:>9}  {'peak RSS (MiB)':<24}"
+              f"{result['peak_rss_bytes'] / 2 ** 20:>12.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark CoolCall at several roster sizes.")
+    parser.add_argument("--sizes", default=",".join(map(str, BENCHMARK_SIZES)),
+                        help="comma-separated roster sizes")
+    parser.add_argument("--calls", type=int, default=BENCHMARK_CALLS,
+                        help="cold calls to time at each size")
+    parser.add_argument("--output", default=BENCHMARK_RESULTS_FILE)
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    report = run_benchmarks(sizes, args.calls)
+    print_results(report)
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {args.output}")
+
+if __name__ == "__main__":
+    main()
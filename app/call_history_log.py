@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+
+###############################################################################
+"""
+Script Name:    Call History Log
+
+Description:    The CallHistoryLog Class for the CoolCall Program.
+                Records every cold call as a fixed-width binary record, so that
+                questions like "how many times was this student called on this
+                term?" can be answered without unpickling the queue or parsing
+                the daily log files.
+
+                call_history.dat (in the logs directory) holds the records, in the order the cold calls
+                were made. Two sorted sidecar indexes point into it:
+                    call_history.dat.by_student   (student id, record)
+                    call_history.dat.by_date      (day ordinal, record)
+                The files are read through mmap, and the indexes are searched
+                with a binary search, so a query takes O(log n) time plus the
+                size of its answer. The indexes are brought up to date every
+                CALL_HISTORY_INDEX_INTERVAL cold calls and when the log is
+                closed; newer records are checked one by one.
+
+                A student is identified by their UO ID, stored as a number.
+                It is unique within a roster (the roster rejects duplicates)
+                and stays the same when a student's name or email address is
+                corrected, so a student's history is never split or mixed
+                with another student's. It is never used as a dictionary key.
+                Logs written in an older format are moved aside to
+                call_history.dat.old, and a new log is started.
+
+Authors:        CoolCall Team
+
+Last Edited:    10/18/2026
+Last Edit By:   CoolCall Team
+"""
+###############################################################################
+from collections import namedtuple
+from datetime import date
+from bisect import bisect_left
+from constants import *
+import heapq
+import struct
+import mmap
+import os
+###############################################################################
+
+# Every file starts with a magic string and format version.
+LOG_HEADER = struct.Struct("<4sH")
+LOG_MAGIC = b"CCHL"
+# An index header also holds the number of records that the index covers.
+INDEX_HEADER = struct.Struct("<4sHI")
+INDEX_MAGIC = b"CCHI"
+VERSION = 2
+
+# A record: the student's id (their UO ID), the day ordinal of the cold call, its
+# flags (1 if flagged), and the time of the cold call.
+RECORD = struct.Struct("<IIB3xd")
+# An index entry: the key (student id or day ordinal), and the
+# number of the record it points to.
+ENTRY = struct.Struct("<II")
+
+CallRecord = namedtuple("CallRecord", ["student_id", "day", "flagged", "timestamp"])
+
+
+def student_id(student):
+    """
+    student: (Student)
+    returns: (int) the id that the log records the student's cold calls under
+    """
+    return int(student.UO_ID)
+
+
+class _MappedFile:
+    """
+    A read-only memory map of a file that is remapped when the file grows.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.buffer = None
+        self._size = 0
+
+    def refresh(self):
+        size = os.path.getsize(self.filename) if os.path.exists(self.filename) else 0
+        if size != self._size:
+            self.close()
+            if size:
+                with open(self.filename, "rb") as f:
+                    self.buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._size = size
+        return self.buffer
+
+    def close(self):
+        if self.buffer is not None:
+            self.buffer.close()
+            self.buffer = None
+        self._size = 0
+
+
+class _IndexKeys:
+    """
+    The keys of a mapped index, as a sequence that bisect can search without
+    reading the whole index.
+    """
+
+    def __init__(self, buffer, count):
+        self.buffer = buffer
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, i):
+        return ENTRY.unpack_from(self.buffer, INDEX_HEADER.size + i * ENTRY.size)[0]
+
+
+class CallHistoryLog():
+    """
+    A class for recording cold calls in a binary log, and querying them.
+
+    Attributes
+    =======================================================================
+    filename
+        The path of the log file. The indexes are kept next to it, with
+        ".by_student" and ".by_date" added to the name.
+
+    Methods
+    =======================================================================
+    append(student, flagged, day, timestamp)
+        Record a cold call.
+
+    student_calls(student)
+        Returns every cold call of a student.
+
+    calls_between(first_day, last_day)
+        Returns every cold call from first_day to last_day.
+
+    times_called(student, first_day, last_day)
+        Returns the number of times a student has been called on.
+
+    update_indexes()
+        Bring the sidecar indexes up to date.
+
+    close()
+        Update the indexes, and close the files.
+    """
+
+    def __init__(self, filename, index_interval=CALL_HISTORY_INDEX_INTERVAL):
+        self.filename = filename
+        self.index_interval = index_interval
+        self._log_filename = filename
+        self._index_filenames = {
+            "student": filename + ".by_student",
+            "date": filename + ".by_date",
+        }
+        self._file = None
+        self._log = _MappedFile(self._log_filename)
+        self._indexes = {name: _MappedFile(filename)
+                         for name, filename in self._index_filenames.items()}
+        self._retire_old_format()
+
+    def _retire_old_format(self):
+        """
+        Move a log written in an older format aside, with its indexes, so that
+        its records are never read as records of this format.
+        """
+        if not os.path.exists(self._log_filename):
+            return
+        with open(self._log_filename, "rb") as f:
+            header = f.read(LOG_HEADER.size)
+        if len(header) == LOG_HEADER.size and LOG_HEADER.unpack(header) == (LOG_MAGIC, VERSION):
+            return
+        os.replace(self._log_filename, self._log_filename + ".old")
+        for filename in self._index_filenames.values():
+            if os.path.exists(filename):
+                os.remove(filename)
+
+    def _num_records(self):
+        if not os.path.exists(self._log_filename):
+            return 0
+        return (os.path.getsize(self._log_filename) - LOG_HEADER.size) // RECORD.size
+
+    def append(self, student, flagged, day, timestamp):
+        """
+        Record a cold call.
+
+        student: (Student) the student who was called on
+        flagged: (boolean) was the cold call flagged?
+        day: (date) the day of the cold call
+        timestamp: (float) the time of the cold call, as from time.time()
+        """
+        if self._file is None:
+            self._open()
+        self._file.write(RECORD.pack(student_id(student), day.toordinal(), int(flagged), timestamp))
+        self._file.flush()
+        if self._num_records() - self._indexed_count("student") >= self.index_interval:
+            self.update_indexes()
+
+    def _open(self):
+        """
+        Open the log for appending, writing its header if it is new. A record
+        cut short by a crash is dropped.
+        """
+        new_file = not os.path.exists(self._log_filename)
+        self._file = open(self._log_filename, "ab")
+        if new_file:
+            self._file.write(LOG_HEADER.pack(LOG_MAGIC, VERSION))
+            self._file.flush()
+        else:
+            whole = LOG_HEADER.size + self._num_records() * RECORD.size
+            if os.path.getsize(self._log_filename) != whole:
+                self._file.truncate(whole)
+
+    def _record(self, buffer, number):
+        ref, day, flags, timestamp = RECORD.unpack_from(
+            buffer, LOG_HEADER.size + number * RECORD.size)
+        return CallRecord(ref, date.fromordinal(day), bool(flags & 1), timestamp)
+
+    def _indexed_count(self, name):
+        """
+        returns: (int) the number of records covered by an index
+        """
+        buffer = self._indexes[name].refresh()
+        if buffer is None or len(buffer) < INDEX_HEADER.size:
+            return 0
+        magic, version, count = INDEX_HEADER.unpack_from(buffer)
+        if (magic, version) != (INDEX_MAGIC, VERSION):
+            return 0
+        return count
+
+    def _lookup(self, name, low_key, high_key):
+        """
+        Find the records whose key (student id or day ordinal) is
+        from low_key to high_key, using the index, and checking the records
+        that were added since the index was last updated.
+
+        returns: (list) the matching CallRecords, in the order they were made
+        """
+        log = self._log.refresh()
+        if log is None:
+            return []
+        num_records = (len(log) - LOG_HEADER.size) // RECORD.size
+        indexed = min(self._indexed_count(name), num_records)
+        numbers = []
+        if indexed:
+            buffer = self._indexes[name].buffer
+            entries = (len(buffer) - INDEX_HEADER.size) // ENTRY.size
+            keys = _IndexKeys(buffer, entries)
+            i = bisect_left(keys, low_key)
+            while i < entries:
+                key, number = ENTRY.unpack_from(buffer, INDEX_HEADER.size + i * ENTRY.size)
+                if key > high_key:
+                    break
+                numbers.append(number)
+                i += 1
+            numbers.sort()
+        key_field = 0 if name == "student" else 1
+        for number in range(indexed, num_records):
+            key = RECORD.unpack_from(log, LOG_HEADER.size + number * RECORD.size)[key_field]
+            if low_key <= key <= high_key:
+                numbers.append(number)
+        return [self._record(log, number) for number in numbers]
+
+    def student_calls(self, student):
+        """
+        returns: (list) every CallRecord of a student, in the order they were made
+        """
+        ref = student_id(student)
+        return self._lookup("student", ref, ref)
+
+    def calls_between(self, first_day, last_day):
+        """
+        first_day, last_day: (date) the first and last days to include
+        returns: (list) every CallRecord from first_day to last_day
+        """
+        return self._lookup("date", first_day.toordinal(), last_day.toordinal())
+
+    def times_called(self, student, first_day=None, last_day=None):
+        """
+        student: (Student)
+        first_day, last_day: (date) only count cold calls on these days, and
+        the days in between (all cold calls by default)
+        returns: (int) the number of times the student was called on
+        """
+        return sum(1 for record in self.student_calls(student)
+                   if (first_day is None or record.day >= first_day)
+                   and (last_day is None or record.day <= last_day))
+
+    def update_indexes(self):
+        """
+        Add the records made since the last update to both indexes. Each index
+        is merged with the sorted new entries, and replaced atomically.
+        """
+        log = self._log.refresh()
+        if log is None:
+            return
+        num_records = (len(log) - LOG_HEADER.size) // RECORD.size
+        for key_field, name in enumerate(("student", "date")):
+            indexed = min(self._indexed_count(name), num_records)
+            if indexed == num_records:
+                continue
+            new_entries = sorted(
+                (RECORD.unpack_from(log, LOG_HEADER.size + number * RECORD.size)[key_field], number)
+                for number in range(indexed, num_records))
+            old_entries = []
+            if indexed:
+                buffer = self._indexes[name].buffer
+                old_entries = ENTRY.iter_unpack(memoryview(buffer)[INDEX_HEADER.size:])
+            filename = self._index_filenames[name]
+            with open(filename + ".tmp", "wb") as f:
+                f.write(INDEX_HEADER.pack(INDEX_MAGIC, VERSION, num_records))
+                for entry in heapq.merge(old_entries, new_entries):
+                    f.write(ENTRY.pack(*entry))
+            # The old index must be unmapped before it is replaced.
+            old_entries = None
+            self._indexes[name].close()
+            os.replace(filename + ".tmp", filename)
+
+    def close(self):
+        """
+        Update the indexes, and close the files.
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self.update_indexes()
+        self._log.close()
+        for index in self._indexes.values():
+            index.close()
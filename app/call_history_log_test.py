@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+
+###############################################################################
+"""
+Script Name:    CallHistoryLog Testing Script
+
+Description:    This script can be run at the command line to test the binary
+                call history log and its indexes. The log is written to a
+                temporary directory, so the real logs are never touched.
+
+Author:         CoolCall Team
+
+Last Edited:    10/18/2026
+Last Edit By:   CoolCall Team
+"""
+###############################################################################
+import os
+import random
+from datetime import date, timedelta
+from call_history_log import CallHistoryLog, student_id
+from student import Student
+from log_manager import LogManager
+from test_support import make_roster, temporary_directory
+###############################################################################
+
+def roster_students(size):
+    return sorted(make_roster(size).students, key=lambda student: student.UO_ID)
+
+def random_calls(students, num_calls):
+    first_day = date(2025, 9, 29)
+    calls = []
+    for i in range(num_calls):
+        day = first_day + timedelta(days=i * 300 // num_calls)
+        calls.append((random.choice(students), random.random() < 0.2, day, 1.7e9 + i))
+    return calls
+
+def expected(calls, matches):
+    return [(student_id(student), day, flagged, timestamp)
+            for student, flagged, day, timestamp in calls if matches(student, day)]
+
+def test_queries():
+    students = roster_students(40)
+    calls = random_calls(students, 2500)
+    filename = os.path.join(temporary_directory(), "call_history.dat")
+    log = CallHistoryLog(filename, index_interval=700)
+    # Query part way through, when some records are indexed and some are not.
+    for number, call in enumerate(calls, 1):
+        log.append(*call)
+        if number in (1, 650, 1500, 2500):
+            student = students[number % 40]
+            assert log.student_calls(student) == expected(
+                calls[:number], lambda s, day: s == student)
+    log.close()
+
+    log = CallHistoryLog(filename)
+    for student in students[:5]:
+        assert log.student_calls(student) == expected(calls, lambda s, day: s == student)
+    first, last = date(2025, 11, 1), date(2026, 2, 14)
+    assert log.calls_between(first, last) == expected(calls, lambda s, day: first <= day <= last)
+    assert log.times_called(students[0], first, last) == len(
+        expected(calls, lambda s, day: s == students[0] and first <= day <= last))
+    assert log.calls_between(date(2030, 1, 1), date(2030, 12, 31)) == []
+    log.close()
+
+def test_torn_record_is_dropped():
+    student = roster_students(1)[0]
+    filename = os.path.join(temporary_directory(), "call_history.dat")
+    log = CallHistoryLog(filename)
+    log.append(student, True, date(2026, 1, 5), 1.0)
+    log.close()
+    with open(filename, "ab") as f:
+        f.write(b"\x01\x02\x03")
+    log = CallHistoryLog(filename)
+    log.append(student, False, date(2026, 1, 6), 2.0)
+    assert [call.flagged for call in log.student_calls(student)] == [True, False]
+    log.close()
+
+def test_students_are_kept_apart():
+    # These two students have the same 32-bit fingerprint.
+    first, second = [Student(f"First{i}", f"Last{i}", str(951000000 + i), f"s{i}@uoregon.edu", "", "0")
+                     for i in (50225, 274866)]
+    filename = os.path.join(temporary_directory(), "call_history.dat")
+    log = CallHistoryLog(filename)
+    log.append(first, False, date(2026, 1, 5), 1.0)
+    assert log.times_called(first) == 1
+    assert log.times_called(second) == 0
+    # Correcting a student's email address keeps their history.
+    corrected = Student("First50225", "Last50225", "951050225", "first@cs.uoregon.edu", "", "0")
+    log.append(corrected, True, date(2026, 1, 6), 2.0)
+    assert [call.flagged for call in log.student_calls(first)] == [False, True]
+    log.close()
+
+def test_old_format_is_moved_aside():
+    student = roster_students(1)[0]
+    filename = os.path.join(temporary_directory(), "call_history.dat")
+    with open(filename, "wb") as f:
+        f.write(b"CCHL\x01\x00" + bytes(24))
+    log = CallHistoryLog(filename)
+    assert log.student_calls(student) == []
+    log.append(student, True, date(2026, 1, 5), 1.0)
+    assert log.times_called(student) == 1
+    log.close()
+    assert os.path.exists(filename + ".old")
+
+def test_log_manager_appends():
+    logs_location = temporary_directory()
+    students = roster_students(5)
+    log_manager = LogManager("summary.txt", logs_location)
+    for student in students[:3]:
+        student.call_on(False)
+        log_manager.write(students, student, False)
+    log_manager.close()
+    log = CallHistoryLog(os.path.join(logs_location, "call_history.dat"))
+    assert [log.times_called(student) for student in students] == [1, 1, 1, 0, 0]
+    log.close()
+
+if __name__ == "__main__":
+    test_queries()
+    test_torn_record_is_dropped()
+    test_students_are_kept_apart()
+    test_old_format_is_moved_aside()
+    test_log_manager_appends()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+
+###############################################################################
+"""
+Script Name:    Cold Call Session
+
+Description:    The selection and cold call logic of the Instructor Interaction
+                Model, without Tkinter. A session keeps track of which on-deck
+                student is selected, and calls on students through the
+                StudentQueue and LogManager. The Instructor Interaction Model,
+                the service API and the session trace replay all call on
+                students through a session.
+
+Authors:        CoolCall Team
+
+Last Edited:    10/18/2026
+Last Edit By:   CoolCall Team
+"""
+###############################################################################
+from latency_recorder import LatencyRecorder
+###############################################################################
+
+class ColdCallSession:
+    """
+    A class to select and call on on-deck students without a display.
+
+    Attributes
+    =======================================================================
+    queue
+        The StudentQueue that students are called from
+
+    log_manager
+        The LogManager that records each cold call
+
+    index
+        The index of the currently selected student in the on-deck list
+
+    marked
+        The on-deck students who are marked to be called on together
+
+    latency
+        The LatencyRecorder that times each stage of a cold call
+
+    Methods
+    =======================================================================
+    on_deck()
+        Returns the list of students who are currently on-deck.
+
+    shift(step)
+        Move the selection left (negative) or right (positive).
+
+    select(index)
+        Select an on-deck student by index.
+
+    toggle_mark()
+        Mark or unmark the selected student.
+
+    remove(flag)
+        Call on the marked students, or the selected student if none are
+        marked, like the remove keys in the GUI.
+
+    call_on(flag, index)
+        Call on the selected (or given) on-deck student.
+
+    call_on_batch(calls)
+        Call on several on-deck students at once.
+    """
+
+    def __init__(self, queue, log_manager, latency=None):
+        self.queue = queue
+        self.log_manager = log_manager
+        self.index = 0
+        self.marked = set()
+        self.latency = latency if latency is not None else LatencyRecorder(False)
+
+    def on_deck(self):
+        """
+        returns: (list) the students who are currently on-deck
+        """
+        return self.queue.get_on_deck()
+
+    def shift(self, step):
+        """
+        Move the selection by <step> places, staying within the on-deck list,
+        like the left and right keys in the GUI.
+
+        step: (int) negative to move left, positive to move right
+        """
+        self.index = max(0, min(self.index + step, len(self.on_deck()) - 1))
+
+    def select(self, index):
+        """
+        Select an on-deck student.
+
+        index: (int) the index of the student in the on-deck list
+        """
+        if not 0 <= index < len(self.on_deck()):
+            raise ValueError(f"There is no on-deck student at index {index}.")
+        self.index = index
+
+    def toggle_mark(self):
+        """
+        Mark the selected student to be called on together with the other
+        marked students, or unmark them if they are already marked.
+        """
+        self.marked.symmetric_difference_update([self.on_deck()[self.index]])
+
+    def remove(self, flag):
+        """
+        Call on the marked students in the order they are shown, or the
+        selected student if no one is marked.
+
+        flag: (boolean) are the cold calls flagged?
+        returns: (list) the students who were called on
+        """
+        if not self.marked:
+            return [self.call_on(flag)]
+        calls = [(index, flag) for index, student in enumerate(self.on_deck())
+                 if student in self.marked]
+        self.marked.clear()
+        return self.call_on_batch(calls)
+
+    def call_on(self, flag, index=None):
+        """
+        Call on an on-deck student, with or without a flag, then put them back
+        into the queue and log the cold call.
+
+        flag: (boolean) is the cold call flagged?
+        index: (int) the on-deck index of the student; the selected student
+        by default
+        returns: (Student) the student who was called on
+        """
+        if index is None:
+            index = self.index
+        on_deck = self.on_deck()
+        if not 0 <= index < len(on_deck):
+            raise ValueError(f"There is no on-deck student at index {index}.")
+        student = on_deck[index]
+        lap = self.latency.start()
+        student.call_on(flag)
+        lap = self.latency.lap("call_on", lap)
+        self.queue.take_off_deck(student, flag)
+        lap = self.latency.lap("take_off_deck", lap)
+        self.log_manager.write(self.queue.student_queue, student, flag)
+        self.latency.lap("log_write", lap)
+        return student
+
+    def call_on_batch(self, calls):
+        """
+        Call on several on-deck students at once, saving the queue and
+        writing the logs once for the whole batch.
+
+        calls: (list) an (index, flag) pair for each student, where index is
+        their index in the on-deck list, and flag is whether the cold call is
+        flagged
+        returns: (list) the students who were called on
+        """
+        on_deck = self.on_deck()
+        indices = [index for index, _ in calls]
+        for index in indices:
+            if not 0 <= index < len(on_deck):
+                raise ValueError(f"There is no on-deck student at index {index}.")
+        if len(set(indices)) != len(indices):
+            raise ValueError("A student can only be called on once in a batch.")
+        pairs = [(on_deck[index], flag) for index, flag in calls]
+        lap = self.latency.start()
+        for student, flag in pairs:
+            student.call_on(flag)
+        lap = self.latency.lap("call_on", lap)
+        self.queue.take_off_deck_batch(pairs)
+        lap = self.latency.lap("take_off_deck", lap)
+        self.log_manager.write_batch(self.queue.student_queue, pairs)
+        self.latency.lap("log_write", lap)
+        return [student for student, _ in pairs]
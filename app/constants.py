@@ -27,10 +27,23 @@ NUM_ON_DECK = 4
 #       This is handled in the randomized_enqueue() function in student_queue.py
 INSERT_DELAY = 0.35
 
+# Random Distribution Verification simulates this many program restarts, with
+# this many random cold calls after each restart.
+RDV_NUM_RESTARTS = 100
+RDV_CALLS_PER_RESTART = 100
+
 # We expect the roster to be a tab-separated file. To accept comma-separated
 # files, change this to ",".
 ROSTER_DELIMITER = "\t"
 
+# When a roster file has many badly formatted lines, only this many of them are
+# listed in the error message.
+ROSTER_ERRORS_SHOWN = 10
+
+# When importing a roster, the confirmation message lists at most this many
+# student names in each group (added, removed, changed).
+ROSTER_NAMES_SHOWN = 20
+
 #### Key bindings
 # Change the keys used to control the On-deck window by changing these keys
 # The key symbols are detailed in the Tkinter specifications,
@@ -51,10 +64,116 @@ REMOVE_WITH_FLAG_KEY = "Up"  # Up arrow
 # Remove the selected student from the on-deck display, without flagging them
 REMOVE_WITHOUT_FLAG_KEY = "Down"  # Down arrow
 
+# Mark or unmark the selected student, to call on several students at once.
+# While any students are marked, the remove keys call on all of the marked
+# students together, with or without a flag.
+MARK_KEY = "space"  # Space bar
+
+# Pressing this sequence of keys enters Random Distribution Verification Mode
+RDV_KEY_SEQUENCE = [MOVE_LEFT_KEY] * 10
+
+# Write the latency histograms to the logs directory right away
+# (only used when LATENCY_INSTRUMENTATION is True)
+DUMP_LATENCY_KEY = "F12"
+
 LOGS_LOCATION = (os.path.join(os.path.dirname(__file__), "../logs"))
 DAILY_LOG_HEADING = "Daily Log File for Cold Call Assist program."
 DAILY_LOG_FILE_NAME_PREFIX = "daily_log"
+# Lines are written to the daily log in batches: once DAILY_LOG_FLUSH_LINES
+# lines are waiting, once a line has waited DAILY_LOG_FLUSH_MS milliseconds,
+# or when the program exits. Set DAILY_LOG_FSYNC to True to also force each
+# batch onto the disk.
+DAILY_LOG_FLUSH_LINES = 10
+DAILY_LOG_FLUSH_MS = 1000
+DAILY_LOG_FSYNC = False
+
+# Per-student cold call statistics are kept in this binary file in the logs
+# directory, and summary.txt is rewritten from them once cold calls have
+# paused for SUMMARY_DEBOUNCE_MS milliseconds (and when the program closes).
+SUMMARY_STORE_FILE_NAME = "summary_store.dat"
+SUMMARY_DEBOUNCE_MS = 2000
+# Every cold call is also appended to this binary log in the logs directory,
+# which can be queried by student or by date. Its sorted indexes are brought
+# up to date every CALL_HISTORY_INDEX_INTERVAL cold calls, and on exit.
+CALL_HISTORY_FILE_NAME = "call_history.dat"
+CALL_HISTORY_INDEX_INTERVAL = 1000
 
 # Locations for internal data storage
 INTERNAL_ROSTER_LOCATION = (os.path.join(os.path.dirname(__file__), "student_data/roster.txt"))
-INTERNAL_QUEUE_LOCATION = (os.path.join(os.path.dirname(__file__), "student_data/student_queue"))
\ No newline at end of file
+INTERNAL_QUEUE_LOCATION = (os.path.join(os.path.dirname(__file__), "student_data/student_queue"))
+
+# How the queue is saved after every cold call.
+# "pickle":  the whole queue is pickled to INTERNAL_QUEUE_LOCATION every time.
+# "journal": each cold call appends one small record to a journal file next to
+#            the queue file. The full queue is only re-pickled every
+#            QUEUE_JOURNAL_COMPACT_INTERVAL cold calls, and on start-up.
+# "sqlite":  the roster, queue and every cold call are stored in an SQLite
+#            database (DATABASE_FILE_NAME, next to the queue file), with one
+#            small transaction per cold call. An existing roster file or
+#            queue file is moved into the database the first time it is loaded.
+QUEUE_PERSISTENCE_MODE = "journal"
+QUEUE_JOURNAL_SUFFIX = ".journal"
+QUEUE_JOURNAL_COMPACT_INTERVAL = 200
+# How on-deck students are chosen. "uniform": a student who is called on goes
+# back to a random position in the back of the queue, and on-deck students are
+# the front of the queue. "weighted": each free on-deck place is filled by a
+# random draw, weighted towards students who have been called on less often,
+# and (by QUEUE_FLAG_WEIGHT per flag) towards flagged students.
+QUEUE_POLICY = "uniform"
+QUEUE_FLAG_WEIGHT = 1.0
+# Weights are kept as integers, in units of 1/QUEUE_WEIGHT_SCALE.
+QUEUE_WEIGHT_SCALE = 1000
+
+# The database file used in "sqlite" mode, and its synchronous setting: "NORMAL"
+# is safe against program crashes, "FULL" against power loss as well.
+DATABASE_FILE_NAME = "coolcall.sqlite3"
+DATABASE_SYNCHRONOUS = "NORMAL"
+
+# Set to True to force every journal record onto the disk (slower, but safe
+# against power loss as well as program crashes).
+QUEUE_JOURNAL_FSYNC = False
+
+# Set to False to save the queue, summary file and call history log straight
+# away in the window's thread, instead of on a background thread. In the
+# background, a burst of cold calls is saved with a single write.
+BACKGROUND_PERSISTENCE = True
+
+# When one process serves several courses, each course's data and logs are kept
+# in its own subdirectory of these directories. At most COURSE_CACHE_SIZE
+# courses are kept loaded in memory at once.
+COURSES_DATA_LOCATION = (os.path.join(os.path.dirname(__file__), "student_data/courses"))
+COURSES_LOGS_LOCATION = (os.path.join(os.path.dirname(__file__), "../logs/courses"))
+COURSE_CACHE_SIZE = 8
+
+# The headless service (cool_call_service.py) listens on this address. It only
+# accepts connections from this machine unless the host is changed. Request
+# bodies larger than SERVICE_MAX_BODY bytes are refused.
+SERVICE_HOST = "127.0.0.1"
+SERVICE_PORT = 8422
+SERVICE_MAX_BODY = 64 * 1024
+
+# The benchmark suite (benchmark.py) generates rosters of each of these sizes,
+# and times BENCHMARK_CALLS cold calls on each. Results are written as JSON to
+# BENCHMARK_RESULTS_FILE, so that runs from different commits can be compared.
+BENCHMARK_SIZES = (30, 1000, 100000, 1000000)
+BENCHMARK_CALLS = 1000
+BENCHMARK_RESULTS_FILE = "benchmark_results.json"
+
+# Set LATENCY_INSTRUMENTATION to True to time each stage of handling a
+# keypress (calling on the student, updating the queue, logging, redrawing),
+# for diagnosing a slow lecture. The latency histograms are written to
+# LATENCY_LOG_FILE_NAME in the logs directory when the program closes, and when
+# DUMP_LATENCY_KEY is pressed. When False, nothing is timed.
+LATENCY_INSTRUMENTATION = False
+LATENCY_LOG_FILE_NAME = "latency.txt"
+
+# Set SESSION_TRACE to True to record every shift and remove keypress of a
+# session, with its timing and the random seed, to a trace file in the logs
+# directory named SESSION_TRACE_FILE_NAME_PREFIX--<date and time>.dat. Traces
+# can be replayed without the GUI by session_trace.py, for load testing.
+SESSION_TRACE = False
+SESSION_TRACE_FILE_NAME_PREFIX = "session_trace"
+
+# The time budget, in milliseconds, from starting cool_call.py to the first
+# paint of the on-deck window. The actual start-up time is printed at start-up.
+STARTUP_BUDGET_MS = 500
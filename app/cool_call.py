@@ -14,11 +14,15 @@ Last Edited:    1/30/2022
 Last Edit By:   Arden Butterfield
 """
 ###############################################################################
+import time
+start_time = time.perf_counter()
 from instructor_interaction_model import InstructorInteractionModel
 ###############################################################################
 
 def main():
-    InstructorInteractionModel()
+    # The start-up time is measured from here (including the imports above,
+    # when run as a script) to the first paint of the on-deck window.
+    InstructorInteractionModel(start_time)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+
+################################################################################
+"""
+Script Name:    CoolCall Database
+
+Description:    An optional SQLite storage backend for the CoolCall Program,
+                used when QUEUE_PERSISTENCE_MODE is "sqlite".
+
+                The roster, the queue order, and every cold call are kept in
+                one database file per data directory, so they can never
+                disagree after a crash. The database runs in WAL mode: each
+                cold call is one small transaction, and loading the queue at
+                start-up is a single query on an index.
+
+                Tables:
+                    students     one row per student on the roster, in the
+                                 order of the roster file
+                    queue        the students in the queue, ordered by a
+                                 sort key. Saving the whole queue numbers the
+                                 keys 0.0, 1.0, 2.0, ...; a moved student gets
+                                 a key between its neighbours', so a move only
+                                 changes that student's row. Each move into
+                                 the same gap halves it, and once a float can
+                                 no longer split it (after about 40 moves to
+                                 one spot) the whole queue is saved again with
+                                 fresh keys.
+                    call_events  one row per cold call
+                    meta         the heading line of the roster file
+
+Authors:        CoolCall Team
+
+Last Edited:    10/18/2026
+Last Edit By:   CoolCall Team
+"""
+################################################################################
+from datetime import date
+from student import Student
+from constants import *
+import sqlite3
+import time
+################################################################################
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+	key TEXT PRIMARY KEY,
+	value TEXT
+);
+CREATE TABLE IF NOT EXISTS students (
+	id INTEGER PRIMARY KEY,
+	uo_id TEXT NOT NULL UNIQUE,
+	first_name TEXT NOT NULL,
+	last_name TEXT NOT NULL,
+	email_address TEXT NOT NULL,
+	phonetic_spelling TEXT NOT NULL,
+	reveal_code TEXT NOT NULL,
+	total_num_flags INTEGER NOT NULL DEFAULT 0,
+	roster_index INTEGER
+);
+CREATE TABLE IF NOT EXISTS queue (
+	student_id INTEGER PRIMARY KEY REFERENCES students(id) ON DELETE CASCADE,
+	sort_key REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS queue_order ON queue(sort_key);
+CREATE TABLE IF NOT EXISTS call_events (
+	id INTEGER PRIMARY KEY,
+	student_id INTEGER NOT NULL REFERENCES students(id) ON DELETE CASCADE,
+	day INTEGER NOT NULL,
+	flagged INTEGER NOT NULL,
+	timestamp REAL
+);
+CREATE INDEX IF NOT EXISTS call_events_by_student ON call_events(student_id, id);
+CREATE TEMP TABLE IF NOT EXISTS upserted (
+	position INTEGER PRIMARY KEY,
+	uo_id TEXT NOT NULL
+);
+"""
+
+# The queue in order, with each student's call history, as "day,flagged"
+# pairs separated by spaces, oldest first.
+LOAD_QUEUE = """
+SELECT s.id, s.first_name, s.last_name, s.uo_id, s.email_address,
+	s.phonetic_spelling, s.reveal_code, s.total_num_flags, q.sort_key,
+	(SELECT group_concat(e.day || ',' || e.flagged, ' ')
+	 FROM (SELECT day, flagged FROM call_events
+	       WHERE student_id = s.id ORDER BY id) AS e)
+FROM queue AS q JOIN students AS s ON s.id = q.student_id
+ORDER BY q.sort_key
+"""
+
+# Roster students carry no call history, so the stored number of flags is
+# only updated from queued students.
+UPSERT_STUDENT = """
+INSERT INTO students (uo_id, first_name, last_name, email_address,
+	phonetic_spelling, reveal_code)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT (uo_id) DO UPDATE SET
+	first_name = excluded.first_name, last_name = excluded.last_name,
+	email_address = excluded.email_address,
+	phonetic_spelling = excluded.phonetic_spelling,
+	reveal_code = excluded.reveal_code
+"""
+
+
+def database_location(data_file):
+	"""
+	The database belongs to the directory of the internal data files, so the
+	roster and queue of one course share a database.
+
+	data_file: (string) the path of the internal roster or queue file
+	returns: (string) the path of the database file
+	"""
+	return os.path.join(os.path.dirname(os.path.abspath(data_file)), DATABASE_FILE_NAME)
+
+
+# The open databases by file name, so the roster and queue of a course share
+# one connection and one cache of row ids.
+_open_databases = {}
+
+
+def open_database(filename):
+	"""
+	Open a database file, or share the CoolCallDatabase that is already open
+	for it. Each call must be matched by a call to close().
+
+	filename: (string) the path of the database file
+	returns: (CoolCallDatabase) the database
+	"""
+	filename = os.path.abspath(filename)
+	database = _open_databases.get(filename)
+	if database is None:
+		database = _open_databases[filename] = CoolCallDatabase(filename)
+	database._users += 1
+	return database
+
+
+class CoolCallDatabase:
+	"""
+	A class to store the roster, queue, and cold calls in SQLite.
+
+	Attributes
+	============================================================================
+	filename
+		The path of the database file.
+
+	Methods
+	============================================================================
+	save_roster(heading, students)
+		Replace the roster with a new one.
+	load_roster()
+		Returns the heading and students of the stored roster.
+	save_queue(students)
+		Replace the queue order, and bring the call history up to date.
+	load_queue()
+		Returns the students in the queue, in order, with their call history.
+	record_moves(order, moves)
+		Save students' new positions and cold calls in one transaction.
+	close()
+		Close the database, once its last user has closed it.
+	"""
+
+	def __init__(self, filename):
+		self.filename = filename
+		self._connection = sqlite3.connect(filename, isolation_level=None)
+		self._connection.execute("PRAGMA journal_mode = WAL")
+		self._connection.execute(f"PRAGMA synchronous = {DATABASE_SYNCHRONOUS}")
+		self._connection.execute("PRAGMA foreign_keys = ON")
+		self._connection.executescript(SCHEMA)
+		# The id of each Student's row, and the queue sort key of each id. The
+		# UO ID is never used as a dictionary key.
+		self._ids = {}
+		self._sort_keys = {}
+		# The number of open_database() calls sharing this database.
+		self._users = 0
+
+	def _transaction(self):
+		"""
+		returns: a context manager that commits on success and rolls back
+		on an error.
+		"""
+		return _Transaction(self._connection)
+
+	def _upsert_students(self, students):
+		"""
+		Insert or update the rows of the given students, and record the id of
+		each student's row. The ids are read back in the order of the students,
+		by joining with a temporary table of their positions.
+		"""
+		self._connection.executemany(UPSERT_STUDENT, [
+			(student.UO_ID, student.first_name, student.last_name, student.email_address,
+			 student.phonetic_spelling, student.reveal_code) for student in students])
+		self._connection.execute("DELETE FROM upserted")
+		self._connection.executemany(
+			"INSERT INTO upserted (position, uo_id) VALUES (?, ?)",
+			[(i, student.UO_ID) for i, student in enumerate(students)])
+		ids = [row[0] for row in self._connection.execute(
+			"SELECT s.id FROM upserted AS u JOIN students AS s ON s.uo_id = u.uo_id ORDER BY u.position")]
+		self._ids.update(zip(students, ids))
+		return ids
+
+	def save_roster(self, heading, students):
+		"""
+		Replace the roster. Students who are no longer on the roster are
+		deleted, along with their place in the queue and their cold calls.
+
+		heading: (string) the first line of the roster file
+		students: (list) the Student objects, in the order of the roster file.
+		No two students may share a UO ID.
+		"""
+		with self._transaction():
+			self._connection.execute("UPDATE students SET roster_index = NULL")
+			self._ids = {}
+			ids = self._upsert_students(students)
+			if len(set(ids)) != len(ids):
+				raise ValueError("Two students on the roster share a UO ID.")
+			self._connection.executemany(
+				"UPDATE students SET roster_index = ? WHERE id = ?", enumerate(ids))
+			self._connection.execute("DELETE FROM students WHERE roster_index IS NULL")
+			self._connection.execute(
+				"INSERT OR REPLACE INTO meta (key, value) VALUES ('roster_heading', ?)", (heading,))
+			self._sort_keys = {student_id: self._sort_keys[student_id]
+							   for student_id in ids if student_id in self._sort_keys}
+
+	def load_roster(self):
+		"""
+		returns: (tuple) the heading line and the list of Students of the
+		stored roster, or (None, []) if no roster has been stored.
+		"""
+		row = self._connection.execute(
+			"SELECT value FROM meta WHERE key = 'roster_heading'").fetchone()
+		if row is None:
+			return None, []
+		students = [Student(*fields) for fields in self._connection.execute(
+			"SELECT first_name, last_name, uo_id, email_address, phonetic_spelling, "
+			"reveal_code FROM students WHERE roster_index IS NOT NULL ORDER BY roster_index")]
+		return row[0], students
+
+	def save_queue(self, students):
+		"""
+		Replace the queue order with a new one, in a single transaction. Call
+		histories that don't match the stored cold calls (such as a queue
+		loaded from an older pickle file) are rewritten.
+
+		students: (list) the Students in the queue, in order. No two students
+		may share a UO ID.
+		"""
+		with self._transaction():
+			ids = self._upsert_students(students)
+			if len(set(ids)) != len(ids):
+				raise ValueError("Two students in the queue share a UO ID.")
+			self._connection.execute("DELETE FROM queue")
+			self._sort_keys = {student_id: float(i) for i, student_id in enumerate(ids)}
+			self._connection.executemany(
+				"INSERT INTO queue (student_id, sort_key) VALUES (?, ?)", self._sort_keys.items())
+			self._connection.executemany(
+				"UPDATE students SET total_num_flags = ? WHERE id = ?",
+				[(student.total_num_flags, student_id) for student, student_id in zip(students, ids)])
+			stored = dict(self._connection.execute(
+				"SELECT student_id, count(*) FROM call_events GROUP BY student_id"))
+			for student, student_id in zip(students, ids):
+				if stored.get(student_id, 0) != student.times_called():
+					self._connection.execute(
+						"DELETE FROM call_events WHERE student_id = ?", (student_id,))
+					self._connection.executemany(
+						"INSERT INTO call_events (student_id, day, flagged) VALUES (?, ?, ?)",
+						[(student_id, day.toordinal(), int(flagged))
+						 for day, flagged in student.call_history()])
+
+	def load_queue(self):
+		"""
+		Load the queue with one query, ordered by the queue's index.
+
+		returns: (list) the Students in the queue, in order, with their call
+		history. The list is empty if no queue has been stored.
+		"""
+		students = []
+		self._sort_keys = {}
+		for row in self._connection.execute(LOAD_QUEUE):
+			student_id, first, last, uo_id, email, phonetic, reveal_code, flags, key, history = row
+			student = Student(first, last, uo_id, email, phonetic, reveal_code)
+			for call in (history.split() if history else ()):
+				day, flagged = call.split(",")
+				student.call_on(flagged == "1", date.fromordinal(int(day)))
+			# call_on() counts the flags again, so the stored total is restored.
+			student.total_num_flags = flags
+			self._ids[student] = student_id
+			self._sort_keys[student_id] = key
+			students.append(student)
+		return students
+
+	def record_moves(self, order, moves):
+		"""
+		Save the new positions of students who have moved in the queue, and
+		any cold calls, as one transaction.
+
+		order: (OrderStatisticTree) the queue, after the moves
+		moves: (list) a (student, old_position, new_position, flag) tuple for
+		each move; flag is None if the student was moved without a cold call.
+		returns: (boolean) False if the sort keys ran out of room, and the
+		queue needs to be saved with save_queue() instead.
+		"""
+		moved = {self._ids[student] for student, _, _, _ in moves}
+		new_keys = {}
+		for position in sorted(order.index(student) for student, _, _, _ in moves):
+			key = self._key_between(order, position, moved, new_keys)
+			if key is None:
+				return False
+			new_keys[self._ids[order[position]]] = key
+		now = time.time()
+		with self._transaction():
+			self._connection.executemany(
+				"UPDATE queue SET sort_key = ? WHERE student_id = ?",
+				[(key, student_id) for student_id, key in new_keys.items()])
+			for student, _, _, flag in moves:
+				if flag is None:
+					continue
+				student_id = self._ids[student]
+				self._connection.execute(
+					"INSERT INTO call_events (student_id, day, flagged, timestamp) VALUES (?, ?, ?, ?)",
+					(student_id, student.last_called().toordinal(), int(flag), now))
+				self._connection.execute(
+					"UPDATE students SET total_num_flags = ? WHERE id = ?",
+					(student.total_num_flags, student_id))
+		self._sort_keys.update(new_keys)
+		return True
+
+	def _key_between(self, order, position, moved, new_keys):
+		"""
+		Choose a sort key for the moved student at <position>, between the
+		keys of its neighbours. Moved students are given keys from the front
+		of the queue to the back, so the student before has an up-to-date
+		key; students after that have also moved are given room in between.
+
+		returns: (float) the new key, or None if there is no room left.
+		"""
+		if position > 0:
+			before = self._ids[order[position - 1]]
+			low = new_keys.get(before, self._sort_keys[before])
+		else:
+			low = None
+		waiting = 1
+		following = position + 1
+		while following < len(order) and self._ids[order[following]] in moved:
+			waiting += 1
+			following += 1
+		if following < len(order):
+			high = self._sort_keys[self._ids[order[following]]]
+		else:
+			high = None
+		if low is None and high is None:
+			return 0.0
+		if low is None:
+			key = high - 1.0
+		elif high is None:
+			key = low + 1.0
+		else:
+			key = low + (high - low) / (waiting + 1)
+			if not low < key < high:
+				return None
+		return key
+
+	def close(self):
+		"""
+		Close the database. A database shared through open_database() stays
+		open until all of its users have closed it.
+		"""
+		if self._users > 1:
+			self._users -= 1
+			return
+		self._users = 0
+		if _open_databases.get(self.filename) is self:
+			del _open_databases[self.filename]
+		self._connection.close()
+
+
+class _Transaction:
+	"""
+	Runs the statements of a with block as one transaction.
+	"""
+
+	def __init__(self, connection):
+		self.connection = connection
+
+	def __enter__(self):
+		self.connection.execute("BEGIN")
+
+	def __exit__(self, exception_type, exception, traceback):
+		if exception_type is None:
+			self.connection.execute("COMMIT")
+		else:
+			self.connection.execute("ROLLBACK")
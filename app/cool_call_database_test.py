@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+
+###############################################################################
+"""
+Script Name:    CoolCallDatabase Testing Script
+
+Description:    This script can be run at the command line to test saving the
+                roster and queue in "sqlite" persistence mode. The database is
+                created in a temporary directory, so internal data is never
+                touched.
+
+Author:         CoolCall Team
+
+Last Edited:    10/18/2026
+Last Edit By:   CoolCall Team
+"""
+###############################################################################
+import os
+import student_queue
+import student_roster
+import cool_call_database
+from cool_call_database import CoolCallDatabase, database_location
+from student import Student
+from student_queue import StudentQueue
+from student_roster import StudentRoster
+from test_support import make_roster, call_students, history, write_roster, temporary_directory
+###############################################################################
+
+def sqlite_mode(test):
+	def run():
+		saved = student_queue.QUEUE_PERSISTENCE_MODE, student_roster.QUEUE_PERSISTENCE_MODE
+		student_queue.QUEUE_PERSISTENCE_MODE = student_roster.QUEUE_PERSISTENCE_MODE = "sqlite"
+		try:
+			test()
+		finally:
+			student_queue.QUEUE_PERSISTENCE_MODE, student_roster.QUEUE_PERSISTENCE_MODE = saved
+	run.__name__ = test.__name__
+	return run
+
+@sqlite_mode
+def test_cold_calls_are_saved():
+	filename = os.path.join(temporary_directory(), "student_queue")
+	queue = StudentQueue(filename)
+	queue.queue_from_roster(make_roster(30))
+	call_students(queue, 300)
+	queue.close()
+
+	database = CoolCallDatabase(database_location(filename))
+	stored = database.load_queue()
+	assert [s.UO_ID for s in stored] == [s.UO_ID for s in queue.student_queue]
+	assert {s.get_name(): (s.total_num_flags, list(s.dates_called)) for s in stored} == history(queue)
+	database.close()
+
+	loaded = StudentQueue(filename)
+	assert loaded.load_queue_from_file(filename)
+	assert history(loaded) == history(queue)
+	loaded.close()
+
+@sqlite_mode
+def test_roster_round_trip():
+	directory = temporary_directory()
+	roster_file = write_roster(directory, 20)
+	internal = os.path.join(directory, "data", "roster.txt")
+	os.makedirs(os.path.dirname(internal))
+	roster = StudentRoster(internal)
+	assert roster.import_roster_from_file(roster_file) == ""
+	roster.save_internally()
+	assert not os.path.exists(internal)
+
+	loaded = StudentRoster(internal)
+	assert loaded.import_roster_from_file(internal) == ""
+	assert loaded.students == roster.students
+	exported = loaded.export_roster_to_file(directory)
+	with open(exported) as f, open(roster_file) as original:
+		assert f.read() == original.read()
+
+@sqlite_mode
+def test_removed_students_are_deleted():
+	directory = temporary_directory()
+	roster = StudentRoster(os.path.join(directory, "roster.txt"))
+	roster.import_roster_from_file(write_roster(directory, 20))
+	roster.save_internally()
+	queue = StudentQueue(os.path.join(directory, "student_queue"))
+	queue.queue_from_roster(roster)
+	call_students(queue, 40)
+
+	smaller = StudentRoster(os.path.join(directory, "roster.txt"))
+	smaller.import_roster_from_file(write_roster(directory, 15))
+	changes = roster.diff(smaller)
+	smaller.save_internally()
+	queue.merge_roster(changes)
+	call_students(queue, 10)
+	queue.close()
+
+	database = CoolCallDatabase(database_location(queue.queue_location))
+	assert sorted(s.UO_ID for s in database.load_queue()) == sorted(s.UO_ID for s in smaller.students)
+	assert database.load_roster()[1] == sorted(smaller.students, key=lambda s: s.UO_ID)
+	database.close()
+
+@sqlite_mode
+def test_students_sharing_an_id_are_rejected():
+	filename = os.path.join(temporary_directory(), "student_queue")
+	students = sorted(make_roster(3).students, key=lambda s: s.UO_ID)
+	twin = Student("Twin", "Twinson", students[0].UO_ID, "ttwinson@uoregon.edu", "twin", "0")
+	database = CoolCallDatabase(database_location(filename))
+	database.save_queue(students)
+	try:
+		database.save_queue(students + [twin])
+		assert False, "a student sharing a UO ID was saved"
+	except ValueError:
+		pass
+	# The queue that was stored before is kept.
+	assert database.load_queue() == students
+	database.close()
+
+@sqlite_mode
+def test_roster_and_queue_share_the_database():
+	directory = temporary_directory()
+	roster = StudentRoster(os.path.join(directory, "roster.txt"))
+	roster.import_roster_from_file(write_roster(directory, 10))
+	roster.save_internally()
+	queue = StudentQueue(os.path.join(directory, "student_queue"))
+	queue.queue_from_roster(roster)
+	queue.save_queue_to_file(queue.queue_location)
+	assert queue.database is roster._get_database()
+	# The database stays open until both of them have closed it.
+	queue.close()
+	roster.save_internally()
+	roster.close()
+	assert database_location(queue.queue_location) not in cool_call_database._open_databases
+
+if __name__ == "__main__":
+	test_cold_calls_are_saved()
+	test_roster_round_trip()
+	test_removed_students_are_deleted()
+	test_students_sharing_an_id_are_rejected()
+	test_roster_and_queue_share_the_database()
@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+
+###############################################################################
+"""
+Script Name:    CoolCall Service
+
+Description:    A headless service for driving CoolCall without Tkinter, so
+                that clickers, TA laptops, and scripts can cold call students
+                over the network. It speaks a small JSON-over-HTTP protocol on
+                a TCP port (or a Unix socket), using only asyncio:
+
+                    GET  /courses                      list the stored courses
+                    GET  /courses/<id>/on-deck         on-deck students
+                    POST /courses/<id>/select          {"index": i} or {"shift": n}
+                    POST /courses/<id>/call            {"flag": bool, "index": i}
+                    POST /courses/<id>/import          {"filename": path}
+                    POST /courses/<id>/export          {"directory": path}
+
+                Only an import creates a new course; other requests for a
+                course that doesn't exist get a 404 response. Errors reading
+                or writing files are reported as a 400 response when they come
+                from a path given by the client, and as a 500 response
+                otherwise.
+
+                Every request for a course is handled one at a time, in the
+                order it arrives, while requests for different courses run
+                side by side. Disk work is done off the event loop, so slow
+                imports don't hold up other clients.
+
+                Usage: python3 cool_call_service.py [--host H] [--port P]
+                                                    [--unix PATH]
+
+Authors:        CoolCall Team
+
+Last Edited:    10/18/2026
+Last Edit By:   CoolCall Team
+"""
+###############################################################################
+from course_registry import CourseRegistry
+from cold_call_session import ColdCallSession
+from constants import *
+from http import HTTPStatus
+import argparse
+import asyncio
+import json
+import re
+###############################################################################
+
+ROUTE_PATTERN = re.compile(r"^/courses/([^/]+)/([a-z-]+)$")
+
+
+class ServiceError(Exception):
+    """
+    An error to report to the client, with the HTTP status to report it with.
+    """
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def student_to_json(student):
+    return {
+        "first_name": student.first_name,
+        "last_name": student.last_name,
+        "email_address": student.email_address,
+        "phonetic_spelling": student.phonetic_spelling,
+        "times_called": student.times_called(),
+        "total_num_flags": student.total_num_flags,
+    }
+
+
+class CoolCallService:
+    """
+    A class that serves the courses of a CourseRegistry to many clients.
+
+    Attributes
+    =======================================================================
+    registry
+        The CourseRegistry that holds each course's roster, queue and logs
+
+    Methods
+    =======================================================================
+    handle_request(method, path, body)
+        Handle one request, returning its status and JSON response.
+
+    serve(host, port, unix_path)
+        Listen for connections until cancelled.
+
+    close()
+        Write the summaries, and save and unload every course.
+    """
+
+    def __init__(self, registry=None):
+        self.registry = registry or CourseRegistry()
+        # One lock per course: each course's requests are handled in order.
+        self._locks = {}
+        # Guards the registry, which is loaded and unloaded off the event loop.
+        self._registry_lock = asyncio.Lock()
+        self._sessions = {}
+        self._summary_jobs = {}
+
+    async def _with_course(self, course_id, action, load=True, create=False):
+        """
+        Run action(course) in a worker thread, holding the course's lock, and
+        with the course pinned so it can't be unloaded in the meantime.
+
+        load: if False, and the course isn't loaded, action is not run.
+        create: if True, a course that doesn't exist yet is created.
+        returns: whatever action returns (None if it wasn't run)
+        """
+        loop = asyncio.get_running_loop()
+        lock = self._locks.setdefault(course_id, asyncio.Lock())
+        async with lock:
+            async with self._registry_lock:
+                if not load and not self.registry.is_loaded(course_id):
+                    return None
+                try:
+                    course = await loop.run_in_executor(
+                        None, self.registry.get, course_id, create)
+                except ValueError as error:
+                    raise ServiceError(HTTPStatus.NOT_FOUND, str(error))
+                self.registry.pin(course_id)
+            try:
+                return await loop.run_in_executor(None, action, course)
+            finally:
+                async with self._registry_lock:
+                    self.registry.unpin(course_id)
+
+    def _session(self, course):
+        """
+        returns: (ColdCallSession) the selection state of a loaded course.
+        A course that has been unloaded and loaded again gets a new session.
+        """
+        session = self._sessions.get(course.course_id)
+        if session is None or session.queue is not course.queue:
+            session = ColdCallSession(course.queue, course.log_manager)
+            self._sessions[course.course_id] = session
+        return session
+
+    def _on_deck(self, course):
+        session = self._session(course)
+        return {
+            "course": course.course_id,
+            "selected": session.index,
+            "on_deck": [student_to_json(s) for s in session.on_deck()],
+        }
+
+    def _select(self, course, request):
+        session = self._session(course)
+        if "index" in request:
+            session.select(_integer(request, "index"))
+        else:
+            session.shift(_integer(request, "shift"))
+        return self._on_deck(course)
+
+    def _call(self, course, request):
+        session = self._session(course)
+        index = _integer(request, "index") if "index" in request else None
+        student = session.call_on(bool(request.get("flag", False)), index)
+        response = self._on_deck(course)
+        response["called"] = student_to_json(student)
+        return response
+
+    def _import(self, course, request):
+        error = course.import_roster(_string(request, "filename"))
+        if error:
+            raise ValueError(f"Cannot import roster file. {error}")
+        self._session(course).shift(0)
+        return self._on_deck(course)
+
+    def _export(self, course, request):
+        if course.roster.source_filename is None:
+            raise ValueError("The course has no roster to export.")
+        return {"path": course.roster.export_roster_to_file(_string(request, "directory"))}
+
+    def _schedule_summary_write(self, course_id):
+        """
+        Rewrite a course's summary file SUMMARY_DEBOUNCE_MS milliseconds after
+        its most recent cold call, like the Instructor Interaction Model does.
+        """
+        loop = asyncio.get_running_loop()
+        job = self._summary_jobs.pop(course_id, None)
+        if job is not None:
+            job.cancel()
+        self._summary_jobs[course_id] = loop.call_later(
+            SUMMARY_DEBOUNCE_MS / 1000,
+            lambda: loop.create_task(self._write_summary(course_id)))
+
+    async def _write_summary(self, course_id):
+        self._summary_jobs.pop(course_id, None)
+        # An unloaded course already wrote its summary when it was unloaded.
+        await self._with_course(
+            course_id, lambda course: course.log_manager.write_summary(), load=False)
+
+    async def handle_request(self, method, path, body=b""):
+        """
+        Handle one request.
+
+        method: (string) the HTTP method, "GET" or "POST"
+        path: (string) the request path, such as "/courses/CIS422/on-deck"
+        body: (bytes) the JSON request body, if any
+        returns: (tuple) the HTTP status, and the JSON-serializable response
+        """
+        try:
+            request = json.loads(body) if body else {}
+            if not isinstance(request, dict):
+                raise ValueError("The request body must be a JSON object.")
+            if path == "/courses":
+                _check_method(method, "GET")
+                return HTTPStatus.OK, {"courses": self.registry.course_ids()}
+            match = ROUTE_PATTERN.match(path)
+            if match is None:
+                raise ServiceError(HTTPStatus.NOT_FOUND, f"No such path: {path}")
+            course_id, action = match.groups()
+            if action == "on-deck":
+                _check_method(method, "GET")
+                return HTTPStatus.OK, await self._with_course(course_id, self._on_deck)
+            handlers = {"select": self._select, "call": self._call,
+                        "import": self._import, "export": self._export}
+            if action not in handlers:
+                raise ServiceError(HTTPStatus.NOT_FOUND, f"No such path: {path}")
+            _check_method(method, "POST")
+            handler = handlers[action]
+            response = await self._with_course(
+                course_id, lambda course: handler(course, request), create=action == "import")
+            if action == "call":
+                self._schedule_summary_write(course_id)
+            return HTTPStatus.OK, response
+        except ServiceError as error:
+            return error.status, {"error": str(error)}
+        except ValueError as error:
+            # Includes malformed JSON, and invalid selections.
+            return HTTPStatus.BAD_REQUEST, {"error": str(error)}
+        except (FileNotFoundError, NotADirectoryError, IsADirectoryError, PermissionError) as error:
+            # Such as an export to a directory that doesn't exist.
+            return HTTPStatus.BAD_REQUEST, {"error": str(error)}
+        except OSError as error:
+            # Such as a full disk while saving the queue or logs.
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {"error": str(error)}
+
+    async def _handle_connection(self, reader, writer):
+        """
+        Serve the requests sent over one connection. Connections are kept
+        open between requests unless the client asks to close them.
+        """
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    await _send(writer, HTTPStatus.BAD_REQUEST,
+                                {"error": "Malformed request line."}, close=True)
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                try:
+                    length = int(headers.get("content-length", 0) or 0)
+                    if length < 0:
+                        raise ValueError
+                except ValueError:
+                    await _send(writer, HTTPStatus.BAD_REQUEST,
+                                {"error": "Malformed Content-Length header."}, close=True)
+                    break
+                if length > SERVICE_MAX_BODY:
+                    await _send(writer, HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                                {"error": "Request body is too large."}, close=True)
+                    break
+                body = await reader.readexactly(length) if length else b""
+                status, response = await self.handle_request(
+                    method.upper(), target.split("?", 1)[0], body)
+                close = (headers.get("connection", "").lower() == "close"
+                         or version == "HTTP/1.0")
+                await _send(writer, status, response, close)
+                if close:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host=SERVICE_HOST, port=SERVICE_PORT, unix_path=None):
+        """
+        Listen for connections until cancelled, then close every course.
+
+        host, port: the TCP address to listen on
+        unix_path: (string) listen on this Unix socket instead, if given
+        """
+        if unix_path:
+            server = await asyncio.start_unix_server(self._handle_connection, unix_path)
+        else:
+            server = await asyncio.start_server(self._handle_connection, host, port)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await self.close()
+
+    async def close(self):
+        """
+        Write any pending summaries, and save and unload every course.
+        """
+        for job in self._summary_jobs.values():
+            job.cancel()
+        self._summary_jobs.clear()
+        for lock in list(self._locks.values()):
+            await lock.acquire()
+        try:
+            async with self._registry_lock:
+                await asyncio.get_running_loop().run_in_executor(None, self.registry.close)
+        finally:
+            for lock in self._locks.values():
+                lock.release()
+
+
+def _check_method(method, expected):
+    if method != expected:
+        raise ServiceError(HTTPStatus.METHOD_NOT_ALLOWED, f"Use {expected} for this path.")
+
+def _integer(request, name):
+    value = request.get(name)
+    if not isinstance(value, int) or isinstance(value, bool):
+        raise ValueError(f"'{name}' must be an integer.")
+    return value
+
+def _string(request, name):
+    value = request.get(name)
+    if not isinstance(value, str) or not value:
+        raise ValueError(f"'{name}' must be a string.")
+    return value
+
+async def _send(writer, status, response, close):
+    body = json.dumps(response).encode()
+    head = (f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'close' if close else 'keep-alive'}\r\n\r\n")
+    writer.write(head.encode("latin-1") + body)
+    await writer.drain()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve CoolCall courses over HTTP.")
+    parser.add_argument("--host", default=SERVICE_HOST)
+    parser.add_argument("--port", type=int, default=SERVICE_PORT)
+    parser.add_argument("--unix", help="listen on a Unix socket instead of TCP")
+    args = parser.parse_args()
+    try:
+        asyncio.run(CoolCallService().serve(args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
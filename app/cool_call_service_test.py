@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+
+###############################################################################
+"""
+Script Name:    CoolCall Service Testing Script
+
+Description:    This script can be run at the command line to test the
+                headless CoolCall service, without a display. All course data
+                is kept in a temporary directory.
+
+Author:         CoolCall Team
+
+Last Edited:    10/18/2026
+Last Edit By:   CoolCall Team
+"""
+###############################################################################
+import asyncio
+import json
+import os
+from course_registry import CourseRegistry
+from cool_call_service import CoolCallService
+from test_support import write_roster, temporary_directory
+###############################################################################
+
+def make_service():
+    directory = temporary_directory()
+    registry = CourseRegistry(os.path.join(directory, "data"), os.path.join(directory, "logs"))
+    return directory, CoolCallService(registry)
+
+async def post(service, path, request):
+    return await service.handle_request("POST", path, json.dumps(request).encode())
+
+def test_call_on_students():
+    async def run():
+        directory, service = make_service()
+        status, response = await post(service, "/courses/CIS422/import",
+                                      {"filename": write_roster(directory, 30)})
+        assert status == 200 and len(response["on_deck"]) == 4
+
+        status, response = await post(service, "/courses/CIS422/select", {"index": 2})
+        assert response["selected"] == 2
+        selected = response["on_deck"][2]
+        status, response = await post(service, "/courses/CIS422/call", {"flag": True})
+        assert status == 200
+        assert response["called"]["email_address"] == selected["email_address"]
+        assert response["called"]["total_num_flags"] == 1
+        assert selected not in response["on_deck"]
+
+        status, response = await post(service, "/courses/CIS422/select", {"index": 9})
+        assert status == 400
+        status, response = await service.handle_request("GET", "/courses/../on-deck")
+        assert status == 404
+        status, response = await service.handle_request("GET", "/courses")
+        assert response["courses"] == ["CIS422"]
+        await service.close()
+    asyncio.run(run())
+
+def test_errors_are_reported():
+    async def run():
+        directory, service = make_service()
+        # Reading a course that doesn't exist doesn't create it.
+        status, response = await service.handle_request("GET", "/courses/CIS999/on-deck")
+        assert status == 404
+        status, response = await post(service, "/courses/CIS999/call", {"flag": False})
+        assert status == 404
+        assert not os.path.exists(os.path.join(directory, "data", "CIS999"))
+        assert not os.path.exists(os.path.join(directory, "logs", "CIS999"))
+
+        status, response = await post(service, "/courses/CIS422/import",
+                                      {"filename": write_roster(directory, 10)})
+        assert status == 200
+        status, response = await post(service, "/courses/CIS422/export",
+                                      {"directory": os.path.join(directory, "missing", "x")})
+        assert status == 400 and "No such file or directory" in response["error"]
+        status, response = await service.handle_request("GET", "/courses/CIS422/on-deck")
+        assert status == 200
+        await service.close()
+    asyncio.run(run())
+
+def test_concurrent_clients():
+    async def run():
+        directory, service = make_service()
+        roster_file = write_roster(directory, 30)
+        for course_id in ("A", "B"):
+            await post(service, f"/courses/{course_id}/import", {"filename": roster_file})
+        server = await asyncio.start_server(service._handle_connection, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+
+        async def client(course_id, num_calls):
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            for _ in range(num_calls):
+                body = json.dumps({"flag": False, "index": 0}).encode()
+                writer.write(f"POST /courses/{course_id}/call HTTP/1.1\r\n"
+                             f"Content-Length: {len(body)}\r\n\r\n".encode() + body)
+                await writer.drain()
+                assert (await reader.readline()).startswith(b"HTTP/1.1 200")
+                length = 0
+                while (line := await reader.readline()) != b"\r\n":
+                    if line.lower().startswith(b"content-length:"):
+                        length = int(line.split(b":")[1])
+                await reader.readexactly(length)
+            writer.close()
+
+        await asyncio.gather(*(client(course_id, 10) for course_id in ("A", "B") * 5))
+        server.close()
+        await server.wait_closed()
+        for course_id in ("A", "B"):
+            queue = service.registry.get(course_id).queue
+            assert queue.queue_size() == 30
+            assert sum(s.times_called() for s in queue.student_queue) == 50
+        await service.close()
+    asyncio.run(run())
+
+def test_bad_content_length():
+    async def run():
+        directory, service = make_service()
+        server = await asyncio.start_server(service._handle_connection, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        for length in (b"abc", b"-5"):
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"POST /courses/A/call HTTP/1.1\r\nContent-Length: " + length + b"\r\n\r\n")
+            await writer.drain()
+            assert (await reader.readline()).startswith(b"HTTP/1.1 400")
+            # The connection is closed after the error.
+            await reader.read()
+            assert reader.at_eof()
+            writer.close()
+        server.close()
+        await server.wait_closed()
+        await service.close()
+    asyncio.run(run())
+
+if __name__ == "__main__":
+    test_call_on_students()
+    test_errors_are_reported()
+    test_concurrent_clients()
+    test_bad_content_length()
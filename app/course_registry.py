@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+
+###############################################################################
+"""
+Script Name:    Course Registry
+
+Description:    Lets one CoolCall process serve many courses (sections), each
+                with its own roster, queue, and logs.
+
+                Every course keeps its data under its own directory:
+                    student_data/courses/<course id>/roster.txt
+                    student_data/courses/<course id>/student_queue
+                    logs/courses/<course id>/...
+                Recently used courses stay loaded in memory. When more than
+                COURSE_CACHE_SIZE courses are loaded, the least recently used
+                one is saved and unloaded.
+
+Authors:        CoolCall Team
+
+Last Edited:    10/18/2026
+Last Edit By:   CoolCall Team
+"""
+###############################################################################
+from collections import OrderedDict
+from weighted_student_queue import make_student_queue
+from student_roster import StudentRoster
+from log_manager import LogManager
+from constants import *
+import re
+###############################################################################
+
+# Course ids become directory names, so they are kept to a safe set of characters.
+COURSE_ID_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]*$")
+
+
+class Course:
+    """
+    The roster, queue, and logs of a single course.
+
+    Attributes
+    =======================================================================
+    course_id
+        The name of the course, such as "CIS422-F22"
+
+    data_location, logs_location
+        The directories that the course's data and logs are stored in
+
+    roster, queue, log_manager
+        The course's StudentRoster, StudentQueue, and LogManager
+
+    Methods
+    =======================================================================
+    exists()
+        Returns whether the course has been stored on disk.
+
+    load()
+        Load the course's roster and queue from its data directory.
+
+    import_roster(filename)
+        Import a new roster file into the course.
+
+    flush()
+        Save the queue and write out the logs.
+    """
+
+    def __init__(self, course_id, data_location, logs_location):
+        self.course_id = course_id
+        self.data_location = data_location
+        self.logs_location = logs_location
+        self.roster = StudentRoster(os.path.join(data_location, "roster.txt"))
+        self.queue = make_student_queue(os.path.join(data_location, "student_queue"))
+        self.log_manager = LogManager("summary.txt", logs_location)
+
+    def exists(self):
+        """
+        returns: (boolean) has the course been stored on disk?
+        """
+        return os.path.isdir(self.data_location)
+
+    def load(self):
+        """
+        Load the course's roster and queue, creating its directories if this
+        is a new course. A course without a roster has an empty queue until a
+        roster is imported.
+        """
+        os.makedirs(self.data_location, exist_ok=True)
+        os.makedirs(self.logs_location, exist_ok=True)
+        if self.roster.import_roster_from_file(self.roster.roster_location):
+            return
+        if not self.queue.load_queue_from_file(self.queue.queue_location, self.roster):
+            self.queue.queue_from_roster(self.roster)
+
+    def import_roster(self, filename):
+        """
+        Import a new roster file into the course, and save it internally. As in
+        the Instructor Interaction Model, a queue that already has students is
+        updated in place, keeping everyone's position and call history.
+
+        filename: (string) the roster file to import
+        returns: (string) a descriptive error, or an empty string
+        """
+        new_roster = StudentRoster(self.roster.roster_location)
+        error = new_roster.import_roster_from_file(filename)
+        if error:
+            return error
+        changes = self.roster.diff(new_roster)
+        self.roster.close()
+        self.roster = new_roster
+        self.roster.save_internally()
+        if self.queue.queue_size() == 0:
+            self.queue.queue_from_roster(self.roster)
+        else:
+            self.queue.merge_roster(changes)
+        self.log_manager.students_changed()
+        return ""
+
+    def flush(self):
+        """
+        Save the queue and write out the logs, before the course is unloaded.
+        """
+        if self.queue.queue_size() > 0:
+            self.queue.save_queue_to_file(self.queue.queue_location)
+        self.queue.close()
+        self.roster.close()
+        self.log_manager.close()
+
+
+class CourseRegistry:
+    """
+    A bounded, least-recently-used cache of loaded Courses.
+
+    Attributes
+    =======================================================================
+    data_location, logs_location
+        The directories that hold one subdirectory per course
+
+    capacity
+        The most courses that are kept loaded at once
+
+    Methods
+    =======================================================================
+    get(course_id, create)
+        Return a loaded Course, loading it (and unloading another) if needed.
+
+    pin(course_id), unpin(course_id)
+        Keep a course loaded while it is in use.
+
+    course_ids()
+        Return the ids of every course stored on disk.
+
+    evict(course_id)
+        Save and unload a course.
+
+    close()
+        Save and unload every course.
+    """
+
+    def __init__(self, data_location=None, logs_location=None, capacity=COURSE_CACHE_SIZE):
+        self.data_location = data_location or COURSES_DATA_LOCATION
+        self.logs_location = logs_location or COURSES_LOGS_LOCATION
+        self.capacity = capacity
+        self._courses = OrderedDict()
+        # Courses that are in use, mapped to the number of users. A pinned
+        # course is never unloaded to make room for another.
+        self._pins = {}
+
+    def get(self, course_id, create=True):
+        """
+        Return a loaded Course. Switching to a course that is already loaded
+        is a dictionary lookup; otherwise the course is loaded from disk, and
+        the least recently used course is unloaded if there are too many.
+
+        course_id: (string) the name of the course
+        create: (boolean) make a new course if there is none stored with this
+        id? If False, a ValueError is raised instead.
+        returns: (Course)
+        """
+        course = self._courses.get(course_id)
+        if course is not None:
+            self._courses.move_to_end(course_id)
+            return course
+        if not COURSE_ID_PATTERN.match(course_id):
+            raise ValueError(f"Invalid course id: {course_id!r}")
+        course = Course(course_id, os.path.join(self.data_location, course_id),
+                        os.path.join(self.logs_location, course_id))
+        if not create and not course.exists():
+            raise ValueError(f"No such course: {course_id!r}")
+        course.load()
+        self._courses[course_id] = course
+        unpinned = [other for other in self._courses
+                    if other != course_id and other not in self._pins]
+        for other in unpinned[:max(0, len(self._courses) - self.capacity)]:
+            self._courses.pop(other).flush()
+        return course
+
+    def pin(self, course_id):
+        """
+        Keep a loaded course from being unloaded until it is unpinned, for as
+        long as it is in use. Pins are counted, so each pin() needs an unpin().
+        While pinned courses fill the cache, it may hold more than <capacity>.
+
+        course_id: (string)
+        """
+        self._pins[course_id] = self._pins.get(course_id, 0) + 1
+
+    def unpin(self, course_id):
+        """
+        Release a pin taken by pin().
+
+        course_id: (string)
+        """
+        if self._pins[course_id] == 1:
+            del self._pins[course_id]
+        else:
+            self._pins[course_id] -= 1
+
+    def is_loaded(self, course_id):
+        """
+        returns: (boolean) is the course currently loaded in memory?
+        """
+        return course_id in self._courses
+
+    def course_ids(self):
+        """
+        returns: (list) the ids of every course stored on disk, sorted.
+        """
+        if not os.path.isdir(self.data_location):
+            return []
+        return sorted(name for name in os.listdir(self.data_location)
+                      if os.path.isdir(os.path.join(self.data_location, name)))
+
+    def evict(self, course_id):
+        """
+        Save and unload a course, if it is loaded.
+
+        course_id: (string)
+        """
+        course = self._courses.pop(course_id, None)
+        if course is not None:
+            course.flush()
+
+    def close(self):
+        """
+        Save and unload every course. Called when the program shuts down.
+        """
+        while self._courses:
+            _, course = self._courses.popitem(last=False)
+            course.flush()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+
+###############################################################################
+"""
+Script Name:    CourseRegistry Testing Script
+
+Description:    This script can be run at the command line to test loading,
+                switching between, and evicting courses. All course data is
+                kept in a temporary directory.
+
+Author:         CoolCall Team
+
+Last Edited:    10/18/2026
+Last Edit By:   CoolCall Team
+"""
+###############################################################################
+import os
+from course_registry import CourseRegistry
+from test_support import write_roster, temporary_directory
+###############################################################################
+
+def make_registry(capacity):
+    directory = temporary_directory()
+    return directory, CourseRegistry(os.path.join(directory, "data"),
+                                     os.path.join(directory, "logs"), capacity)
+
+def test_switching_and_eviction():
+    directory, registry = make_registry(capacity=2)
+    roster_file = write_roster(directory, 20)
+    for course_id in ("A", "B", "C"):
+        assert registry.get(course_id).import_roster(roster_file) == ""
+    # Only the two most recently used courses stay loaded.
+    assert not registry.is_loaded("A")
+    assert registry.is_loaded("B") and registry.is_loaded("C")
+    assert registry.course_ids() == ["A", "B", "C"]
+
+    course_b = registry.get("B")
+    assert registry.get("B") is course_b
+    order = [student.UO_ID for student in course_b.queue.student_queue]
+    registry.evict("B")
+    reloaded = registry.get("B")
+    assert reloaded is not course_b
+    # Reloading shuffles the front and back of the queue separately.
+    assert sorted(s.UO_ID for s in reloaded.queue.student_queue) == sorted(order)
+    registry.close()
+
+def test_invalid_course_id():
+    _, registry = make_registry(capacity=2)
+    try:
+        registry.get("../escape")
+        assert False
+    except ValueError:
+        pass
+
+if __name__ == "__main__":
+    test_switching_and_eviction()
+    test_invalid_course_id()
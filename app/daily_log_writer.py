@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+
+###############################################################################
+"""
+Script Name:    Daily Log Writer
+
+Description:    The DailyLogWriter Class for the CoolCall Program.
+                Keeps the current day's log file open for the whole session,
+                collects cold call lines in memory, and writes them out in
+                batches. A new log file is started automatically when the
+                date changes.
+
+Authors:        CoolCall Team
+
+Last Edited:    10/18/2026
+Last Edit By:   CoolCall Team
+"""
+###############################################################################
+from datetime import date
+from constants import *
+import threading
+import atexit
+import os
+###############################################################################
+
+class DailyLogWriter():
+    """
+    A class for writing lines to the daily log file.
+
+    Buffered lines are written out once there are <flush_lines> of them, once
+    the oldest has waited <flush_ms> milliseconds, when flush() is called, and
+    when the program exits.
+
+    Attributes
+    =======================================================================
+    logs_location
+        The directory that daily log files are written to
+
+    flush_lines, flush_ms
+        The flush policy: the most lines, and the longest time in
+        milliseconds, that a line can wait in memory
+
+    fsync
+        Should each flush also force the log file onto the disk?
+
+    Methods
+    =======================================================================
+    write_line(line), write_lines(lines)
+        Add a line, or several lines, to today's log file.
+
+    flush()
+        Write all buffered lines to the log file.
+
+    close()
+        Write all buffered lines, and close the log file.
+    """
+
+    def __init__(self, logs_location=LOGS_LOCATION, flush_lines=DAILY_LOG_FLUSH_LINES,
+                 flush_ms=DAILY_LOG_FLUSH_MS, fsync=DAILY_LOG_FSYNC):
+        self.logs_location = logs_location
+        self.flush_lines = flush_lines
+        self.flush_ms = flush_ms
+        self.fsync = fsync
+        self._day = None
+        self._file = None
+        self._buffer = []
+        self._timer = None
+        # The timer flushes from its own thread, so the buffer is locked.
+        self._lock = threading.Lock()
+
+    def write_line(self, line):
+        """
+        Add a line to today's log file. The line is buffered until the flush
+        policy says it should be written.
+
+        line: (string) the line to write, including the line ending
+        """
+        self.write_lines([line])
+
+    def write_lines(self, lines):
+        """
+        Add several lines to today's log file at once. They are buffered, and
+        written together, as for write_line().
+
+        lines: (list) the lines to write, each including the line ending
+        """
+        with self._lock:
+            today = date.today()
+            if today != self._day:
+                # Lines from before midnight still belong in yesterday's file.
+                self._flush_buffer()
+                self._open(today)
+            self._buffer.extend(lines)
+            if len(self._buffer) >= self.flush_lines:
+                self._flush_buffer()
+            elif self._timer is None and self.flush_ms is not None:
+                self._timer = threading.Timer(self.flush_ms / 1000, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _open(self, day):
+        """
+        Open the log file for the given day, creating it with a heading and
+        the date if it doesn't exist.
+
+        day: (date)
+        """
+        if self._file is not None:
+            self._file.close()
+        else:
+            # Make sure buffered lines are written if the program exits
+            # without closing the writer.
+            atexit.register(self.close)
+        date_string = day.strftime('%Y-%m-%d')
+        log_file_name = f'{self.logs_location}/{DAILY_LOG_FILE_NAME_PREFIX}--{date_string}.txt'
+        new_file = not os.path.exists(log_file_name)
+        self._file = open(log_file_name, 'a')
+        if new_file:
+            self._file.write(DAILY_LOG_HEADING + '\n')
+            self._file.write(date_string + '\n')
+            self._file.flush()
+        self._day = day
+
+    def _flush_buffer(self):
+        """
+        Write the buffered lines. The lock must be held by the caller.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._buffer:
+            return
+        self._file.write(''.join(self._buffer))
+        self._buffer = []
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+    def flush(self):
+        """
+        Write all buffered lines to the log file.
+        """
+        with self._lock:
+            self._flush_buffer()
+
+    def close(self):
+        """
+        Write all buffered lines, and close the log file. The writer can still
+        be used afterwards; the file is reopened by the next line.
+        """
+        with self._lock:
+            self._flush_buffer()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+                self._day = None
+                atexit.unregister(self.close)
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+
+###############################################################################
+"""
+Script Name:    DailyLogWriter Testing Script
+
+Description:    This script can be run at the command line to test the daily
+                log writer: the format of the log files, starting a new file
+                when the date changes, and when buffered lines are written. The
+                log files are written to temporary directories.
+
+Author:         CoolCall Team
+
+Last Edited:    10/18/2026
+Last Edit By:   CoolCall Team
+"""
+###############################################################################
+import os
+import time
+from datetime import date
+import daily_log_writer
+from daily_log_writer import DailyLogWriter
+from log_manager import LogManager
+from test_support import make_roster, temporary_directory
+from constants import DAILY_LOG_HEADING, DAILY_LOG_FILE_NAME_PREFIX
+###############################################################################
+
+def log_file(directory, day):
+    return os.path.join(directory, f"{DAILY_LOG_FILE_NAME_PREFIX}--{day.strftime('%Y-%m-%d')}.txt")
+
+def read(filename):
+    with open(filename, "rb") as f:
+        return f.read()
+
+def old_write_logfile(directory, student, flagged):
+    """
+    How LogManager.write_logfile() wrote a cold call before the DailyLogWriter,
+    opening the file for every line.
+    """
+    day = date.today().strftime('%Y-%m-%d')
+    log_file_name = f'{directory}/{DAILY_LOG_FILE_NAME_PREFIX}--{day}.txt'
+    if not os.path.exists(log_file_name):
+        with open(log_file_name, 'w') as f:
+            f.write(DAILY_LOG_HEADING + '\n')
+            f.write(day + '\n')
+    response_code = 'X' if flagged else ''
+    with open(log_file_name, 'a') as f:
+        f.write(f'{response_code}\t{student.first_name} {student.last_name} <{student.email_address}>\n')
+
+class FakeDate(date):
+    """
+    A date whose today() can be set by the test.
+    """
+    current = date(2026, 10, 18)
+
+    @classmethod
+    def today(cls):
+        return cls.current
+
+def test_same_output_as_old_writer():
+    students = sorted(make_roster(10).students, key=lambda student: student.UO_ID)
+    calls = [(students[i % 10], i % 3 == 0) for i in range(25)]
+    old_directory, new_directory = temporary_directory(), temporary_directory()
+    for student, flagged in calls:
+        old_write_logfile(old_directory, student, flagged)
+    log_manager = LogManager("summary.txt", new_directory)
+    for student, flagged in calls:
+        log_manager.write_logfile(student, flagged)
+    log_manager.close()
+    today = date.today()
+    assert read(log_file(new_directory, today)) == read(log_file(old_directory, today))
+    assert read(log_file(new_directory, today)).startswith(
+        f"{DAILY_LOG_HEADING}\n{today.strftime('%Y-%m-%d')}\nX\tFirst0 Last0 <s0@uoregon.edu>\n".encode())
+
+def test_new_file_each_day():
+    directory = temporary_directory()
+    saved = daily_log_writer.date
+    daily_log_writer.date = FakeDate
+    try:
+        first_day, second_day = date(2026, 10, 18), date(2026, 10, 19)
+        FakeDate.current = first_day
+        writer = DailyLogWriter(directory, flush_lines=100, flush_ms=None)
+        writer.write_line("X\tAbby Abbyson <aabbyson@uoregon.edu>\n")
+        FakeDate.current = second_day
+        writer.write_lines(["\tAdam Adamson <aadamson@uoregon.edu>\n"])
+        # The line from before midnight was written to the first day's file.
+        assert read(log_file(directory, first_day)) == (
+            f"{DAILY_LOG_HEADING}\n2026-10-18\nX\tAbby Abbyson <aabbyson@uoregon.edu>\n".encode())
+        writer.close()
+        assert read(log_file(directory, second_day)) == (
+            f"{DAILY_LOG_HEADING}\n2026-10-19\n\tAdam Adamson <aadamson@uoregon.edu>\n".encode())
+    finally:
+        daily_log_writer.date = saved
+
+def test_lines_are_flushed_in_batches():
+    directory = temporary_directory()
+    heading = f"{DAILY_LOG_HEADING}\n{date.today().strftime('%Y-%m-%d')}\n".encode()
+    writer = DailyLogWriter(directory, flush_lines=3, flush_ms=None)
+    writer.write_lines(["\ta\n", "\tb\n"])
+    assert read(log_file(directory, date.today())) == heading
+    # The third line fills the batch.
+    writer.write_line("\tc\n")
+    assert read(log_file(directory, date.today())) == heading + b"\ta\n\tb\n\tc\n"
+    writer.write_line("\td\n")
+    writer.flush()
+    assert read(log_file(directory, date.today())) == heading + b"\ta\n\tb\n\tc\n\td\n"
+    # Closing writes the lines that are still waiting.
+    writer.write_line("\te\n")
+    writer.close()
+    assert read(log_file(directory, date.today())) == heading + b"\ta\n\tb\n\tc\n\td\n\te\n"
+
+def test_lines_are_flushed_after_a_while():
+    directory = temporary_directory()
+    heading = f"{DAILY_LOG_HEADING}\n{date.today().strftime('%Y-%m-%d')}\n".encode()
+    writer = DailyLogWriter(directory, flush_lines=100, flush_ms=50, fsync=True)
+    writer.write_line("\ta\n")
+    assert read(log_file(directory, date.today())) == heading
+    deadline = time.monotonic() + 5
+    while read(log_file(directory, date.today())) == heading and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert read(log_file(directory, date.today())) == heading + b"\ta\n"
+    writer.close()
+
+if __name__ == "__main__":
+    test_same_output_as_old_writer()
+    test_new_file_each_day()
+    test_lines_are_flushed_in_batches()
+    test_lines_are_flushed_after_a_while()
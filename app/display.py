@@ -14,9 +14,8 @@ Last Edit By:   Quinn Fetrow
 """
 ###############################################################################
 from tkinter import *
-from instructor_interaction_model import *
 from constants import *
-from random_distribution_verification import *
+from key_sequence import KeySequence
 ###############################################################################
 
 class Display:
@@ -28,8 +27,17 @@ class Display:
     Attributes
     =======================================================================
     rdv
-        RandomVerification() is in the Display because we are mapping key presses
-        to add_and_check_for_random_verification(), which is a RandomVerification() method.
+        The RandomVerification() object that runs Random Distribution Verification
+        Mode. It is only created (and its module only imported) the first time the
+        mode is entered, to keep it off the start-up path.
+
+    hotkeys
+        The KeySequence that watches key presses for the sequences that enter
+        hidden admin modes, such as Random Distribution Verification Mode.
+
+    admin_modes
+        Maps the name of each sequence registered with hotkeys to the method
+        that enters its mode.
 
     main_window
         This tkinter display window opens upon application start up when called
@@ -51,15 +59,38 @@ class Display:
     labels
         Sets display window text and buttons to a specified color and format. 
 
+    next_label
+        The "Next students:" label at the left of the window.
+
+    shown
+        What each on-deck label currently shows, as a (name, is selected,
+        is marked) tuple, so that unchanged labels aren't redrawn.
+
+    tk_calls
+        The total number of Tk calls made by draw_main_screen().
+
     Methods
     =======================================================================
+    check_for_admin_mode(event)
+        Called on every key release: enters an admin mode when the key sequence
+        for it has been pressed.
+
+    start_random_verification()
+        Enters Random Distribution Verification Mode.
+
+    _build_layout()
+        Lays out the labels and import/export buttons once, when the window is
+        created.
+
     draw_main_screen()
-        This function displays the main_window to the screen along with labels and
-        import/export buttons.
+        This function updates the on-deck labels that have changed.
 
     """
     def __init__(self, controller):
-        self.rdv = RandomVerification()
+        self.controller = controller
+        self.rdv = None
+        self.hotkeys = KeySequence(RDV_KEY_SEQUENCE, "random_verification")
+        self.admin_modes = {"random_verification": self.start_random_verification}
         # Configure display window
         self.main_window = Tk()
         self.main_window.configure(bg="white")
@@ -67,11 +98,14 @@ class Display:
         self.main_window.geometry(f'{self.main_window.winfo_screenwidth()}x60')
         self.main_window.resizable(False, False)
         # Bind key presses to respective functions
-        self.main_window.bind_all("<KeyRelease>", self.rdv.add_and_check_for_random_verification, True)
+        self.main_window.bind_all("<KeyRelease>", self.check_for_admin_mode, True)
         self.main_window.bind_all(f"<{MOVE_LEFT_KEY}>", controller.shift_index)
         self.main_window.bind_all(f"<{MOVE_RIGHT_KEY}>", controller.shift_index)
         self.main_window.bind_all(f"<{REMOVE_WITH_FLAG_KEY}>", controller.remove)
         self.main_window.bind_all(f"<{REMOVE_WITHOUT_FLAG_KEY}>", controller.remove)
+        self.main_window.bind_all(f"<{MARK_KEY}>", controller.toggle_mark)
+        if LATENCY_INSTRUMENTATION:
+            self.main_window.bind_all(f"<{DUMP_LATENCY_KEY}>", controller.dump_latency)
         # Create buttons
         self.import_button = Button(
             self.main_window,
@@ -87,48 +121,92 @@ class Display:
         self.labels = [
             Label(self.main_window, bg="white", fg="black", text="", width=0) for i
             in range(NUM_ON_DECK)]
+        self.next_label = Label(self.main_window, bg="white", fg="black", text="Next students:", width=0)
+        # What each on-deck label currently shows: (name, is selected, is marked)
+        self.shown = [("", False, False)] * NUM_ON_DECK
+        # The total number of Tk calls made by draw_main_screen()
+        self.tk_calls = 0
+        self._build_layout()
+
+    def check_for_admin_mode(self, event):
+        """
+        Called every time a key is released. This sends the key to the
+        KeySequence, and enters an admin mode if the key sequence for it has
+        been pressed.
 
-
-    def draw_main_screen(self, selection_index, on_deck):
+        event: the Tkinter event of the key release.
         """
-        This function displays the main_window to the screen along with labels and
-        import/export buttons.
+        matched = self.hotkeys.add_key(event.keysym)
+        if matched:
+            self.hotkeys.reset()
+            for name in matched:
+                self.admin_modes[name]()
 
-        selection_index: (int) specifies the index of a currently selected student in the on-deck list.
-        on_deck: (list) list of students who are currently on-deck.
+    def start_random_verification(self):
         """
-        # Create a list of on-deck names for labels
-        names = []
-        for i in range(len(on_deck)):
-            names.append(on_deck[i].get_name())
-        for i in range(len(on_deck), NUM_ON_DECK):
-            names.append("")
+        Enter Random Distribution Verification Mode, creating the
+        RandomVerification object the first time.
+        """
+        if self.rdv is None:
+            from random_distribution_verification import RandomVerification
+            self.rdv = RandomVerification(self.controller)
+        self.rdv.start()
 
+    def _build_layout(self):
+        """
+        Lay out the window once: the "Next students:" label, the on-deck
+        labels, and the import and export buttons. After this, drawing only
+        reconfigures the on-deck labels whose contents have changed.
+        """
         # Space the text and buttons in the display window according to the number of students on-deck
-        self.main_window.columnconfigure(0, minsize=self.main_window.winfo_screenwidth()/(NUM_ON_DECK + 4))
+        screen_width = self.main_window.winfo_screenwidth()
+        self.main_window.columnconfigure(0, minsize=screen_width/(NUM_ON_DECK + 4))
         for i in range(NUM_ON_DECK):
-            self.main_window.columnconfigure(i+1, minsize=self.main_window.winfo_screenwidth()/(NUM_ON_DECK + 3))
-        
+            self.main_window.columnconfigure(i+1, minsize=screen_width/(NUM_ON_DECK + 3))
+
         # Add the "Next students: " label
-        label = Label(self.main_window, bg="white", fg="black",text="Next students:", width=0)
-        label.grid(row=0, column=0, padx=10, pady=20, sticky="W")
+        self.next_label.grid(row=0, column=0, padx=10, pady=20, sticky="W")
 
         # Make sure the display window always sits on top of other windows
         self.main_window.attributes('-topmost', True)
 
-        # Set the color of a selected student name and unselected student names
         for i in range(NUM_ON_DECK):
+            self.labels[i].grid(row=0, column=(i+1), sticky="W", rowspan=1)
+
+        # Format the import and export button locations
+        self.import_button.grid(row=0, column=(NUM_ON_DECK + 1), columnspan=1, padx=20)
+        self.export_button.grid(row=0, column=(NUM_ON_DECK + 2), columnspan=1, padx=3)
+
+    def draw_main_screen(self, selection_index, on_deck, marked=()):
+        """
+        This function updates the on-deck labels in the display window to show
+        the on-deck students, the current selection, and the marked students.
+        Only the labels whose name, selection or mark has changed since the last
+        draw are reconfigured, with one Tk call each, so a draw makes at most
+        NUM_ON_DECK Tk calls.
+
+        selection_index: (int) specifies the index of a currently selected student in the on-deck list.
+        on_deck: (list) list of students who are currently on-deck.
+        marked: the students who are marked to be called on together.
+        returns: (int) the number of Tk calls made
+        """
+        tk_calls = 0
+        for i in range(NUM_ON_DECK):
+            name = on_deck[i].get_name() if i < len(on_deck) else ""
+            is_marked = i < len(on_deck) and on_deck[i] in marked
+            state = (name, i == selection_index, is_marked)
+            if state == self.shown[i]:
+                continue
+            # Set the color of a selected student name and unselected student
+            # names. Marked students are shown in gold.
             if i == selection_index:
                 bg_color = "black"
-                fg_color = "white"
+                fg_color = "gold" if is_marked else "white"
             else:
-                bg_color = "white"
+                bg_color = "gold" if is_marked else "white"
                 fg_color = "black"
-            self.labels[i].configure(bg=bg_color)
-            self.labels[i].configure(fg=fg_color)
-            self.labels[i].configure(text=names[i])
-            self.labels[i].grid(row=0, column=(i+1), sticky="W", rowspan=1)
-
-        # Format the import andd export button locations
-        self.import_button.grid(row=0, column=(NUM_ON_DECK + 1), columnspan=1, padx=20)
-        self.export_button.grid(row=0, column=(NUM_ON_DECK + 2), columnspan=1, padx=3)
\ No newline at end of file
+            self.labels[i].configure(text=name, bg=bg_color, fg=fg_color)
+            self.shown[i] = state
+            tk_calls += 1
+        self.tk_calls += tk_calls
+        return tk_calls
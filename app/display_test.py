@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+
+###############################################################################
+"""
+Script Name:    Display Testing Script
+
+Description:    This script can be run at the command line to test that
+                drawing the main screen only reconfigures the on-deck labels
+                that have changed. The labels are stand-ins that count their
+                Tk calls, so no display is needed.
+
+Author:         CoolCall Team
+
+Last Edited:    10/18/2026
+Last Edit By:   CoolCall Team
+"""
+###############################################################################
+import random
+from display import Display
+from student import Student
+from constants import NUM_ON_DECK
+###############################################################################
+
+class CountingLabel:
+    def __init__(self):
+        self.options = {}
+        self.calls = 0
+
+    def configure(self, **options):
+        self.options.update(options)
+        self.calls += 1
+
+def make_display():
+    display = Display.__new__(Display)
+    display.labels = [CountingLabel() for _ in range(NUM_ON_DECK)]
+    display.shown = [("", False, False)] * NUM_ON_DECK
+    display.tk_calls = 0
+    return display
+
+def test_only_changed_labels_are_drawn():
+    students = [Student(f"First{i}", f"Last{i}", str(951000000 + i), f"s{i}@uoregon.edu", "", "0")
+                for i in range(30)]
+    display = make_display()
+    on_deck = students[:NUM_ON_DECK]
+    assert display.draw_main_screen(0, on_deck) == NUM_ON_DECK
+    # Redrawing the same screen makes no Tk calls.
+    assert display.draw_main_screen(0, on_deck) == 0
+    # Moving the selection redraws the old and new selected labels.
+    assert display.draw_main_screen(1, on_deck) == 2
+    assert display.labels[1].options == {"text": "First1 Last1", "bg": "black", "fg": "white"}
+
+    index = 1
+    for _ in range(5000):
+        previous = on_deck
+        on_deck = random.sample(students, NUM_ON_DECK)
+        calls = display.draw_main_screen(index, on_deck)
+        assert calls <= NUM_ON_DECK
+        assert calls == sum(old is not new for old, new in zip(previous, on_deck))
+    assert display.tk_calls == sum(label.calls for label in display.labels)
+    for label, student in zip(display.labels, on_deck):
+        assert label.options["text"] == student.get_name()
+
+def test_marked_students_are_drawn():
+    students = [Student(f"First{i}", f"Last{i}", str(951000000 + i), f"s{i}@uoregon.edu", "", "0")
+                for i in range(NUM_ON_DECK)]
+    display = make_display()
+    display.draw_main_screen(0, students)
+    # Marking a student only redraws their label.
+    assert display.draw_main_screen(0, students, {students[2]}) == 1
+    assert display.labels[2].options["bg"] == "gold"
+    assert display.draw_main_screen(0, students, {students[0], students[2]}) == 1
+    assert display.labels[0].options == {"text": "First0 Last0", "bg": "black", "fg": "gold"}
+    assert display.draw_main_screen(0, students) == 2
+
+if __name__ == "__main__":
+    test_only_changed_labels_are_drawn()
+    test_marked_students_are_drawn()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+
+################################################################################
+"""
+Script Name:    Fenwick Tree
+
+Description:    A Fenwick tree (binary indexed tree) of non-negative integer
+                weights, used by the WeightedStudentQueue to pick students at
+                random in proportion to their weights.
+
+                Changing a weight, finding the total weight, and picking an
+                index at random all take O(log n) time. Weights are integers, so
+                the running sums never drift, however many updates are made.
+
+Authors:        CoolCall Team
+
+Last Edited:    10/18/2026
+Last Edit By:   CoolCall Team
+"""
+################################################################################
+
+class FenwickTree:
+	"""
+	A fixed-size array of integer weights, supporting weighted random choice.
+
+	Attributes
+	============================================================================
+	weights
+		The weight at each index (read only; use set() to change a weight).
+
+	Methods
+	============================================================================
+	set(index, weight)
+		Change the weight at an index.
+	total()
+		Returns the sum of all of the weights.
+	find(target)
+		Returns the index whose range of cumulative weight contains target.
+	sample(rng)
+		Returns an index chosen at random, in proportion to the weights.
+	"""
+
+	def __init__(self, weights=()):
+		"""
+		Build the tree from a list of weights in O(n) time.
+
+		weights: (iterable) a non-negative integer weight for each index
+		"""
+		self.weights = list(weights)
+		size = len(self.weights)
+		self._tree = [0] + self.weights
+		for i in range(1, size + 1):
+			parent = i + (i & -i)
+			if parent <= size:
+				self._tree[parent] += self._tree[i]
+		self._total = sum(self.weights)
+		# The largest power of two no more than the size, where find() starts.
+		self._top = 1 << (size.bit_length() - 1) if size else 0
+
+	def __len__(self):
+		return len(self.weights)
+
+	def set(self, index, weight):
+		"""
+		Change the weight at an index.
+
+		index: (int) from 0 to len - 1
+		weight: (int) the new, non-negative, weight
+		"""
+		delta = weight - self.weights[index]
+		if not delta:
+			return
+		self.weights[index] = weight
+		self._total += delta
+		i = index + 1
+		while i < len(self._tree):
+			self._tree[i] += delta
+			i += i & -i
+
+	def total(self):
+		"""
+		returns: (int) the sum of all of the weights
+		"""
+		return self._total
+
+	def find(self, target):
+		"""
+		Find the index whose range of cumulative weight contains target: the
+		smallest index such that the sum of the weights up to and including it
+		is greater than target. Indexes with no weight are never returned.
+
+		target: (int) from 0 to total() - 1
+		returns: (int) the index
+		"""
+		position = 0
+		step = self._top
+		while step:
+			following = position + step
+			if following < len(self._tree) and self._tree[following] <= target:
+				position = following
+				target -= self._tree[following]
+			step >>= 1
+		return position
+
+	def sample(self, rng):
+		"""
+		Pick an index at random, in proportion to the weights.
+
+		rng: the random number generator (such as the random module)
+		returns: (int) the index, or None if every weight is 0
+		"""
+		if self._total <= 0:
+			return None
+		return self.find(rng.randrange(self._total))
@@ -20,10 +20,18 @@ Last Edit By:   Madison Werries
 ###############################################################################
 from tkinter import filedialog, messagebox
 from display import Display
-from student_queue import StudentQueue
+from weighted_student_queue import make_student_queue
 from student_roster import StudentRoster
 from log_manager import LogManager
+from latency_recorder import LatencyRecorder
+from persistence_worker import PersistenceWorker
+from cold_call_session import ColdCallSession
+from session_trace import TraceRecorder, SHIFT_LEFT, SHIFT_RIGHT, CALL, CALL_FLAGGED, MARK
+from datetime import datetime
 from constants import *
+import random
+import heapq
+import time
 ###############################################################################
 
 class InstructorInteractionModel:
@@ -33,10 +41,20 @@ class InstructorInteractionModel:
 
     Attributes
     =======================================================================
-    index
-        the index of the currently selected student in the on deck display. For
-        instance, if the student furthest to the left was selected, this would
-        be the integer 0.
+    session
+        the ColdCallSession that keeps track of the selected and marked
+        on-deck students, and calls on them through the queue and log manager.
+        Its index is the index of the currently selected student in the on
+        deck display: if the student furthest to the left was selected, this
+        would be the integer 0.
+
+    persistence
+        the PersistenceWorker that saves the queue and logs in the background,
+        or None if BACKGROUND_PERSISTENCE is off.
+
+    trace
+        the TraceRecorder that records the session's keypresses, or None if
+        SESSION_TRACE is off.
 
     Methods
     =======================================================================
@@ -53,16 +71,39 @@ class InstructorInteractionModel:
         roster until one is successfully imported.
 
     _initial_load_queue(make_new)
-        Load a queue into memory, either by loading it from the internal pickle
+        Load a queue into memory, either by loading it from the internal queue
         file, or by creating a new queue from the roster. 
 
+    _report_startup_time(start_time)
+        Prints how long start-up took, compared with STARTUP_BUDGET_MS.
+
     shift_index(event)
         Called by key presses: this function shifts the index of the currently
         selected on-deck student in order to select a new student.
 
     remove(event)
-        Called by key presses: this function removes the selected student from
-        on-deck, fascilitating a cold call.
+        Called by key presses: this function removes the selected student (or
+        all of the marked students) from on-deck, fascilitating a cold call.
+
+    toggle_mark(event)
+        Called by key presses: marks or unmarks the selected student, to call
+        on several students at once.
+
+    _draw_main_screen()
+        Draw the on-deck students, with the selected and marked students.
+
+    _record_trace(kind)
+        Add a keypress to the session trace, when SESSION_TRACE is on.
+
+    _schedule_summary_write()
+        Rewrite the summary file once cold calls have paused for a moment.
+
+    _flush_persistence()
+        Wait until every queue and log write has been made.
+
+    dump_latency(event)
+        Write the latency histograms to the logs directory, when latency
+        instrumentation is turned on.
 
     import_roster(initial_import)
         Called if the user presses the import roster button, or upon start-up of 
@@ -74,33 +115,72 @@ class InstructorInteractionModel:
         Prompts user to select a directory, and exports the currently-loaded 
         roster file to that directory.
 
+    _describe_changes(changes)
+        Helper function for import_roster(): describes the students added,
+        removed and changed by a new roster.
+
     _format_names(students)
         Helper function for import_roster(): formats the names of a list of
         Student objects.
 
 """
-    def __init__(self):
+    def __init__(self, start_time=None):
+        """
+        start_time: the time.perf_counter() time that the program started, if
+        the start-up time should be measured and printed.
+        """
         # Initialize the objects controlled by the controller class.
         self.display = Display(self)
         self.ensure_directories_exist()
+        self.trace = None
+        if SESSION_TRACE:
+            # The random choices of the session come from the trace's seed,
+            # so that a replay of the trace makes the same choices.
+            started = datetime.now().strftime('%Y-%m-%d--%H-%M-%S')
+            self.trace = TraceRecorder(os.path.join(
+                LOGS_LOCATION, f"{SESSION_TRACE_FILE_NAME_PREFIX}--{started}.dat"))
+            random.seed(self.trace.seed)
         self.roster = StudentRoster()
-        self.queue = StudentQueue()
-        self.log_manager = LogManager("summary.txt")
+        # Files are written on a background thread, so a slow disk never holds
+        # up a keypress.
+        self.persistence = PersistenceWorker() if BACKGROUND_PERSISTENCE else None
+        self.queue = make_student_queue(persistence=self.persistence)
+        self.log_manager = LogManager("summary.txt", persistence=self.persistence)
+        # Times each stage of a keypress, if LATENCY_INSTRUMENTATION is on.
+        self.latency = LatencyRecorder(LATENCY_INSTRUMENTATION)
+
+        # At the start, the first student on deck will be selected, and no
+        # students are marked to be called on together.
+        self.session = ColdCallSession(self.queue, self.log_manager, self.latency)
 
-        # At the start, the first student on deck will be selected.
-        self.index = 0
+        # The pending Tkinter callback that rewrites the summary file, if any.
+        self.summary_job = None
 
         # We need to load the roster and queue into memory
         self.initial_loads()
 
         # Upon start-up, we need to tell the screen what to display.
-        self.display.draw_main_screen(self.index, self.queue.get_on_deck())
+        self._draw_main_screen()
+        if start_time is not None and not self.startup_prompted:
+            # Idle callbacks run once the window has been painted.
+            self.display.main_window.after_idle(self._report_startup_time, start_time)
 
         # This starts the main loop in the GUI. This continuously keeps the
         # display window visible and waits for input from the keyboard/button presses,
         # which trigger the event function that each key is mapped to.
         self.display.main_window.mainloop()
 
+        # The window has been closed: make sure the summary file is up to date,
+        # and that every waiting write has been made.
+        self.log_manager.close()
+        self.queue.close()
+        self.roster.close()
+        if self.persistence is not None:
+            self.persistence.close()
+        if self.trace is not None:
+            self.trace.close()
+        self.dump_latency()
+
     def ensure_directories_exist(self):
         """
         Verify that specified directories exist.
@@ -130,6 +210,8 @@ class InstructorInteractionModel:
         """
         new_roster = self._inital_load_roster()
         self._initial_load_queue(new_roster)
+        # Time spent waiting for the user to import a roster isn't start-up time.
+        self.startup_prompted = new_roster
 
     def _inital_load_roster(self):
         """
@@ -153,7 +235,7 @@ class InstructorInteractionModel:
 
     def _initial_load_queue(self, make_new):
         """
-        Load a queue into memory, either by loading it from the internal pickle
+        Load a queue into memory, either by loading it from the internal queue
         file, or by creating a new queue from the roster. 
         
         - If we just imported a new roster, we certainly want to make a new queue 
@@ -163,9 +245,19 @@ class InstructorInteractionModel:
 
         make_new: (boolean) Should we make a new queue by default?
         """
-        if make_new or not self.queue.load_queue_from_file(INTERNAL_QUEUE_LOCATION):
+        if make_new or not self.queue.load_queue_from_file(INTERNAL_QUEUE_LOCATION, self.roster):
             self.queue.queue_from_roster(self.roster)
 
+    def _report_startup_time(self, start_time):
+        """
+        Print the time from start_time to the first paint of the on-deck window,
+        and whether it is within STARTUP_BUDGET_MS.
+        """
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        print(f"Start-up took {elapsed_ms:.0f} ms (budget {STARTUP_BUDGET_MS} ms)")
+        if elapsed_ms > STARTUP_BUDGET_MS:
+            print("Start-up was slower than its budget.")
+
     def shift_index(self, event):
         """
         Shift the selection index to the left or right, depending on which key
@@ -174,35 +266,110 @@ class InstructorInteractionModel:
 
         event: the Tkinter event of the keypress.
         """
+        start = self.latency.start()
         if event.keysym == MOVE_LEFT_KEY:
-            self.index = max((self.index - 1), 0)
+            self.session.shift(-1)
+            self._record_trace(SHIFT_LEFT)
         elif event.keysym == MOVE_RIGHT_KEY:
-            self.index = min((self.index + 1), len(self.queue.get_on_deck()) - 1)
+            self.session.shift(1)
+            self._record_trace(SHIFT_RIGHT)
         else:
             raise ValueError(f"Event {event} should not have triggered the shift_index method.")
-        self.display.draw_main_screen(self.index, self.queue.get_on_deck())
+        lap = self.latency.lap("shift", start)
+        self._draw_main_screen()
+        self.latency.lap("shift_draw", lap)
+        self._time_until_repaint("shift_total", start)
 
     def remove(self, event):
         """
         Remove the selected student from the queue, with or without flagging
-        them, depending on which key is pressed. This method is automatically
+        them, depending on which key is pressed. If any students are marked,
+        all of them are removed instead, with the queue saved and the logs
+        written once for the whole batch. This method is automatically
         called every time the up or down keys (or other keys, as defined in
         constants.py) are pressed.
 
         event: the Tkinter event of the keypress.
         """
-        student = self.queue.get_on_deck()[self.index]
+        start = self.latency.start()
         if event.keysym == REMOVE_WITH_FLAG_KEY:
             flag = True
         elif event.keysym == REMOVE_WITHOUT_FLAG_KEY:
             flag = False
         else:
             raise ValueError(f"Event {event} should not have triggered the remove method.")
+        self._record_trace(CALL_FLAGGED if flag else CALL)
+        self.session.remove(flag)
+        lap = self.latency.start()
+        self._draw_main_screen()
+        self.latency.lap("remove_draw", lap)
+        self._schedule_summary_write()
+        self._time_until_repaint("remove_total", start)
+
+    def toggle_mark(self, event):
+        """
+        Mark the selected student to be called on together with the other
+        marked students, or unmark them if they are already marked. This method
+        is automatically called every time the MARK_KEY is pressed.
+
+        event: the Tkinter event of the keypress.
+        """
+        self.session.toggle_mark()
+        self._record_trace(MARK)
+        self._draw_main_screen()
+
+    def _draw_main_screen(self):
+        """
+        Draw the on-deck students, with the session's selection and marks.
+        """
+        self.display.draw_main_screen(self.session.index, self.queue.get_on_deck(), self.session.marked)
+
+    def _record_trace(self, kind):
+        """
+        Add a keypress to the session trace, if SESSION_TRACE is on.
+
+        kind: (int) the kind of event, from session_trace.py
+        """
+        if self.trace is not None:
+            self.trace.record(kind)
+
+    def _time_until_repaint(self, stage, start):
+        """
+        Record the time from the keypress until Tkinter is idle again, which
+        is after the window has been repainted.
+
+        stage: (string) the name to record the time under
+        start: the time of the keypress, from self.latency.start()
+        """
+        if start is not None:
+            self.display.main_window.after_idle(self.latency.since, stage, start)
+
+    def _schedule_summary_write(self):
+        """
+        Rewrite the summary file SUMMARY_DEBOUNCE_MS milliseconds after the
+        most recent cold call. A burst of cold calls only rewrites the file once.
+        """
+        if self.summary_job is not None:
+            self.display.main_window.after_cancel(self.summary_job)
+        self.summary_job = self.display.main_window.after(
+            SUMMARY_DEBOUNCE_MS, self._write_summary)
+
+    def _write_summary(self):
+        self.summary_job = None
+        start = self.latency.start()
+        self.log_manager.write_summary()
+        self.latency.lap("write_summary", start)
+
+    def dump_latency(self, event=None):
+        """
+        Write the latency histograms to LATENCY_LOG_FILE_NAME in the logs
+        directory. Called when the program closes, and when DUMP_LATENCY_KEY
+        is pressed.
 
-        student.call_on(flag)
-        self.queue.take_off_deck(student)
-        self.log_manager.write(self.queue.student_queue, student, flag)
-        self.display.draw_main_screen(self.index, self.queue.get_on_deck())
+        event: the Tkinter event of the keypress, if any.
+        """
+        if self.latency.enabled:
+            self.latency.dump(os.path.join(LOGS_LOCATION, LATENCY_LOG_FILE_NAME))
 
     def import_roster(self, initial_import=False):
         """
@@ -228,25 +395,40 @@ class InstructorInteractionModel:
         error = new_roster.import_roster_from_file(filename)
     
         if not error:
-            students_who_will_be_changed = new_roster.compare(self.roster)
-            names = self._format_names(students_who_will_be_changed)
             proceed = True
+            changes = None
             if initial_import:
+                names = self._format_names(new_roster.students)
                 message = f"This roster contains the following students: {names}. Proceed with import?"
-            elif len(students_who_will_be_changed) == 0:
-                message = "No student data will be changed by this import. Proceed with import?"
             else:
-                message = f"Importing this roster changes the stored data of {names}. Proceed with import?"
+                changes = self.roster.diff(new_roster)
+                if len(changes) == 0:
+                    message = "No student data will be changed by this import. Proceed with import?"
+                else:
+                    message = f"Importing this roster {self._describe_changes(changes)}. Proceed with import?"
         
             proceed = messagebox.askokcancel(message=message)
         
             if proceed:
+                self.roster.close()
                 self.roster = new_roster
                 print("Change roster")
+                # The queue's waiting writes must be made before it is
+                # replaced or merged with the new roster.
+                self._flush_persistence()
                 self.roster.save_internally()
-                self.queue = StudentQueue()
-                self.queue.queue_from_roster(self.roster)
-                self.display.draw_main_screen(self.index, self.queue.get_on_deck())
+                if changes is None or self.queue.queue_size() == 0:
+                    self.queue.close()
+                    self.queue = self.session.queue = make_student_queue(persistence=self.persistence)
+                    self.queue.queue_from_roster(self.roster)
+                else:
+                    # Keep everybody's place in the queue and call history,
+                    # only applying the students who changed.
+                    self.queue.merge_roster(changes)
+                self.log_manager.students_changed()
+                self.session.shift(0)
+                self.session.marked.clear()
+                self._draw_main_screen()
                 return True
             else:
                 print("Don't change roster")
@@ -269,20 +451,51 @@ class InstructorInteractionModel:
         if not dir_name:
             # User hit the cancel button on the file dialog
             return
+        self._flush_persistence()
         path = self.roster.export_roster_to_file(dir_name)
         messagebox.showinfo(message=f"Roster exported to {path}")
 
+    def _flush_persistence(self):
+        """
+        Wait until the persistence worker has made every waiting write, so the
+        files on disk match what is in memory.
+        """
+        if self.persistence is not None:
+            self.persistence.flush()
+
+    def _describe_changes(self, changes):
+        """
+        Helper function for import_roster(): describes the students that a
+        new roster adds, removes, and changes.
+
+        changes: (RosterDiff) the differences between the current and new roster.
+        """
+        parts = []
+        if changes.added:
+            parts.append(f"adds {self._format_names(changes.added)}")
+        if changes.removed:
+            parts.append(f"removes {self._format_names(changes.removed)}")
+        if changes.changed:
+            names = self._format_names([change.new for change in changes.changed])
+            parts.append(f"changes the stored data of {names}")
+        return "; ".join(parts)
+
     def _format_names(self, students):
         """
         Helper function for message dialogs when importing a roster.
         Formats a list of names into alphabetical order by last name.
-        Separates them with commas and spaces.
+        Separates them with commas and spaces. Only the first
+        ROSTER_NAMES_SHOWN names are listed, so that a large roster does not
+        make a giant dialog.
         
         students: (list) a list of Student objects.
         """
-        # Converting to set removes duplicates
-        names = list(set([student.get_name() for student in
-                     students]))
-        # Sort alphabetical by last name, join with commas
-        names= sorted(names, key=lambda name: name.split()[1] + name.split()[0])
-        return ', '.join(names)
+        # Keying by name removes duplicates
+        by_name = {student.get_name(): student for student in students}
+        # Sort alphabetical by last name, keeping only the names we show
+        shown = heapq.nsmallest(ROSTER_NAMES_SHOWN, by_name,
+                                key=lambda name: (by_name[name].last_name, by_name[name].first_name))
+        names = ', '.join(shown)
+        if len(by_name) > len(shown):
+            names += f", and {len(by_name) - len(shown)} others"
+        return names
@@ -9,16 +9,22 @@ Description:    This module keeps track of the key presses that are sent to it,
                 keystrokes. This is used for tracking if the sequence of keys
                 that triggers Random Distribution Vserification mode have been pressed.
 
+                Any number of key sequences can be registered. They are
+                compiled into a single automaton (in the style of Aho-Corasick),
+                so each key press is one dictionary lookup, however many
+                sequences there are and however long they are.
+
 Authors:        Arden Butterfield, Quinn Fetrow, Amy Reichhold, Madison Werries
 
 Last Edited:    1/30/2022
 Last Edit By:   Arden Butterfield
 """
 ################################################################################
+from collections import deque
 
 class KeySequence:
     """
-    A class to store and check the most recent sequence of key presses.
+    A class to check the most recent key presses against registered sequences.
 
     Attributes
     ============================================================================
@@ -26,33 +32,97 @@ class KeySequence:
         A list of the pattern of keys, in sequence, that we need to press in order
         to enter Random Distribution Verification mode.
 
-    key_sequence:
-        A list of the <n> most recent keys pressed, where <n> is the length of
-        the target_sequence.
+    sequences:
+        Maps the name of each registered sequence to its list of keys. The
+        target_sequence is registered under the name given to the constructor.
 
     The names of the keys here are the <keysym>s defined by Tkinter. They are
-    stored as strings.
+    stored as strings. Only sequences of keys are supported, not chords of keys
+    held down together, since a key release only tells us its own keysym.
 
     Methods
     ============================================================================
+    register(name, sequence)
+        Add a sequence to watch for.
+
     add_key(key)
         Add the most recently pressed key to the key sequence. This is
         called after every key press.
 
     check_for_match()
-        Does the recent sequence of key presses match the target sequence?
+        Does the recent sequence of key presses match a registered sequence?
+
+    matches()
+        Returns the names of the sequences matched by the most recent key.
 
     reset()
         Remove all keystrokes from the key sequence.
-        
+
     """
-    def __init__(self,target=None):
+    def __init__(self, target=None, name="target"):
         # Set the target sequence
-        self.key_sequence = []
         if target:
             self.target_sequence = target
         else:
             self.target_sequence = ["Left"] * 10
+        self.sequences = {}
+        self.register(name, self.target_sequence)
+
+    def register(self, name, sequence):
+        """
+        Add a sequence to watch for, replacing any sequence with the same name.
+        Sequences may overlap, or end inside one another; every sequence that
+        ends at a key press is matched.
+
+        name: (string) the name reported by matches()
+        sequence: (list) the keysyms of the sequence, in order
+        """
+        if not sequence:
+            raise ValueError("A key sequence must have at least one key.")
+        self.sequences[name] = list(sequence)
+        self._compile()
+
+    def _compile(self):
+        """
+        Build the automaton. Each state is the longest end of the recent key
+        presses that is the start of some sequence. _transitions[state] maps a
+        key to the next state (a missing key goes back to state 0), and
+        _outputs[state] is the names of the sequences that end in that state.
+        """
+        # Build a trie of the sequences.
+        children = [{}]
+        outputs = [[]]
+        for name, sequence in self.sequences.items():
+            state = 0
+            for key in sequence:
+                if key not in children[state]:
+                    children[state][key] = len(children)
+                    children.append({})
+                    outputs.append([])
+                state = children[state][key]
+            outputs[state].append(name)
+
+        # Visit the trie breadth-first, following each state's failure link (the
+        # longest proper end of it that is also in the trie) to fill in the
+        # transitions for keys that don't continue a sequence.
+        transitions = [dict(children[0])]
+        transitions.extend({} for _ in range(1, len(children)))
+        failure = [0] * len(children)
+        pending = deque(children[0].values())
+        while pending:
+            state = pending.popleft()
+            fallback = transitions[failure[state]]
+            outputs[state] = outputs[state] + outputs[failure[state]]
+            transitions[state] = dict(fallback)
+            for key, child in children[state].items():
+                failure[child] = fallback.get(key, 0)
+                transitions[state][key] = child
+                pending.append(child)
+        # Drop the transitions back to 0, since a missing key means the same.
+        self._transitions = [
+            {key: target for key, target in row.items() if target} for row in transitions]
+        self._outputs = [tuple(names) for names in outputs]
+        self._state = 0
 
     def add_key(self, key):
         """
@@ -60,22 +130,27 @@ class KeySequence:
         called after every key press.
 
         key: (string) the keysym string of the most recent key pressed.
+        returns: (tuple) the names of the sequences that this key completed
+        """
+        self._state = self._transitions[self._state].get(key, 0)
+        return self._outputs[self._state]
+
+    def matches(self):
+        """
+        Returns: (tuple) the names of the sequences that end with the most
+        recent key press.
         """
-        self.key_sequence.append(key)
-        if len(self.key_sequence) > len(self.target_sequence):
-            # If the key sequence becomes longer than the target, we trim off
-            # the old key presses, to only consider the most recent ones.
-            self.key_sequence = self.key_sequence[-len(self.target_sequence):]
+        return self._outputs[self._state]
 
     def check_for_match(self):
         """
-        Does the recent sequence of key presses match the target sequence?
+        Does the recent sequence of key presses match a registered sequence?
         Returns: (boolean) True if it does match, False if it does not.
         """
-        return self.key_sequence == self.target_sequence
+        return bool(self._outputs[self._state])
 
     def reset(self):
         """
         Remove all keystrokes from the key sequence.
         """
-        self.key_sequence = []
\ No newline at end of file
+        self._state = 0
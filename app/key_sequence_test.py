@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+
+###############################################################################
+"""
+Script Name:    KeySequence Testing Script
+
+Description:    This script can be run at the command line to test that the
+                KeySequence matches registered key sequences the same way as
+                comparing the most recent key presses with each sequence.
+
+Author:         CoolCall Team
+
+Last Edited:    10/18/2026
+Last Edit By:   CoolCall Team
+"""
+###############################################################################
+import random
+from key_sequence import KeySequence
+###############################################################################
+
+def test_default_target():
+    sequence = KeySequence()
+    for _ in range(9):
+        sequence.add_key("Left")
+    assert not sequence.check_for_match()
+    sequence.add_key("Left")
+    assert sequence.check_for_match()
+    assert sequence.matches() == ("target",)
+    sequence.reset()
+    sequence.add_key("Left")
+    assert not sequence.check_for_match()
+
+def test_many_overlapping_sequences():
+    patterns = {
+        "lefts": ["Left"] * 4,
+        "left_right": ["Left", "Right", "Left", "Right"],
+        "lrl": ["Left", "Right", "Left"],
+        "rl": ["Right", "Left"],
+        "up_down": ["Up", "Up", "Down", "Down", "Left", "Right"],
+    }
+    sequence = KeySequence(patterns["lefts"], "lefts")
+    for name, pattern in patterns.items():
+        sequence.register(name, pattern)
+
+    pressed = []
+    for _ in range(20000):
+        key = random.choice(["Left", "Right", "Up", "Down", "a"])
+        pressed.append(key)
+        expected = {name for name, pattern in patterns.items() if pressed[-len(pattern):] == pattern}
+        assert set(sequence.add_key(key)) == expected
+
+if __name__ == "__main__":
+    test_default_target()
+    test_many_overlapping_sequences()
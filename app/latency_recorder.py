@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+
+###############################################################################
+"""
+Script Name:    Latency Recorder
+
+Description:    Opt-in timing of the interactive path of the CoolCall Program,
+                from a keypress to the repainted window.
+
+                Each stage of handling a keypress is timed with the monotonic
+                nanosecond clock, and added to a histogram for that stage. The
+                histograms have log-linear buckets, in the style of HDR
+                histograms: every power of two is split into 16 equal buckets,
+                so any latency, from nanoseconds to minutes, is recorded to
+                within about 6% in a small, fixed amount of memory. The
+                histograms can be written to a report at any time.
+
+Authors:        CoolCall Team
+
+Last Edited:    10/18/2026
+Last Edit By:   CoolCall Team
+"""
+###############################################################################
+from datetime import datetime
+import time
+###############################################################################
+
+# Values below 2**SUB_BUCKET_BITS get a bucket each; above that, every power of
+# two is split into 2**(SUB_BUCKET_BITS - 1) buckets.
+SUB_BUCKET_BITS = 5
+SUB_BUCKETS = 1 << (SUB_BUCKET_BITS - 1)
+
+# The percentiles shown for each stage in the report.
+REPORT_PERCENTILES = (50, 90, 99, 99.9)
+
+
+def bucket_index(value):
+    """
+    returns: (int) the histogram bucket of a value (a non-negative integer)
+    """
+    shift = value.bit_length() - SUB_BUCKET_BITS
+    if shift <= 0:
+        return value
+    return shift * SUB_BUCKETS + (value >> shift)
+
+
+def bucket_range(index):
+    """
+    returns: (tuple) the lowest and highest values that fall in a bucket
+    """
+    if index < 2 * SUB_BUCKETS:
+        return index, index
+    shift = index // SUB_BUCKETS - 1
+    lowest = (index - shift * SUB_BUCKETS) << shift
+    return lowest, lowest + (1 << shift) - 1
+
+
+class LatencyHistogram:
+    """
+    A histogram of latencies, in nanoseconds.
+
+    Attributes
+    =======================================================================
+    count, total, minimum, maximum
+        The number, sum, and extremes of the recorded latencies
+
+    Methods
+    =======================================================================
+    record(value)
+        Add a latency to the histogram.
+
+    percentile(p)
+        Returns the latency that p percent of recorded latencies are at or below.
+    """
+
+    def __init__(self):
+        self.counts = {}
+        self.count = 0
+        self.total = 0
+        self.minimum = None
+        self.maximum = None
+
+    def record(self, value):
+        """
+        value: (int) a latency in nanoseconds
+        """
+        index = bucket_index(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+
+    def percentile(self, p):
+        """
+        Returns the latency that p percent of the recorded latencies are at or
+        below, to the precision of the histogram's buckets.
+
+        p: (float) between 0 and 100
+        returns: (int) the latency in nanoseconds, or 0 if nothing is recorded
+        """
+        if not self.count:
+            return 0
+        target = max(1, -(-self.count * p // 100))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                return min(bucket_range(index)[1], self.maximum)
+        return self.maximum
+
+    def mean(self):
+        return self.total / self.count if self.count else 0
+
+
+class LatencyRecorder:
+    """
+    A class for timing the stages of handling keypresses. When it is not
+    enabled, every method returns straight away without reading the clock.
+
+    Typical use, where each lap() times the stage since the previous one:
+        start = recorder.start()
+        ... call on the student ...
+        lap = recorder.lap("call_on", start)
+        ... update the queue ...
+        lap = recorder.lap("take_off_deck", lap)
+
+    Attributes
+    =======================================================================
+    enabled
+        Is anything being timed?
+
+    histograms
+        Maps each stage's name to its LatencyHistogram, in the order the
+        stages were first recorded
+
+    Methods
+    =======================================================================
+    start()
+        Returns the current time, to start timing from.
+
+    lap(stage, since)
+        Record the time taken by a stage, and return the current time.
+
+    since(stage, start)
+        Record the time from start until now, without starting a new lap.
+
+    report()
+        Returns a human-readable report of every stage's latencies.
+
+    dump(filename)
+        Write the report to a file.
+    """
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.histograms = {}
+
+    def start(self):
+        """
+        returns: (int) the current time in nanoseconds, or None if disabled
+        """
+        if not self.enabled:
+            return None
+        return time.perf_counter_ns()
+
+    def lap(self, stage, since):
+        """
+        Record the time from <since> until now as one latency of <stage>.
+
+        stage: (string) the name of the stage
+        since: (int) the time the stage started, from start() or lap()
+        returns: (int) the current time, which the next stage starts from
+        """
+        if since is None:
+            return None
+        now = time.perf_counter_ns()
+        self._record(stage, now - since)
+        return now
+
+    def since(self, stage, start):
+        """
+        Record the time from <start> until now as one latency of <stage>,
+        such as the total time of a keypress.
+        """
+        self.lap(stage, start)
+
+    def _record(self, stage, value):
+        histogram = self.histograms.get(stage)
+        if histogram is None:
+            histogram = self.histograms[stage] = LatencyHistogram()
+        histogram.record(value)
+
+    def report(self):
+        """
+        returns: (string) a table of each stage's latency percentiles in
+        microseconds, followed by each stage's non-empty buckets
+        """
+        lines = [f"Latency report, {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+                 "All times are in microseconds.", ""]
+        columns = ["count", "min", "mean"] + [f"p{p:g}" for p in REPORT_PERCENTILES] + ["max"]
+        lines.append(f"{'stage':<20}" + "".join(f"{column:>11}" for column in columns))
+        for stage, histogram in self.histograms.items():
+            values = ([histogram.minimum, histogram.mean()]
+                      + [histogram.percentile(p) for p in REPORT_PERCENTILES]
+                      + [histogram.maximum])
+            lines.append(f"{stage:<20}{histogram.count:>11}"
+                         + "".join(f"{value / 1000:>11.1f}" for value in values))
+        for stage, histogram in self.histograms.items():
+            lines.append("")
+            lines.append(f"{stage} buckets (from, to, count):")
+            for index in sorted(histogram.counts):
+                lowest, highest = bucket_range(index)
+                lines.append(f"{lowest / 1000:.3f}\t{highest / 1000:.3f}\t{histogram.counts[index]}")
+        return "\n".join(lines) + "\n"
+
+    def dump(self, filename):
+        """
+        Write the report to a file, replacing any earlier report. Nothing is
+        written if nothing has been recorded.
+
+        filename: (string)
+        """
+        if not self.histograms:
+            return
+        with open(filename, "w") as f:
+            f.write(self.report())
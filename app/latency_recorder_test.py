@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+
+###############################################################################
+"""
+Script Name:    LatencyRecorder Testing Script
+
+Description:    This script can be run at the command line to test the latency
+                histograms and recorder.
+
+Author:         CoolCall Team
+
+Last Edited:    10/18/2026
+Last Edit By:   CoolCall Team
+"""
+###############################################################################
+import os
+import random
+from latency_recorder import LatencyHistogram, LatencyRecorder, bucket_index, bucket_range
+from test_support import temporary_directory
+###############################################################################
+
+def test_buckets():
+    previous = -1
+    for value in list(range(5000)) + [random.randrange(10 ** 12) for _ in range(5000)]:
+        lowest, highest = bucket_range(bucket_index(value))
+        assert lowest <= value <= highest
+        # Every bucket is within 1/16 of its values.
+        assert highest - lowest <= lowest / 16
+    for index in range(2000):
+        lowest, highest = bucket_range(index)
+        assert lowest == previous + 1
+        previous = highest
+
+def test_percentiles():
+    histogram = LatencyHistogram()
+    values = list(range(1, 100001))
+    random.shuffle(values)
+    for value in values:
+        histogram.record(value)
+    assert histogram.count == 100000 and histogram.maximum == 100000
+    for p in (50, 90, 99, 99.9):
+        exact = 100000 * p / 100
+        assert exact <= histogram.percentile(p) <= exact * 1.07
+    assert histogram.percentile(100) == 100000
+
+def test_recorder():
+    disabled = LatencyRecorder(enabled=False)
+    assert disabled.lap("stage", disabled.start()) is None
+    assert disabled.histograms == {}
+
+    recorder = LatencyRecorder()
+    for _ in range(10):
+        start = recorder.start()
+        lap = recorder.lap("first", start)
+        recorder.lap("second", lap)
+        recorder.since("total", start)
+    assert list(recorder.histograms) == ["first", "second", "total"]
+    assert all(histogram.count == 10 for histogram in recorder.histograms.values())
+    filename = os.path.join(temporary_directory(), "latency.txt")
+    recorder.dump(filename)
+    with open(filename) as f:
+        assert "total" in f.read()
+
+if __name__ == "__main__":
+    test_buckets()
+    test_percentiles()
+    test_recorder()
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+
+###############################################################################
+"""
+Script Name:    Daily Log Analytics
+
+Description:    Reads back the daily log files written by the LogManager
+                (daily_log--YYYY-MM-DD.txt), and adds up the cold calls in
+                them: the number of times each student was called on and
+                flagged, and the number of cold calls and flags on each day.
+
+                The log files are shared out between a pool of processes.
+                Each file is read one line at a time, and each worker only
+                returns the counts for its file, so memory use depends on the
+                number of students and days, not on the size of the archive.
+                Only files whose dates are in the requested range are read.
+                Each course keeps its logs in its own directory, so only the
+                given directory is searched, not its subdirectories; point
+                --logs at a course's logs to add up that course.
+
+                Usage:
+                    python3 log_analytics.py [--logs ../logs] [--from 2022-01-01]
+                                             [--to 2022-03-31] [--processes 4]
+
+Authors:        CoolCall Team
+
+Last Edited:    10/18/2026
+Last Edit By:   CoolCall Team
+"""
+###############################################################################
+from multiprocessing import Pool
+from datetime import date
+from constants import *
+import argparse
+import os
+###############################################################################
+
+def log_file_day(filename):
+    """
+    filename: (string) the path of a file
+    returns: (date) the day of a daily log file, from its name, or None if
+    the file is not a daily log file
+    """
+    name = os.path.basename(filename)
+    prefix = f"{DAILY_LOG_FILE_NAME_PREFIX}--"
+    if not (name.startswith(prefix) and name.endswith(".txt")):
+        return None
+    try:
+        return date.fromisoformat(name[len(prefix):-len(".txt")])
+    except ValueError:
+        return None
+
+
+def find_log_files(logs_location, first_day=None, last_day=None):
+    """
+    Find the daily log files in a directory, without opening them. The
+    logs of other courses, in subdirectories, are not included.
+
+    logs_location: (string) the directory to search
+    first_day, last_day: (date) only include files from these days, and the
+    days in between (all files by default)
+    returns: (list) the paths of the log files, oldest first
+    """
+    found = []
+    with os.scandir(logs_location) as entries:
+        for entry in entries:
+            day = log_file_day(entry.name)
+            if day is None or not entry.is_file():
+                continue
+            if (first_day is None or day >= first_day) and (last_day is None or day <= last_day):
+                found.append((day, entry.path))
+    return [filename for _, filename in sorted(found)]
+
+
+def scan_log_file(filename):
+    """
+    Count the cold calls in one daily log file, reading it a line at a time.
+    Each line is a cold call, of this form:
+        'X    Fatima Patel <fpatel@uoregon.edu>'
+    where the X (and the tab after it) marks a flagged cold call.
+
+    filename: (string) the path of the log file
+    returns: (tuple) the day of the file, and a dictionary mapping each
+    student, as "First Last <email>", to [times called, times flagged]
+    """
+    students = {}
+    with open(filename) as f:
+        # Skip the heading and date lines.
+        next(f, None)
+        next(f, None)
+        for line in f:
+            response_code, separator, student = line.rstrip("\n").partition("\t")
+            if not separator or not student:
+                continue
+            counts = students.get(student)
+            if counts is None:
+                counts = students[student] = [0, 0]
+            counts[0] += 1
+            if response_code == "X":
+                counts[1] += 1
+    return log_file_day(filename), students
+
+
+class LogAnalytics():
+    """
+    The cold calls in a set of daily log files, added up.
+
+    Attributes
+    =======================================================================
+    students
+        A dictionary mapping each student, as "First Last <email>", to
+        [times called, times flagged].
+
+    days
+        A dictionary mapping each day to [cold calls, flags].
+
+    Methods
+    =======================================================================
+    add(day, students)
+        Add the counts from one log file.
+
+    total()
+        Returns the total number of cold calls and flags.
+    """
+
+    def __init__(self):
+        self.students = {}
+        self.days = {}
+
+    def add(self, day, students):
+        """
+        Add the counts from one log file.
+
+        day: (date) the day of the log file
+        students: (dict) the counts from scan_log_file()
+        """
+        day_counts = self.days.setdefault(day, [0, 0])
+        for student, (called, flagged) in students.items():
+            counts = self.students.setdefault(student, [0, 0])
+            counts[0] += called
+            counts[1] += flagged
+            day_counts[0] += called
+            day_counts[1] += flagged
+
+    def total(self):
+        """
+        returns: (tuple) the total number of cold calls and flags
+        """
+        return (sum(called for called, _ in self.days.values()),
+                sum(flagged for _, flagged in self.days.values()))
+
+
+def analyze_logs(logs_location=LOGS_LOCATION, first_day=None, last_day=None, processes=None):
+    """
+    Add up the cold calls in every daily log file in a date range, reading
+    the files across a pool of processes.
+
+    logs_location: (string) the directory of log files
+    first_day, last_day: (date) the date range (all files by default)
+    processes: (int) the number of worker processes; one per core by default
+    returns: (LogAnalytics) the combined counts
+    """
+    filenames = find_log_files(logs_location, first_day, last_day)
+    analytics = LogAnalytics()
+    processes = min(processes or os.cpu_count() or 1, len(filenames))
+    if processes <= 1:
+        for filename in filenames:
+            analytics.add(*scan_log_file(filename))
+        return analytics
+
+    with Pool(processes) as pool:
+        # Each daily log is small, so several are handed out at once; results
+        # are merged as they arrive, so only a few are held at a time.
+        chunksize = max(1, len(filenames) // (processes * 4))
+        for day, students in pool.imap_unordered(scan_log_file, filenames, chunksize):
+            analytics.add(day, students)
+    return analytics
+
+
+def print_analytics(analytics):
+    print(f"{'Called':>8}{'Flagged':>9}  Student")
+    for student, (called, flagged) in sorted(analytics.students.items(),
+                                             key=lambda item: (-item[1][0], item[0])):
+        print(f"{called:>8}{flagged:>9}  {student}")
+    print()
+    print(f"{'Day':<12}{'Called':>8}{'Flagged':>9}")
+    for day, (called, flagged) in sorted(analytics.days.items()):
+        print(f"{day.isoformat():<12}{called:>8}{flagged:>9}")
+    called, flagged = analytics.total()
+    print(f"{'Total':<12}{called:>8}{flagged:>9}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Add up the cold calls in the daily log files.")
+    parser.add_argument("--logs", default=LOGS_LOCATION,
+                        help="directory of one course's daily log files")
+    parser.add_argument("--from", dest="first_day", type=date.fromisoformat, default=None,
+                        help="first day to include, as YYYY-MM-DD")
+    parser.add_argument("--to", dest="last_day", type=date.fromisoformat, default=None,
+                        help="last day to include, as YYYY-MM-DD")
+    parser.add_argument("--processes", type=int, default=None,
+                        help="number of worker processes (default: one per core)")
+    args = parser.parse_args()
+
+    print_analytics(analyze_logs(args.logs, args.first_day, args.last_day, args.processes))
+
+
+if __name__ == "__main__":
+    main()
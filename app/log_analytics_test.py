@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+
+###############################################################################
+"""
+Script Name:    Daily Log Analytics Testing Script
+
+Description:    This script can be run at the command line to test adding up
+                the daily log files. The log files are written to a temporary
+                directory.
+
+Author:         CoolCall Team
+
+Last Edited:    10/18/2026
+Last Edit By:   CoolCall Team
+"""
+###############################################################################
+import os
+import random
+from datetime import date, timedelta
+from log_analytics import analyze_logs, find_log_files
+from constants import DAILY_LOG_HEADING, DAILY_LOG_FILE_NAME_PREFIX
+from test_support import temporary_directory
+###############################################################################
+
+def write_logs(directory, days, students):
+    """
+    Write a daily log file for each day, and return the calls in them as
+    (day, student, flagged) tuples.
+    """
+    calls = []
+    for day in days:
+        filename = os.path.join(directory, f"{DAILY_LOG_FILE_NAME_PREFIX}--{day.isoformat()}.txt")
+        with open(filename, "w") as f:
+            f.write(f"{DAILY_LOG_HEADING}\n{day.isoformat()}\n")
+            for _ in range(random.randrange(20)):
+                student = random.choice(students)
+                flagged = random.random() < 0.3
+                f.write(f"{'X' if flagged else ''}\t{student}\n")
+                calls.append((day, student, flagged))
+    return calls
+
+def expected(calls, days):
+    students, days = {}, {day: [0, 0] for day in days}
+    for day, student, flagged in calls:
+        for counts in (students.setdefault(student, [0, 0]), days.setdefault(day, [0, 0])):
+            counts[0] += 1
+            counts[1] += flagged
+    return students, days
+
+def test_matches_single_process():
+    directory = temporary_directory()
+    os.makedirs(os.path.join(directory, "courses", "cis422"))
+    students = [f"First{i} Last{i} <s{i}@uoregon.edu>" for i in range(12)]
+    first_day = date(2021, 9, 27)
+    days = [first_day + timedelta(days=i) for i in range(0, 200, 2)]
+    calls = write_logs(directory, days, students)
+    # The logs of another course are not counted.
+    write_logs(os.path.join(directory, "courses", "cis422"), days, students)
+    with open(os.path.join(directory, "summary.txt"), "w") as f:
+        f.write("not a daily log\n")
+
+    for processes in (1, 3):
+        analytics = analyze_logs(directory, processes=processes)
+        assert (analytics.students, analytics.days) == expected(calls, days)
+        # Every day has a log file, even if nobody was called on.
+        assert sorted(analytics.days) == days
+        assert analytics.total() == (len(calls), sum(flagged for _, _, flagged in calls))
+
+def test_date_range():
+    directory = temporary_directory()
+    students = ["Fatima Patel <fpatel@uoregon.edu>", "Ian Ianson <iianson@uoregon.edu>"]
+    days = [date(2022, 1, 1) + timedelta(days=i) for i in range(60)]
+    calls = write_logs(directory, days, students)
+    first, last = date(2022, 1, 10), date(2022, 2, 3)
+    assert len(find_log_files(directory, first, last)) == 25
+    analytics = analyze_logs(directory, first, last, processes=2)
+    assert (analytics.students, analytics.days) == expected(
+        [call for call in calls if first <= call[0] <= last], days[9:34])
+
+if __name__ == "__main__":
+    test_matches_single_process()
+    test_date_range()
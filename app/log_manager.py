@@ -16,9 +16,13 @@ Last Edit By:   Amy Reichold
 """
 ###############################################################################
 from student import Student
+from summary_store import SummaryStore
+from daily_log_writer import DailyLogWriter
+from call_history_log import CallHistoryLog
+from persistence_worker import write_file_atomically
 from datetime import datetime
 from constants import *
-import os
+import time
 ###############################################################################
 
 class LogManager():
@@ -28,7 +32,28 @@ class LogManager():
     Attributes
     =======================================================================
     filename
-        The name of the output file to write to
+        The name of the summary file to write to, in the logs directory
+
+    logs_location
+        The directory that the summary, summary store and daily logs are kept in
+
+    summary_store
+        A SummaryStore holding each student's cold call statistics, which is
+        updated on every cold call.
+
+    summary_dirty
+        Has a cold call been recorded since the summary file was last written?
+
+    daily_log
+        A DailyLogWriter that keeps today's log file open between cold calls.
+
+    call_history
+        A CallHistoryLog that every cold call is appended to, for queries by
+        student or by date.
+
+    persistence
+        A PersistenceWorker that writes the summary file and call history log
+        in the background, or None to write them straight away.
 
     Methods
     =======================================================================
@@ -36,94 +61,187 @@ class LogManager():
         Called from the Instructor Interaction Model each time a student is
         cold called. 
 
+    write_batch(students, calls)
+        Called when several students are cold called at once.
+
+    write_summary()
+        Rewrites the summary performance file from the recorded statistics.
+
+    students_changed()
+        Called when students are added to, removed from, or changed in the queue.
+
     write_logfile(student, flagged)
 
+    close()
+        Writes any outstanding summary and log lines, and closes the files.
+
     """
 
-    def __init__(self, filename):
+    def __init__(self, filename, logs_location=None, persistence=None):
         # filename 
         self.filename = filename
+        self.logs_location = logs_location or LOGS_LOCATION
+        self.persistence = persistence
+        self.summary_store = None
+        self.summary_dirty = False
+        self.daily_log = None
+        self.call_history = None
+        # The students that the summary file lists, as last passed to write()
+        self._students = None
+        self._needs_bind = False
 
     def write(self, students, called_student: Student, flagged: bool):
         """ 
-        Overwrites previous summary performance file (if it exists) with updated information.
-        Writes cold call information to the Daily Log Manager.
+        Records the cold call in the summary store, and writes cold call
+        information to the Daily Log Manager. The summary performance file
+        itself is only rewritten by write_summary().
             
         students: (list) a list of Student objects
         called_student: (Student) a specific Student that has been cold called
         flagged: (boolean) has a flag been set for this cold call?
         """
+        self.write_batch(students, [(called_student, flagged)])
 
-        # create the file name and absolute file name
-        summary_filename = LOGS_LOCATION + "/summary.txt"
+    def write_batch(self, students, calls):
+        """
+        Records several cold calls made at once, such as a team in a group
+        activity, as write() does for one. The call history is appended, and
+        the daily log lines are written, together for the whole batch.
+
+        students: (list) a list of Student objects
+        calls: (list) a (Student, flagged) pair for each student cold called
+        """
+        if self.summary_store is None:
+            self.summary_store = SummaryStore(f"{self.logs_location}/{SUMMARY_STORE_FILE_NAME}")
+        if self.call_history is None:
+            self.call_history = CallHistoryLog(f"{self.logs_location}/{CALL_HISTORY_FILE_NAME}")
+        today = datetime.today().date()
+        now = time.time()
+        records = [(student, flagged, today, now) for student, flagged in calls]
+        if self.persistence is None:
+            self._append_call_history(records)
+        else:
+            # The worker only uses the students' UO IDs, which don't
+            # change when a student is called on.
+            self.persistence.submit(None, self._append_call_history, records)
+        if students is not self._students or self._needs_bind:
+            # A new set of students (on the first call, or after a roster
+            # import). Binding reads every student's history, which already
+            # includes these cold calls.
+            self._students = students
+            self._needs_bind = False
+            self.summary_store.bind(students)
+        else:
+            for student, flagged in calls:
+                self.summary_store.record_call(student, flagged, today)
+        self.summary_dirty = True
 
-        # open filename in overwrite mode
-        summary_file = open(summary_filename, "w")
+        # write to daily log file
+        if self.daily_log is None:
+            self.daily_log = DailyLogWriter(self.logs_location)
+        self.daily_log.write_lines([self._log_line(student, flagged) for student, flagged in calls])
+
+    def _append_call_history(self, records):
+        """
+        records: (list) the (student, flagged, day, timestamp) of each cold call
+        """
+        for record in records:
+            self.call_history.append(*record)
 
+    def students_changed(self):
+        """
+        Called when the students in the queue change, for example when a roster
+        is re-imported. The summary store is re-synced with the students on the
+        next cold call.
+        """
+        self._needs_bind = True
+
+    def write_summary(self):
+        """ 
+        Overwrites previous summary performance file (if it exists) with updated information.
+        This is called on demand, after a pause in cold calls, and at shutdown, rather
+        than after every cold call.
+        """
+        if self._students is None:
+            return
+        if self._needs_bind:
+            self.summary_store.bind(self._students)
+            self._needs_bind = False
+
+        # create the file name and absolute file name
+        summary_filename = f"{self.logs_location}/{self.filename}"
+
+        # The whole file is put together here, so that the persistence worker
+        # is only handed a string that can't change.
+        summary_lines = []
 
         # header
-        summary_file.write("Summary Performance File for Cold Call Assist program\n")
-        summary_file.write("|Total Times Called|    |Total Times Flagged|   |First Name|    |Last Name| |UO ID| |Email Address| |Phonetic Spelling| |Reveal Code|   |Dates Called|\n")
+        summary_lines.append("Summary Performance File for Cold Call Assist program\n")
+        summary_lines.append("|Total Times Called|    |Total Times Flagged|   |First Name|    |Last Name| |UO ID| |Email Address| |Phonetic Spelling| |Reveal Code|   |Dates Called|\n")
         
         # print all student information
-        for student in students:
-            studentline = f'{len(student.dates_called)}\t{student.total_num_flags}\t{student.first_name}\t{student.last_name}\t{student.UO_ID}\t{student.email_address}\t'
+        for student in self._students:
+            times_called, times_flagged, _ = self.summary_store.stats(student)
+            studentline = f'{times_called}\t{times_flagged}\t{student.first_name}\t{student.last_name}\t{student.UO_ID}\t{student.email_address}\t'
             studentline += f'{student.phonetic_spelling}\t{student.reveal_code}\t'
-            for date in student.dates_called:
-                studentline += f'{date} '
+            studentline += ''.join([f'{date} ' for date in student.dates_called])
             studentline += '\n'
-            summary_file.write(studentline)
+            summary_lines.append(studentline)
+
+        # overwrite the file, without ever leaving it half-written
+        if self.persistence is None:
+            write_file_atomically(summary_filename, ''.join(summary_lines))
+        else:
+            # A newer summary replaces one that is still waiting to be written.
+            self.persistence.submit(summary_filename, write_file_atomically,
+                                    summary_filename, ''.join(summary_lines))
+        self.summary_dirty = False
 
-        # closing file
-        summary_file.close()
-        
-        # write to daily log file
-        self.write_logfile(called_student, flagged)
-            
     def write_logfile(self, student, flagged: bool):
         """
         Writes a line to the daily log file, recording a cold call.
         The flagged argument determines whether to flag the cold call
-        with an 'X' or not.Creates daily log file if necessary with a heading
-        and today's date.
+        with an 'X' or not. The DailyLogWriter creates the daily log file
+        if necessary with a heading and today's date, and batches the lines
+        according to the flush policy in the constants file.
 
         student: (Student) a specific Student that has been cold called
         flagged: (boolean) has a flag been set for this cold call?
         """
-        # get date for creating the file name
-        date = datetime.today().strftime('%Y-%m-%d')
-
-        # create the file name and absolute file name
-        log_file_name = f'{LOGS_LOCATION}/{DAILY_LOG_FILE_NAME_PREFIX}--{date}.txt'
-
-        # this code has been commented out
-        """# check if directory exists
-        if not os.path.exists(DAILY_LOG_PATH):
-            os.makedirs(DAILY_LOG_PATH)
-        else:
-            # DAILY_LOG_PATH exists
-            pass"""
-        
-        # create the file with heading and date if it doesn't exist
-        if not os.path.exists(log_file_name):
-            with open(log_file_name, 'w') as f:
-                f.write(DAILY_LOG_HEADING + '\n')
-                f.write(date + '\n')
+        if self.daily_log is None:
+            self.daily_log = DailyLogWriter(self.logs_location)
+        self.daily_log.write_line(self._log_line(student, flagged))
 
+    def _log_line(self, student, flagged):
+        """
+        returns: (string) the daily log line that records a cold call
+        """
         # form the response code
         response_code = ''
         if flagged:
             response_code = 'X'
 
-        # append the cold call to the file, of this form:
+        # the cold call is written to the file in this form:
         # 'X    Fatima Patel <fpatel@uoregon.edu>'
         # (with no quotes)
-        cold_call = f'{response_code}\t'
-        cold_call += f'{student.first_name} {student.last_name}'
-        cold_call += f' <{student.email_address}>\n'
-        with open(log_file_name, 'a') as f:
-            f.write(cold_call)
-
-        return
-
+        return f'{response_code}\t{student.first_name} {student.last_name} <{student.email_address}>\n'
 
+    def close(self):
+        """
+        Writes the summary file if any cold calls have not made it there yet,
+        flushes the daily log, waits for the persistence worker, and closes the summary store and call history
+        log. Called when the program shuts down.
+        """
+        if self.daily_log is not None:
+            self.daily_log.close()
+        if self.summary_dirty:
+            self.write_summary()
+        if self.persistence is not None:
+            self.persistence.flush()
+        if self.call_history is not None:
+            self.call_history.close()
+            self.call_history = None
+        if self.summary_store is not None:
+            self.summary_store.close()
+            self.summary_store = None
+            self._students = None
@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+
+################################################################################
+"""
+Script Name:    Order Statistic Tree
+
+Description:    An indexable sequence for the CoolCall Program, used as the
+                storage behind the StudentQueue.
+
+                The sequence is stored as an implicit treap: a randomized
+                balanced binary tree, where every node also remembers the size
+                of its subtree. This lets us find the item at a given position,
+                insert an item at a given position, and remove a given item in
+                O(log n) time, instead of the O(n) time taken by a Python list.
+
+Authors:        CoolCall Team
+
+Last Edited:    10/18/2026
+Last Edit By:   CoolCall Team
+"""
+################################################################################
+import random
+################################################################################
+
+class _Node:
+	"""
+	A single node of the tree. Each node holds one item of the sequence.
+	"""
+	__slots__ = ("item", "priority", "size", "left", "right", "parent")
+
+	def __init__(self, item, priority):
+		self.item = item
+		self.priority = priority
+		self.size = 1
+		self.left = None
+		self.right = None
+		self.parent = None
+
+
+def _size(node):
+	return node.size if node else 0
+
+
+def _update(node):
+	"""
+	Recompute the size of a node after its children have changed, and point
+	the children back at it.
+	"""
+	node.size = 1 + _size(node.left) + _size(node.right)
+	if node.left:
+		node.left.parent = node
+	if node.right:
+		node.right.parent = node
+
+
+def _split(node, k):
+	"""
+	Split a tree into two trees: one holding the first k items, and one holding
+	the rest. The roots of the returned trees have no parent.
+	"""
+	if node is None:
+		return None, None
+	if _size(node.left) >= k:
+		left, node.left = _split(node.left, k)
+		_update(node)
+		node.parent = None
+		if left:
+			left.parent = None
+		return left, node
+	node.right, right = _split(node.right, k - _size(node.left) - 1)
+	_update(node)
+	node.parent = None
+	if right:
+		right.parent = None
+	return node, right
+
+
+def _merge(left, right):
+	"""
+	Join two trees, where every item of <left> comes before every item of
+	<right>. Returns the root of the joined tree.
+	"""
+	if left is None:
+		return right
+	if right is None:
+		return left
+	if left.priority > right.priority:
+		left.right = _merge(left.right, right)
+		_update(left)
+		return left
+	right.left = _merge(left, right.left)
+	_update(right)
+	return right
+
+
+class OrderStatisticTree:
+	"""
+	A sequence of unique, hashable items supporting the list operations used by
+	the StudentQueue in O(log n) time.
+
+	Every item is mapped to the node that holds it, so an item can be found
+	and removed without scanning the sequence.
+
+	Attributes
+	============================================================================
+	root
+		The root node of the treap, or None if the sequence is empty.
+
+	Methods
+	============================================================================
+	insert(index, item)
+		Insert an item before the given position.
+	remove(item)
+		Remove an item from the sequence.
+	pop(index)
+		Remove and return the item at the given position.
+	index(item)
+		Return the position of an item in the sequence.
+	find(item)
+		Return the stored item that is equal to the given item.
+	replace(old, new)
+		Put a new item in the place of an old one.
+	head(k)
+		Return a list of the first k items in the sequence.
+
+	The sequence also supports len(), iteration, "in", and indexing with a
+	non-negative or negative integer.
+	"""
+
+	def __init__(self, items=()):
+		"""
+		items: (iterable) the initial contents of the sequence, in order.
+		"""
+		# The priorities only need to be random; we use our own generator so
+		# that building the tree does not change the state of the random module.
+		self._random = random.Random()
+		self._nodes = {}
+		self.root = self._build(items)
+
+	def _build(self, items):
+		"""
+		Build a treap from a sequence of items in O(n) time, by keeping the
+		right spine of the tree on a stack.
+		"""
+		spine = []
+		for item in items:
+			if item in self._nodes:
+				raise ValueError(f"{item!r} is already in the sequence.")
+			node = _Node(item, self._random.random())
+			self._nodes[item] = node
+			last = None
+			while spine and spine[-1].priority < node.priority:
+				last = spine.pop()
+			node.left = last
+			if spine:
+				spine[-1].right = node
+			spine.append(node)
+		if not spine:
+			return None
+		root = spine[0]
+		# Fill in the sizes and parents, children before parents.
+		postorder = []
+		stack = [root]
+		while stack:
+			node = stack.pop()
+			postorder.append(node)
+			if node.left:
+				stack.append(node.left)
+			if node.right:
+				stack.append(node.right)
+		for node in reversed(postorder):
+			_update(node)
+		root.parent = None
+		return root
+
+	def __len__(self):
+		return _size(self.root)
+
+	def __contains__(self, item):
+		return item in self._nodes
+
+	def __iter__(self):
+		stack = []
+		node = self.root
+		while stack or node:
+			while node:
+				stack.append(node)
+				node = node.left
+			node = stack.pop()
+			yield node.item
+			node = node.right
+
+	def __getitem__(self, index):
+		return self._node_at(index).item
+
+	def _node_at(self, index):
+		"""
+		Find the node at a given position.
+		"""
+		if index < 0:
+			index += len(self)
+		if not 0 <= index < len(self):
+			raise IndexError("sequence index out of range")
+		node = self.root
+		while True:
+			left_size = _size(node.left)
+			if index < left_size:
+				node = node.left
+			elif index == left_size:
+				return node
+			else:
+				index -= left_size + 1
+				node = node.right
+
+	def head(self, k):
+		"""
+		Return a list of the first k items, in O(k + log n) time.
+
+		k: (int) the number of items to return.
+		"""
+		result = []
+		stack = []
+		node = self.root
+		while len(result) < k and (stack or node):
+			while node:
+				stack.append(node)
+				node = node.left
+			node = stack.pop()
+			result.append(node.item)
+			node = node.right
+		return result
+
+	def insert(self, index, item):
+		"""
+		Insert an item before the given position. As with list.insert, an index
+		past the end of the sequence appends the item.
+
+		index: (int) the position that the item will have after the insert.
+		item: the item to insert. It must not already be in the sequence.
+		"""
+		if item in self._nodes:
+			raise ValueError(f"{item!r} is already in the sequence.")
+		if index < 0:
+			index = max(0, index + len(self))
+		node = _Node(item, self._random.random())
+		self._nodes[item] = node
+		left, right = _split(self.root, index)
+		self.root = _merge(_merge(left, node), right)
+		self.root.parent = None
+
+	def remove(self, item):
+		"""
+		Remove an item from the sequence.
+
+		item: the item to remove. Raises ValueError if it is not present.
+		"""
+		try:
+			node = self._nodes.pop(item)
+		except KeyError:
+			raise ValueError(f"{item!r} is not in the sequence.") from None
+		self._unlink(node)
+
+	def pop(self, index=-1):
+		"""
+		Remove and return the item at the given position.
+
+		index: (int) the position of the item, the last item by default.
+		"""
+		node = self._node_at(index)
+		del self._nodes[node.item]
+		self._unlink(node)
+		return node.item
+
+	def _unlink(self, node):
+		"""
+		Take a node out of the tree by joining its children in its place, then
+		fix the sizes of its ancestors.
+		"""
+		child = _merge(node.left, node.right)
+		parent = node.parent
+		if child:
+			child.parent = parent
+		if parent is None:
+			self.root = child
+		else:
+			if parent.left is node:
+				parent.left = child
+			else:
+				parent.right = child
+			while parent:
+				parent.size -= 1
+				parent = parent.parent
+
+	def find(self, item):
+		"""
+		Return the item in the sequence that is equal to the given item, or
+		None if there is no such item. This is useful when equal items can
+		carry different data.
+
+		item: the item to look for.
+		"""
+		node = self._nodes.get(item)
+		return node.item if node else None
+
+	def replace(self, old, new):
+		"""
+		Put a new item in the position of an old item, in O(1) time.
+
+		old: the item to replace. Raises ValueError if it is not present.
+		new: the item to put in its place. It must not already be in the
+		sequence, unless it is equal to <old>.
+		"""
+		try:
+			node = self._nodes.pop(old)
+		except KeyError:
+			raise ValueError(f"{old!r} is not in the sequence.") from None
+		if new in self._nodes:
+			self._nodes[old] = node
+			raise ValueError(f"{new!r} is already in the sequence.")
+		node.item = new
+		self._nodes[new] = node
+
+	def index(self, item):
+		"""
+		Return the position of an item in the sequence.
+
+		item: the item to find. Raises ValueError if it is not present.
+		"""
+		try:
+			node = self._nodes[item]
+		except KeyError:
+			raise ValueError(f"{item!r} is not in the sequence.") from None
+		rank = _size(node.left)
+		while node.parent:
+			if node is node.parent.right:
+				rank += _size(node.parent.left) + 1
+			node = node.parent
+		return rank
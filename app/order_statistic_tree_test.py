@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+
+###############################################################################
+"""
+Script Name:    OrderStatisticTree Testing Script
+
+Description:    This script can be run at the command line to test the
+                OrderStatisticTree against an ordinary Python list.
+
+Author:         CoolCall Team
+
+Last Edited:    10/18/2026
+Last Edit By:   CoolCall Team
+"""
+###############################################################################
+import random
+from order_statistic_tree import OrderStatisticTree
+###############################################################################
+
+def test_build_and_index():
+	items = list(range(100))
+	tree = OrderStatisticTree(items)
+	assert len(tree) == 100
+	assert list(tree) == items
+	assert tree[0] == 0 and tree[57] == 57 and tree[-1] == 99
+	assert tree.index(42) == 42
+	assert tree.head(4) == [0, 1, 2, 3]
+	assert tree.head(500) == items
+
+def test_matches_list():
+	rng = random.Random(422)
+	expected = list(range(50))
+	tree = OrderStatisticTree(expected)
+	next_item = 50
+	for _ in range(2000):
+		operation = rng.randrange(3)
+		if operation == 0 and expected:
+			item = rng.choice(expected)
+			expected.remove(item)
+			tree.remove(item)
+		elif operation == 1 and expected:
+			index = rng.randrange(len(expected))
+			assert tree.pop(index) == expected.pop(index)
+		else:
+			index = rng.randint(0, len(expected))
+			expected.insert(index, next_item)
+			tree.insert(index, next_item)
+			next_item += 1
+		assert len(tree) == len(expected)
+	assert list(tree) == expected
+	for position, item in enumerate(expected):
+		assert tree.index(item) == position
+
+def test_errors():
+	tree = OrderStatisticTree(["a", "b"])
+	for bad_call in (lambda: tree.remove("c"), lambda: tree.index("c"),
+					 lambda: tree.insert(0, "a")):
+		try:
+			bad_call()
+			assert False
+		except ValueError:
+			pass
+	try:
+		tree[2]
+		assert False
+	except IndexError:
+		pass
+
+if __name__ == "__main__":
+	test_build_and_index()
+	test_matches_list()
+	test_errors()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+
+###############################################################################
+"""
+Script Name:    Persistence Worker
+
+Description:    The PersistenceWorker Class for the CoolCall Program.
+                Runs file writes on a background thread, so that a slow disk
+                (or a network home directory) never freezes the window while
+                a cold call is saved.
+
+                The controller hands the worker immutable data, such as the
+                pickled bytes of the queue or the text of the summary file,
+                together with the function that writes it. Writes are given a
+                key; if a write is still waiting when another with the same
+                key arrives, only the newer one is made, so a burst of rapid
+                keypresses is saved with a single write. flush() waits until
+                everything handed over so far is on disk.
+
+Authors:        CoolCall Team
+
+Last Edited:    10/18/2026
+Last Edit By:   CoolCall Team
+"""
+###############################################################################
+from collections import OrderedDict
+import itertools
+import threading
+import traceback
+import atexit
+import os
+###############################################################################
+
+def write_file_atomically(filename, data):
+    """
+    Write a file under a temporary name, then rename it over the old file,
+    so a crash can never leave a half-written file.
+
+    filename: (string) the file to write
+    data: (bytes or string) the new contents of the file
+    """
+    mode = "wb" if isinstance(data, bytes) else "w"
+    with open(filename + ".tmp", mode) as f:
+        f.write(data)
+    os.replace(filename + ".tmp", filename)
+
+
+class PersistenceWorker():
+    """
+    A background thread that makes file writes in the order they were
+    handed over, combining waiting writes that have the same key.
+
+    Attributes
+    =======================================================================
+    writes
+        The number of writes made so far.
+
+    coalesced
+        The number of writes that were dropped because a newer write with
+        the same key arrived before they were made.
+
+    Methods
+    =======================================================================
+    submit(key, function, *args)
+        Hand over a write, to be made on the worker's thread.
+
+    flush()
+        Wait until every write handed over so far has been made.
+
+    close()
+        Flush, and stop the worker's thread.
+    """
+
+    def __init__(self):
+        self.writes = 0
+        self.coalesced = 0
+        # The writes waiting to be made, in order, by key.
+        self._pending = OrderedDict()
+        # Keys for writes that must never be combined with another write.
+        self._unique_keys = itertools.count()
+        self._busy = False
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="PersistenceWorker", daemon=True)
+        self._thread.start()
+        # Anything still waiting is written if the program exits without
+        # closing the worker.
+        atexit.register(self.close)
+
+    def submit(self, key, function, *args):
+        """
+        Hand over a write. The arguments must not be changed afterwards, as
+        the write is made later, on another thread.
+
+        key: a key for the write, such as the name of the file it replaces. A
+        waiting write with the same key is replaced by this one, which is moved
+        to the back of the line. If the key is None, the write is always made.
+        function: the function that makes the write
+        args: the arguments to call the function with
+        """
+        if key is None:
+            key = ("unique", next(self._unique_keys))
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("The persistence worker has been closed.")
+            if self._pending.pop(key, None) is not None:
+                self.coalesced += 1
+            self._pending[key] = (function, args)
+            self._condition.notify_all()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if not self._pending:
+                    return
+                _, (function, args) = self._pending.popitem(last=False)
+                self._busy = True
+            try:
+                function(*args)
+            except Exception:
+                # A failed write must not stop the writes after it.
+                traceback.print_exc()
+            with self._condition:
+                self._busy = False
+                self.writes += 1
+                self._condition.notify_all()
+
+    def flush(self):
+        """
+        Wait until every write handed over so far has been made. Called
+        before a roster is imported or exported, and when the program closes.
+        """
+        with self._condition:
+            while self._pending or self._busy:
+                self._condition.wait()
+
+    def close(self):
+        """
+        Make every waiting write, and stop the worker's thread.
+        """
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+        atexit.unregister(self.close)
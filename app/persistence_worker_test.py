@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+
+###############################################################################
+"""
+Script Name:    PersistenceWorker Testing Script
+
+Description:    This script can be run at the command line to test writing the
+                queue and logs on a background thread. All files are written
+                to temporary directories.
+
+Author:         CoolCall Team
+
+Last Edited:    10/18/2026
+Last Edit By:   CoolCall Team
+"""
+###############################################################################
+import os
+import threading
+from persistence_worker import PersistenceWorker
+from student_queue import StudentQueue
+from log_manager import LogManager
+from call_history_log import CallHistoryLog
+from test_support import make_roster, temporary_queue_file, call_students, history, temporary_directory
+###############################################################################
+
+def test_writes_are_coalesced():
+    worker = PersistenceWorker()
+    release = threading.Event()
+    written = []
+    # Hold up the worker, so that the writes below wait in line.
+    worker.submit(None, release.wait)
+    for i in range(100):
+        worker.submit(None, written.append, ("event", i))
+        worker.submit("queue", written.append, ("queue", i))
+    release.set()
+    worker.flush()
+    # Every event is written in order, and only the newest queue write,
+    # after all of them.
+    assert written == [("event", i) for i in range(100)] + [("queue", 99)]
+    assert worker.coalesced == 99
+    worker.close()
+
+def test_failed_write_does_not_stop_the_worker():
+    worker = PersistenceWorker()
+    written = []
+    worker.submit(None, os.remove, os.path.join(temporary_directory(), "missing"))
+    worker.submit(None, written.append, 1)
+    worker.close()
+    assert written == [1]
+
+def test_queue_saved_in_background():
+    filename = temporary_queue_file()
+    worker = PersistenceWorker()
+    queue = StudentQueue(filename, worker)
+    queue.queue_from_roster(make_roster(30))
+    # Enough cold calls for the journal to be compacted along the way.
+    call_students(queue, 450)
+    queue.close()
+
+    loaded = StudentQueue(filename)
+    assert loaded.load_queue_from_file(filename, make_roster(30))
+    assert history(loaded) == history(queue)
+    loaded.close()
+    worker.close()
+
+def test_logs_written_in_background():
+    logs_location = temporary_directory()
+    worker = PersistenceWorker()
+    students = sorted(make_roster(5).students, key=lambda student: student.UO_ID)
+    log_manager = LogManager("summary.txt", logs_location, worker)
+    for student in students[:2]:
+        student.call_on(True)
+        log_manager.write(students, student, True)
+    log_manager.close()
+    worker.close()
+    with open(os.path.join(logs_location, "summary.txt")) as f:
+        assert [line.split("\t")[:2] for line in f.readlines()[2:]] == [
+            ["1", "1"], ["1", "1"], ["0", "0"], ["0", "0"], ["0", "0"]]
+    log = CallHistoryLog(os.path.join(logs_location, "call_history.dat"))
+    assert [log.times_called(student) for student in students] == [1, 1, 0, 0, 0]
+    log.close()
+
+if __name__ == "__main__":
+    test_writes_are_coalesced()
+    test_failed_write_does_not_stop_the_worker()
+    test_queue_saved_in_background()
+    test_logs_written_in_background()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+
+################################################################################
+"""
+Script Name:    Queue Journal
+
+Description:    An append-only journal of cold calls for the CoolCall Program.
+
+                Instead of re-pickling the whole StudentQueue after every cold
+                call, the StudentQueue can append one small, fixed-size record
+                to this journal. On start-up, the queue is rebuilt from the
+                last saved snapshot of the queue, followed by the records in
+                the journal.
+
+                The journal starts with a header holding a checksum of the
+                snapshot it belongs to, so that records are never replayed
+                onto a snapshot that already contains them. Each record ends
+                with its own checksum, so a record that was only partly written
+                when the program crashed is detected and thrown away.
+
+Authors:        CoolCall Team
+
+Last Edited:    10/18/2026
+Last Edit By:   CoolCall Team
+"""
+################################################################################
+from collections import namedtuple
+from constants import *
+import struct
+import zlib
+import os
+################################################################################
+
+# The header: a magic string, the format version, and the snapshot checksum.
+HEADER = struct.Struct("<4sHI")
+MAGIC = b"CCQJ"
+VERSION = 1
+
+# A record: the student's fingerprint, their old and new positions in the
+# queue, the record flags, the time of the cold call, and the record checksum.
+RECORD = struct.Struct("<IIIBdI")
+RECORD_BODY = struct.Struct("<IIIBd")
+
+# Bits of the record flags.
+CALLED = 1   # The student was called on (and not just moved in the queue).
+FLAGGED = 2  # The cold call was flagged.
+
+JournalRecord = namedtuple(
+	"JournalRecord", ["student_ref", "old_position", "new_position", "flags", "timestamp"])
+
+
+class QueueJournal:
+	"""
+	A class to append cold call records to a journal file, and read them back.
+
+	Attributes
+	============================================================================
+	filename
+		The path of the journal file.
+	num_records
+		The number of records in the journal since it was last reset.
+
+	Methods
+	============================================================================
+	reset(snapshot_checksum)
+		Empty the journal, and tie it to a newly saved snapshot.
+	append(student_ref, old_position, new_position, flags, timestamp)
+		Add a record to the end of the journal.
+	read(snapshot_checksum)
+		Return the records that belong to the given snapshot.
+	close()
+		Close the journal file.
+	"""
+
+	def __init__(self, filename, fsync=QUEUE_JOURNAL_FSYNC):
+		"""
+		filename: (string) the path of the journal file.
+		fsync: (boolean) should every record be forced onto the disk?
+		"""
+		self.filename = filename
+		self.fsync = fsync
+		self.num_records = 0
+		self._file = None
+
+	def reset(self, snapshot_checksum):
+		"""
+		Empty the journal, and tie it to a newly saved snapshot. The new journal
+		is written to a temporary file first, so a crash can never leave a
+		journal without a header.
+
+		snapshot_checksum: (int) the CRC-32 of the snapshot file's contents.
+		"""
+		self.close()
+		temp_filename = self.filename + ".tmp"
+		with open(temp_filename, "wb") as f:
+			f.write(HEADER.pack(MAGIC, VERSION, snapshot_checksum))
+		os.replace(temp_filename, self.filename)
+		self.num_records = 0
+
+	def append(self, student_ref, old_position, new_position, flags, timestamp):
+		"""
+		Add a record to the end of the journal.
+
+		student_ref: (int) the fingerprint of the student who was moved.
+		old_position, new_position: (int) the student's positions in the queue.
+		flags: (int) a combination of CALLED and FLAGGED.
+		timestamp: (float) the time of the cold call, in seconds since the epoch.
+		"""
+		body = RECORD_BODY.pack(student_ref, old_position, new_position, flags, timestamp)
+		if self._file is None:
+			self._file = open(self.filename, "ab")
+		self._file.write(body + struct.pack("<I", zlib.crc32(body)))
+		self._file.flush()
+		if self.fsync:
+			os.fsync(self._file.fileno())
+		self.num_records += 1
+
+	def read(self, snapshot_checksum):
+		"""
+		Read the records in the journal. If the journal belongs to a different
+		snapshot, there are no records to replay. If the last record is torn or
+		corrupt, it is cut off the end of the file.
+
+		snapshot_checksum: (int) the CRC-32 of the snapshot file's contents.
+		returns: (list) a list of JournalRecords, oldest first.
+		"""
+		self.close()
+		try:
+			with open(self.filename, "rb") as f:
+				data = f.read()
+		except FileNotFoundError:
+			return []
+		if len(data) < HEADER.size:
+			return []
+		magic, version, checksum = HEADER.unpack_from(data)
+		if magic != MAGIC or version != VERSION or checksum != snapshot_checksum:
+			return []
+
+		records = []
+		offset = HEADER.size
+		while offset + RECORD.size <= len(data):
+			fields = RECORD.unpack_from(data, offset)
+			if zlib.crc32(data[offset:offset + RECORD_BODY.size]) != fields[-1]:
+				break
+			records.append(JournalRecord(*fields[:-1]))
+			offset += RECORD.size
+		if offset != len(data):
+			# The program stopped in the middle of writing a record.
+			with open(self.filename, "r+b") as f:
+				f.truncate(offset)
+		self.num_records = len(records)
+		return records
+
+	def close(self):
+		"""
+		Close the journal file, if it is open.
+		"""
+		if self._file is not None:
+			self._file.close()
+			self._file = None
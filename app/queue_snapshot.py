@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+
+################################################################################
+"""
+Script Name:    Queue Snapshot
+
+Description:    The binary queue file format for the CoolCall Program.
+
+                A snapshot of the queue does not store Student objects. The
+                students' details are already in the roster, so the snapshot
+                only stores the order of the queue, as positions in the
+                roster, and each student's call history. Everything is stored
+                in arrays, which are written and read in bulk:
+
+                    header        magic, version, roster fingerprint, number
+                                  of students, number of cold calls
+                    order         the roster index of each student in the
+                                  queue, front to back (uint32)
+                    num_flags     each student's number of flags (uint32)
+                    num_calls     each student's number of cold calls (uint32)
+                    call_days     the date ordinal of every cold call, one
+                                  student after another (uint32)
+                    call_flags    the flag bits of every cold call, packed
+                                  into bytes for each student in turn
+
+                The roster index of a student is their position in the
+                roster's on-deck students, sorted by UO ID. The roster
+                fingerprint is a checksum of those students, so a snapshot is
+                never joined with a roster that it does not belong to.
+
+Authors:        CoolCall Team
+
+Last Edited:    10/18/2026
+Last Edit By:   CoolCall Team
+"""
+################################################################################
+from operator import attrgetter
+from array import array
+import struct
+import zlib
+import sys
+################################################################################
+
+# The header: a magic string, the format version, the roster fingerprint, the
+# number of students in the queue, and the total number of cold calls.
+HEADER = struct.Struct("<4sHIII")
+MAGIC = b"CCQS"
+VERSION = 1
+
+
+class SnapshotError(ValueError):
+	"""
+	A queue snapshot could not be read, or does not belong to the roster.
+	"""
+
+
+def roster_order(students):
+	"""
+	Put students in the order that roster indices refer to.
+
+	students: the on-deck Students of a roster (or queue), in any order
+	returns: (list) the Students, sorted by UO ID (and email address)
+	"""
+	return sorted(students, key=attrgetter("UO_ID", "email_address"))
+
+
+def roster_fingerprint(ordered):
+	"""
+	ordered: (list) Students, as returned by roster_order()
+	returns: (int) a 32-bit checksum of the students and their order
+	"""
+	return zlib.crc32(_to_bytes(array("I", [student.fingerprint() for student in ordered])))
+
+
+def _to_bytes(values):
+	"""
+	The bytes of an array, stored little-endian whatever the machine.
+	"""
+	if sys.byteorder == "big":
+		values = array(values.typecode, values)
+		values.byteswap()
+	return values.tobytes()
+
+
+def _from_bytes(typecode, data):
+	values = array(typecode)
+	values.frombytes(data)
+	if sys.byteorder == "big":
+		values.byteswap()
+	return values
+
+
+def is_snapshot(data):
+	"""
+	data: (bytes) the contents of a queue file
+	returns: (boolean) is it a snapshot, rather than an older pickle file?
+	"""
+	return data[:len(MAGIC)] == MAGIC
+
+
+def encode(queue, indices, fingerprint):
+	"""
+	Write a queue as a snapshot.
+
+	queue: the Students in the queue, front to back
+	indices: (dict) the roster index of each Student
+	fingerprint: (int) the roster fingerprint
+	returns: (bytes) the snapshot
+	"""
+	order = array("I")
+	num_flags = array("I")
+	num_calls = array("I")
+	call_days = array("I")
+	call_flags = bytearray()
+	for student in queue:
+		days, flags = student.history_arrays()
+		order.append(indices[student])
+		num_flags.append(student.total_num_flags)
+		num_calls.append(len(days))
+		call_days.extend(days)
+		call_flags += flags
+	return b"".join([
+		HEADER.pack(MAGIC, VERSION, fingerprint, len(order), len(call_days)),
+		_to_bytes(order), _to_bytes(num_flags), _to_bytes(num_calls),
+		_to_bytes(call_days), call_flags])
+
+
+def decode(data, ordered):
+	"""
+	Read a snapshot, and join it with the roster. The roster's Student
+	objects are put in the queue, with their call history restored.
+
+	data: (bytes) the snapshot
+	ordered: (list) the roster's on-deck Students, as returned by roster_order()
+	returns: (list) the Students in the queue, front to back
+	"""
+	if len(data) < HEADER.size:
+		raise SnapshotError("The queue file is too short.")
+	magic, version, fingerprint, size, total_calls = HEADER.unpack_from(data)
+	if magic != MAGIC or version != VERSION:
+		raise SnapshotError("The queue file is not in a known format.")
+	if fingerprint != roster_fingerprint(ordered) or size != len(ordered):
+		raise SnapshotError("The queue file does not belong to this roster.")
+
+	view = memoryview(data)
+	offset = HEADER.size
+	columns = []
+	for length in (size, size, size, total_calls):
+		end = offset + 4 * length
+		if end > len(data):
+			raise SnapshotError("The queue file is too short.")
+		columns.append(_from_bytes("I", view[offset:end]))
+		offset = end
+	order, num_flags, num_calls, call_days = columns
+	if sum(num_calls) != total_calls or sorted(order) != list(range(size)):
+		raise SnapshotError("The queue file is damaged.")
+
+	if offset + sum((calls + 7) // 8 for calls in num_calls) > len(data):
+		raise SnapshotError("The queue file is too short.")
+	queue = [ordered[index] for index in order]
+	day = 0
+	for student, flags, calls in zip(queue, num_flags, num_calls):
+		flag_bytes = (calls + 7) // 8
+		student.restore_history(flags, call_days[day:day + calls], data[offset:offset + flag_bytes])
+		day += calls
+		offset += flag_bytes
+	return queue
@@ -16,11 +16,10 @@ Last Edited:    1/30/2022
 Last Edit By:   Madison Werries
 """
 ###############################################################################
-from tkinter import filedialog, messagebox
-from key_sequence import KeySequence
-from student_queue import StudentQueue
+from tkinter import messagebox
 from student_roster import StudentRoster
-from random import randrange
+from rdv_simulation import simulate, counts_by_name, write_summary
+import random
 from constants import *
 from datetime import *
 ##################################################################################################################
@@ -32,10 +31,15 @@ class RandomVerification:
     100 random cold calls each time the program restarts (10,000 total 
     cold calls).
 
-    In order to simulate a pseudo-restart of the program, we call the
-    shuffle_front_and_back() method on the test queue. This effect is
+    In order to simulate a pseudo-restart of the program, the front and back
+    of the test queue are shuffled separately, as in the
+    shuffle_front_and_back() method of the StudentQueue. This effect is
     consistent with actually restarting the program.
 
+    The cold calls are simulated in memory by rdv_simulation.simulate(), on
+    a copy of the current queue order, so the real queue and its saved file
+    are never changed.
+
     All 10,000 cold calls are recorded in a separate log file called
     'random_distribution_verification.txt'. 
     
@@ -45,28 +49,23 @@ class RandomVerification:
     during the most recent RDV run, while the log file shows a list of all 
     cold calls in order. Both output files are overwritten by every RDV run.
 
-    """
+    Nothing is read or written until the mode is started: the output files are
+    only opened by start(), and the roster is taken from the controller rather
+    than parsed again.
 
-    def __init__(self):
-        self.key_sequence = KeySequence()
-        self.roster = StudentRoster()
-        self.roster.import_roster_from_file(INTERNAL_ROSTER_LOCATION)
-        self.names = []
-        for student in self.roster.students:
-            self.names.append(student.get_name())
-        self.output_file = open(f"{LOGS_LOCATION}/random_distribution_verification.txt", "w+")
-        self.summary_data = {}
+    """
 
-    def add_and_check_for_random_verification(self, event):
+    def __init__(self, controller=None):
         """
-        Called by the Display every time a key is pressed.
-        This sends the pressed key to key_sequence.py to check
-        if the system should enter RDV mode.
+        controller: the InstructorInteractionModel, whose queue order is used
+        as the starting point of the test. Without a controller, the test
+        starts from a shuffled queue made from the internal roster.
         """
-        self.key_sequence.add_key(event.keysym)
-        if self.key_sequence.check_for_match():
-            self.start()
-            self.key_sequence.reset()
+        self.controller = controller
+        self.names = []
+        self.test_students = []
+        self.output_file = None
+        self.summary_data = {}
 
     def start(self):
         """
@@ -79,6 +78,7 @@ class RandomVerification:
         )
         # If the user confirms that they want to run RDV, continue
         if do_random_verification:
+            self.output_file = open(f"{LOGS_LOCATION}/random_distribution_verification.txt", "w+")
             self.write_header()
             self.create_test_queue()
             self.run()
@@ -93,54 +93,37 @@ class RandomVerification:
         Create a summary file, recording the amount of times that each student was cold called 
         during the most recent RDV run.
         """
-        f = open(f"{LOGS_LOCATION}/random_distribution_verification.txt", "r")
-        lines = f.readlines()
-        summary = open(f"{LOGS_LOCATION}/RDV_summary.txt", "w+")
-        for student in self.names:
-            self.summary_data[student] = 0
-        for name in lines:
-            name = name.strip()
-            if name in self.names:
-                    self.summary_data[name] = self.summary_data[name] + 1
-        summary.write("A summary file of the data created during Random Distribution Verification Mode.\n")
-        for student in self.names:
-            summary.write("{0}\t{1}\n".format(student, self.summary_data[student]))
-        f.close()
+        write_summary(f"{LOGS_LOCATION}/RDV_summary.txt", self.names, self.summary_data)
             
     def create_test_queue(self):
         """
-        Create a test queue from the roster file so that the actual queue is not overwritten.
-        If the queue file cannot be located, the test queue is created from the roster file.
+        Copy the current queue order, so that the actual queue is not changed.
+        If there is no controller, the test queue is made from the internal
+        roster file.
         """
-        self.test_queue = StudentQueue()
-        roster_found = False
-        if (os.path.exists(INTERNAL_QUEUE_LOCATION)):
-            self.test_queue.load_queue_from_file(INTERNAL_QUEUE_LOCATION)
+        if self.controller is not None:
+            students = self.controller.roster.students
+            self.test_students = list(self.controller.queue.student_queue)
         else:
-            self.test_queue.queue_from_roster(INTERNAL_ROSTER_LOCATION)
-
-    def random_call(self):
-        """
-        Call a random student from on-deck. Record this in the log file.
-        """
-        on_deck = self.test_queue.get_on_deck()
-        # Randomly select an on-deck student
-        student_index = randrange(NUM_ON_DECK)
-        student = on_deck[student_index]
-        self.test_queue.take_off_deck(student)
-        on_deck = self.test_queue.get_on_deck()
-        self.write_line(student)
+            roster = StudentRoster()
+            roster.import_roster_from_file(INTERNAL_ROSTER_LOCATION)
+            students = roster.students
+            self.test_students = [
+                student for student in students if student.include_on_deck()]
+            random.shuffle(self.test_students)
+        self.names = [student.get_name() for student in students]
 
     def run(self):
         """
         Main loop.
         Randomize the queue 100 times, and each time it's been randomized, cold call 100 students.
+        The cold calls are simulated in memory, and written to the log file at the end.
         """
-        for i in range(100):
-            # call function from student_queue.py to simulate an application restart
-            self.test_queue.shuffle_front_and_back()
-            for i in range(100):
-                self.random_call()
+        counts, calls = simulate(range(len(self.test_students)), restarts=RDV_NUM_RESTARTS,
+                                 calls_per_restart=RDV_CALLS_PER_RESTART, record_calls=True)
+        self.summary_data = counts_by_name(self.test_students, counts)
+        names = [f"{student.first_name} {student.last_name}\n" for student in self.test_students]
+        self.output_file.write("".join([names[i] for i in calls]))
 
     def write_header(self):
         """
@@ -150,10 +133,3 @@ class RandomVerification:
         # Include the date.
         date_line = f"Tested on {datetime.today().strftime('%Y-%m-%d')}\n\n"
         self.output_file.write(date_line)
-
-    def write_line(self, student):
-        """
-        Write one line to the log file per cold call
-        """
-        cold_call = f"{student.first_name} {student.last_name}\n"
-        self.output_file.write(cold_call)
\ No newline at end of file
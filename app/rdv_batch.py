@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+
+###############################################################################
+"""
+Script Name:    Batch Random Distribution Verification
+
+Description:    Runs many independent Random Distribution Verification trials
+                across a pool of processes, without the GUI.
+
+                Every trial gets its own random number generator, seeded from
+                a single master seed and the trial's number. Any run can be
+                reproduced exactly by passing the same master seed, whatever
+                the number of processes. The counts from all trials are
+                merged and written to RDV_summary.txt, in the same layout as
+                Random Distribution Verification Mode.
+
+                Usage:
+                    python3 rdv_batch.py --trials 1000 --seed 422
+
+Authors:        CoolCall Team
+
+Last Edited:    10/18/2026
+Last Edit By:   CoolCall Team
+"""
+###############################################################################
+from multiprocessing import Pool
+from student_roster import StudentRoster
+from rdv_simulation import simulate, counts_by_name, write_summary
+from constants import *
+import argparse
+import random
+import time
+###############################################################################
+
+def trial_seeds(master_seed, trials):
+    """
+    Derive one seed per trial from the master seed. The seeds only depend on
+    the master seed and the trial number, never on how trials are split
+    between processes.
+
+    master_seed: (int)
+    trials: (int) the number of trials
+    returns: (list) a list of 64-bit seeds
+    """
+    seeder = random.Random(master_seed)
+    return [seeder.getrandbits(64) for _ in range(trials)]
+
+
+def _run_trials(job):
+    """
+    Run a chunk of trials in a worker process, and add up their counts.
+
+    job: (tuple) the starting order, the restarts and calls per trial, and
+    the list of seeds for the trials in this chunk.
+    returns: (list) the number of times each student index was called on.
+    """
+    order, restarts, calls_per_restart, seeds = job
+    totals = [0] * len(order)
+    for seed in seeds:
+        counts = simulate(order, restarts, calls_per_restart, rng=random.Random(seed))
+        for i, count in enumerate(counts):
+            totals[i] += count
+    return totals
+
+
+def run_batch(order, trials, restarts=RDV_NUM_RESTARTS, calls_per_restart=RDV_CALLS_PER_RESTART,
+              master_seed=0, processes=None):
+    """
+    Run independent trials across a process pool, and merge their counts.
+
+    order: (list) the starting queue for every trial, as student indices
+    from 0 to len(order) - 1.
+    trials: (int) the number of trials to run
+    restarts, calls_per_restart: (int) the size of each trial
+    master_seed: (int) the seed that every trial's seed is derived from
+    processes: (int) the number of worker processes; one per core by default
+
+    returns: (list) the total number of times each student index was called on.
+    """
+    order = list(order)
+    seeds = trial_seeds(master_seed, trials)
+    processes = processes or os.cpu_count() or 1
+    if processes == 1 or trials <= 1:
+        return _run_trials((order, restarts, calls_per_restart, seeds))
+
+    with Pool(processes) as pool:
+        # Hand out several chunks per worker, so that the workers stay busy
+        # even if some finish early.
+        num_chunks = min(trials, processes * 4)
+        jobs = [(order, restarts, calls_per_restart, seeds[i::num_chunks])
+                for i in range(num_chunks)]
+        totals = [0] * len(order)
+        for counts in pool.imap_unordered(_run_trials, jobs):
+            for i, count in enumerate(counts):
+                totals[i] += count
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run Random Distribution Verification trials across several processes.")
+    parser.add_argument("--trials", type=int, default=os.cpu_count() or 1,
+                        help="number of independent trials (default: one per core)")
+    parser.add_argument("--restarts", type=int, default=RDV_NUM_RESTARTS,
+                        help="simulated restarts per trial")
+    parser.add_argument("--calls", type=int, default=RDV_CALLS_PER_RESTART,
+                        help="cold calls per restart")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="master seed; a random one is chosen and printed if not given")
+    parser.add_argument("--processes", type=int, default=None,
+                        help="number of worker processes (default: one per core)")
+    parser.add_argument("--roster", default=INTERNAL_ROSTER_LOCATION,
+                        help="roster file to test")
+    parser.add_argument("--output", default=f"{LOGS_LOCATION}/RDV_summary.txt",
+                        help="summary file to write")
+    args = parser.parse_args()
+
+    roster = StudentRoster()
+    error = roster.import_roster_from_file(args.roster)
+    if error:
+        parser.error(f"Cannot import roster file. {error}")
+    master_seed = args.seed if args.seed is not None else random.getrandbits(32)
+
+    # Every trial starts from the same shuffled queue, as if it had just been
+    # made from the roster. The roster is a set, so it is sorted first to make
+    # the starting queue depend only on the master seed.
+    students = sorted(roster.students, key=lambda s: (s.last_name, s.first_name, s.email_address))
+    names = [student.get_name() for student in students]
+    test_students = [student for student in students if student.include_on_deck()]
+    random.Random(master_seed).shuffle(test_students)
+
+    start = time.perf_counter()
+    counts = run_batch(range(len(test_students)), args.trials, args.restarts, args.calls,
+                       master_seed, args.processes)
+    elapsed = time.perf_counter() - start
+    write_summary(args.output, names, counts_by_name(test_students, counts))
+
+    total_calls = args.trials * args.restarts * args.calls
+    print(f"Master seed: {master_seed}")
+    print(f"{total_calls} cold calls in {elapsed:.2f}s ({total_calls / elapsed:.0f} calls/s)")
+    print(f"Summary written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
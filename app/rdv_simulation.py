@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+
+###############################################################################
+"""
+Script Name:    Random Distribution Verification Simulation
+
+Description:    A headless, in-memory engine for Random Distribution
+                Verification. It runs the same steps as the StudentQueue
+                (shuffling the front and back at each restart, picking a
+                student from on-deck, and re-inserting them into the back
+                window) over integer student indices, without any disk I/O
+                and without Tkinter. It also writes the summary file that both
+                RDV Mode and the batch runner produce.
+
+Authors:        CoolCall Team
+
+Last Edited:    10/18/2026
+Last Edit By:   CoolCall Team
+"""
+###############################################################################
+import random
+from constants import *
+###############################################################################
+
+def simulate(order, restarts=RDV_NUM_RESTARTS, calls_per_restart=RDV_CALLS_PER_RESTART,
+             num_on_deck=NUM_ON_DECK, insert_delay=INSERT_DELAY, rng=random,
+             record_calls=False):
+    """
+    Simulate Random Distribution Verification on a queue of student indices.
+
+    order: (list) the starting queue, as a list of student indices. Indices
+    should run from 0 to len(order) - 1. The list is not modified.
+    restarts: (int) the number of simulated program restarts
+    calls_per_restart: (int) the number of cold calls after each restart
+    num_on_deck, insert_delay: the queue parameters, as in the constants file
+    rng: a random.Random-like object; the random module by default
+    record_calls: (boolean) should the order of cold calls be returned too?
+
+    returns: (list) the number of times each student index was called on.
+    If record_calls is True, returns a tuple of that list and a list of the
+    called student indices, in order.
+    """
+    queue = list(order)
+    size = len(queue)
+    counts = [0] * size
+    calls = [] if record_calls else None
+    if size == 0:
+        return (counts, calls) if record_calls else counts
+
+    shuffle = rng.shuffle
+    randrange = rng.randrange
+    randint = rng.randint
+    deck_size = min(num_on_deck, size)
+    # After a student is taken out, the queue holds size - 1 students. As in
+    # StudentQueue.randomized_enqueue, the back window never reaches on-deck.
+    remaining = size - 1
+    if remaining:
+        start = int(remaining * max(insert_delay, num_on_deck / remaining))
+    else:
+        start = 0
+    start = min(start, remaining)
+
+    for _ in range(restarts):
+        # Simulate an application restart, as in shuffle_front_and_back().
+        midpoint = int(size * insert_delay)
+        front = queue[:midpoint]
+        back = queue[midpoint:]
+        shuffle(front)
+        shuffle(back)
+        queue = front + back
+        for _ in range(calls_per_restart):
+            student = queue.pop(randrange(deck_size))
+            queue.insert(randint(start, remaining), student)
+            counts[student] += 1
+            if record_calls:
+                calls.append(student)
+
+    return (counts, calls) if record_calls else counts
+
+
+def counts_by_name(test_students, counts):
+    """
+    Add up the number of times each student was called on, by name.
+
+    test_students: (list) the Students in the test queue, by index
+    counts: (list) the number of times each test student was called on, as
+    returned by simulate()
+    returns: (dict) the number of cold calls for each student's name
+    """
+    summary_data = {}
+    for student, count in zip(test_students, counts):
+        name = student.get_name()
+        summary_data[name] = summary_data.get(name, 0) + count
+    return summary_data
+
+
+def write_summary(filename, names, summary_data):
+    """
+    Write RDV_summary.txt: the number of times each student was cold called.
+    Used by both Random Distribution Verification Mode and rdv_batch.py, so
+    the two summaries always have the same layout.
+
+    filename: (string) the summary file to write
+    names: (list) the names of every student in the roster, in the order
+    they are listed in the summary
+    summary_data: (dict) the number of cold calls for each name, as returned
+    by counts_by_name(); names that are missing were never called on
+    """
+    with open(filename, "w") as summary:
+        summary.write("A summary file of the data created during Random Distribution Verification Mode.\n")
+        for name in names:
+            summary.write("{0}\t{1}\n".format(name, summary_data.get(name, 0)))
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+
+###############################################################################
+"""
+Script Name:    RDV Simulation Testing Script
+
+Description:    This script can be run at the command line to check that the
+                in-memory RDV simulation makes the same cold calls as the
+                StudentQueue does, given the same random seed.
+
+Author:         CoolCall Team
+
+Last Edited:    10/18/2026
+Last Edit By:   CoolCall Team
+"""
+###############################################################################
+import os
+import random
+from student import Student
+from student_queue import StudentQueue
+from student_roster import StudentRoster
+from order_statistic_tree import OrderStatisticTree
+from rdv_simulation import simulate, counts_by_name, write_summary
+from rdv_batch import run_batch
+from random_distribution_verification import RandomVerification
+from constants import NUM_ON_DECK
+from test_support import temporary_directory
+###############################################################################
+
+def test_matches_student_queue():
+	students = [Student(f"First{i}", f"Last{i}", str(951000000 + i),
+						f"s{i}@uoregon.edu", f"first{i}", "0") for i in range(25)]
+	random.seed(422)
+	queue = StudentQueue(os.path.join(temporary_directory(), "student_queue"))
+	queue.student_queue = OrderStatisticTree(students)
+	expected = []
+	for _ in range(5):
+		queue.shuffle_front_and_back()
+		for _ in range(40):
+			student = queue.get_on_deck()[random.randrange(NUM_ON_DECK)]
+			queue.take_off_deck(student)
+			expected.append(students.index(student))
+
+	random.seed(422)
+	counts, calls = simulate(range(25), restarts=5, calls_per_restart=40, record_calls=True)
+	assert calls == expected
+	assert sum(counts) == 200
+	assert counts == [expected.count(i) for i in range(25)]
+
+def test_small_queues():
+	assert simulate([], restarts=2, calls_per_restart=3) == []
+	assert simulate([0], restarts=2, calls_per_restart=3) == [6]
+	assert sum(simulate(range(3), restarts=2, calls_per_restart=3)) == 6
+
+def test_batch_is_reproducible():
+	serial = run_batch(range(20), trials=6, restarts=3, calls_per_restart=50, master_seed=7, processes=1)
+	parallel = run_batch(range(20), trials=6, restarts=3, calls_per_restart=50, master_seed=7, processes=2)
+	assert serial == parallel
+	assert sum(serial) == 6 * 3 * 50
+
+def test_verification_is_lazy():
+	class Controller:
+		pass
+	controller = Controller()
+	controller.roster = StudentRoster(os.path.join(temporary_directory(), "roster.txt"))
+	for i in range(10):
+		controller.roster.add_student(
+			Student(f"First{i}", f"Last{i}", str(951000000 + i), f"s{i}@uoregon.edu", "", "0"))
+	controller.queue = StudentQueue(os.path.join(temporary_directory(), "student_queue"))
+	controller.queue.student_queue = OrderStatisticTree(controller.roster.students)
+	# Nothing is opened or parsed until the mode is started.
+	rdv = RandomVerification(controller)
+	assert rdv.output_file is None and rdv.names == []
+	rdv.create_test_queue()
+	assert sorted(rdv.names) == sorted(s.get_name() for s in controller.queue.student_queue)
+
+def test_summary_file():
+	students = [Student(f"First{i}", f"Last{i}", str(951000000 + i), f"s{i}@uoregon.edu", "", "0")
+				for i in range(3)]
+	# Students who share a name are counted together.
+	twin = Student("First0", "Last0", "951000009", "twin@uoregon.edu", "", "0")
+	summary_data = counts_by_name(students + [twin], [5, 7, 0, 2])
+	filename = os.path.join(temporary_directory(), "RDV_summary.txt")
+	write_summary(filename, ["First2 Last2", "First0 Last0", "First1 Last1", "Not Called"], summary_data)
+	with open(filename) as f:
+		assert f.read() == ("A summary file of the data created during Random Distribution Verification Mode.\n"
+							"First2 Last2\t0\nFirst0 Last0\t7\nFirst1 Last1\t7\nNot Called\t0\n")
+
+if __name__ == "__main__":
+	test_matches_student_queue()
+	test_small_queues()
+	test_batch_is_reproducible()
+	test_verification_is_lazy()
+	test_summary_file()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+
+###############################################################################
+"""
+Script Name:    Roster Diff
+
+Description:    Compares two StudentRosters for the CoolCall Program.
+                Students are matched by UO ID, which stays the same when their
+                name, email address or other details change. The project
+                specifications do not allow the UO ID to be used as a
+                dictionary key, so both rosters are sorted by UO ID and merged,
+                finding the differences in O(n log n) time. They are reported
+                as structured lists of added, removed and changed students,
+                instead of one set of mismatched Student objects.
+
+Authors:        CoolCall Team
+
+Last Edited:    10/18/2026
+Last Edit By:   CoolCall Team
+"""
+###############################################################################
+from collections import namedtuple
+from itertools import groupby
+from operator import attrgetter
+###############################################################################
+
+# The fields that can change for a student who stays in the roster.
+COMPARED_FIELDS = ("first_name", "last_name", "email_address", "phonetic_spelling", "reveal_code")
+
+# A student whose data changed between two rosters: the Student objects from
+# the old and new rosters, and the names of the fields that are different.
+StudentChange = namedtuple("StudentChange", ["old", "new", "fields"])
+
+
+class RosterDiff:
+	"""
+	The differences between an old roster and a new one.
+
+	Attributes
+	============================================================================
+	added
+		A list of Students who are only in the new roster.
+	removed
+		A list of Students who are only in the old roster.
+	changed
+		A list of StudentChanges, for students in both rosters whose data is
+		different.
+
+	The number of differences is given by len(), and an empty diff is false.
+	"""
+
+	def __init__(self, added, removed, changed):
+		self.added = added
+		self.removed = removed
+		self.changed = changed
+
+	def __len__(self):
+		return len(self.added) + len(self.removed) + len(self.changed)
+
+
+def _by_id(roster):
+	"""
+	returns: (list) a (UO ID, list of Students) pair for each UO ID in the
+	roster, sorted by UO ID
+	"""
+	by_id = attrgetter("UO_ID")
+	return [(UO_ID, list(students)) for UO_ID, students in groupby(sorted(roster.students, key=by_id), by_id)]
+
+
+def diff_rosters(old_roster, new_roster):
+	"""
+	Find the students that were added, removed and changed between two rosters.
+	Students are matched by UO ID. If either roster has more than one student
+	with a UO ID, there is no way to match them up, so all of that UO ID's
+	students in the old roster are removed and all of those in the new roster
+	are added.
+
+	old_roster, new_roster: (StudentRoster)
+	returns: (RosterDiff)
+	"""
+	added = []
+	removed = []
+	changed = []
+	old, new = _by_id(old_roster), _by_id(new_roster)
+	i = j = 0
+	while i < len(old) or j < len(new):
+		if j == len(new) or (i < len(old) and old[i][0] < new[j][0]):
+			removed.extend(old[i][1])
+			i += 1
+		elif i == len(old) or new[j][0] < old[i][0]:
+			added.extend(new[j][1])
+			j += 1
+		else:
+			old_students, new_students = old[i][1], new[j][1]
+			i += 1
+			j += 1
+			if len(old_students) > 1 or len(new_students) > 1:
+				removed.extend(old_students)
+				added.extend(new_students)
+				continue
+			old_student, student = old_students[0], new_students[0]
+			fields = [field for field in COMPARED_FIELDS
+					  if getattr(old_student, field) != getattr(student, field)]
+			if fields:
+				changed.append(StudentChange(old_student, student, fields))
+	return RosterDiff(added, removed, changed)
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+
+###############################################################################
+"""
+Script Name:    Session Trace
+
+Description:    Records the keypresses of a real lecture, and replays them
+                without the GUI, to load-test changes to the queue and logging
+                with real classroom workloads.
+
+                When SESSION_TRACE is True, the Instructor Interaction Model
+                writes every shift_index, toggle_mark and remove event to a trace file in the
+                logs directory, with the time since the session started. The
+                random number generator is seeded from a seed stored in the
+                trace, so a replay makes the same random choices every time.
+
+                The replayer drives a StudentQueue and LogManager through a
+                ColdCallSession, as the Instructor Interaction Model would,
+                either as fast as possible or at the pace of the recording. It
+                reports the throughput, and the latency percentiles of each
+                kind of event. All files are written to a temporary directory,
+                which is removed when the replay is done.
+
+                The trace file starts with a header (magic string, version,
+                seed, and the wall-clock start time), followed by one 5-byte
+                record per event: milliseconds since the start, and the kind
+                of event.
+
+                Usage:
+                    python3 session_trace.py ../logs/session_trace--....dat
+                                             [--roster student_data/roster.txt]
+                                             [--pacing max|recorded]
+
+Authors:        CoolCall Team
+
+Last Edited:    10/18/2026
+Last Edit By:   CoolCall Team
+"""
+###############################################################################
+from collections import namedtuple
+from student_roster import StudentRoster
+from weighted_student_queue import make_student_queue
+from log_manager import LogManager
+from cold_call_session import ColdCallSession
+from latency_recorder import LatencyRecorder
+from persistence_worker import PersistenceWorker
+from constants import *
+import tempfile
+import argparse
+import struct
+import random
+import atexit
+import time
+###############################################################################
+
+# The header: a magic string, the format version, the seed of the random
+# number generator, and the time the session started (seconds since the epoch).
+HEADER = struct.Struct("<4sHQd")
+MAGIC = b"CCST"
+VERSION = 1
+
+# An event: milliseconds since the session started, and the kind of event.
+EVENT = struct.Struct("<IB")
+
+# Kinds of event
+SHIFT_LEFT = 1
+SHIFT_RIGHT = 2
+CALL = 3          # remove without a flag
+CALL_FLAGGED = 4  # remove with a flag
+MARK = 5          # mark or unmark the selected student
+
+TraceEvent = namedtuple("TraceEvent", ["offset_ms", "kind"])
+
+
+class TraceRecorder():
+    """
+    A class for writing the events of a session to a trace file.
+
+    Attributes
+    =======================================================================
+    filename
+        The trace file.
+
+    seed
+        The seed that the random number generator should be seeded with, so
+        that the session can be replayed.
+
+    Methods
+    =======================================================================
+    record(kind)
+        Add an event to the trace.
+
+    close()
+        Write any buffered events, and close the trace file.
+    """
+
+    def __init__(self, filename, seed=None):
+        self.filename = filename
+        self.seed = seed if seed is not None else random.getrandbits(64)
+        self._start = time.perf_counter()
+        self._file = open(filename, "wb")
+        self._file.write(HEADER.pack(MAGIC, VERSION, self.seed, time.time()))
+        # Events are buffered by the file, and written when it is closed,
+        # even if the program exits without closing the recorder.
+        atexit.register(self.close)
+
+    def record(self, kind):
+        """
+        kind: (int) SHIFT_LEFT, SHIFT_RIGHT, CALL, CALL_FLAGGED, or MARK
+        """
+        offset_ms = int((time.perf_counter() - self._start) * 1000)
+        self._file.write(EVENT.pack(offset_ms, kind))
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            atexit.unregister(self.close)
+
+
+def read_trace(filename):
+    """
+    Read a trace file. An event cut short at the end of the file is ignored.
+
+    filename: (string) the trace file
+    returns: (tuple) the seed, and a list of TraceEvents
+    """
+    with open(filename, "rb") as f:
+        data = f.read()
+    if len(data) < HEADER.size:
+        raise ValueError(f"{filename} is not a session trace.")
+    magic, version, seed, _ = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{filename} is not a session trace.")
+    end = HEADER.size + (len(data) - HEADER.size) // EVENT.size * EVENT.size
+    return seed, [TraceEvent(*fields) for fields in EVENT.iter_unpack(data[HEADER.size:end])]
+
+
+def replay(seed, events, roster, pacing="max", directory=None):
+    """
+    Replay a session's events on a fresh queue made from the roster.
+
+    seed: (int) the seed of the random number generator, from the trace
+    events: (list) the TraceEvents to replay
+    roster: (StudentRoster) the roster to make the queue from
+    pacing: (string) "max" to replay as fast as possible, or "recorded" to
+    wait until each event's recorded time
+    directory: (string) where to write the queue and logs; by default, a
+    temporary directory that is removed afterwards
+    returns: (tuple) the number of seconds the replay took, and a
+    LatencyRecorder holding the latency of each kind of event
+    """
+    if directory is None:
+        with tempfile.TemporaryDirectory() as directory:
+            return replay(seed, events, roster, pacing, directory)
+    random.seed(seed)
+    logs_location = os.path.join(directory, "logs")
+    os.makedirs(logs_location)
+    persistence = PersistenceWorker() if BACKGROUND_PERSISTENCE else None
+    queue = make_student_queue(os.path.join(directory, "student_queue"), persistence)
+    queue.queue_from_roster(roster)
+    log_manager = LogManager("summary.txt", logs_location, persistence)
+    latency = LatencyRecorder()
+    session = ColdCallSession(queue, log_manager, latency)
+
+    start = time.perf_counter()
+    for event in events:
+        if pacing == "recorded":
+            delay = start + event.offset_ms / 1000 - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        began = latency.start()
+        if event.kind == SHIFT_LEFT:
+            session.shift(-1)
+            latency.lap("shift", began)
+        elif event.kind == SHIFT_RIGHT:
+            session.shift(1)
+            latency.lap("shift", began)
+        elif event.kind == MARK:
+            session.toggle_mark()
+            latency.lap("mark", began)
+        elif event.kind in (CALL, CALL_FLAGGED):
+            session.remove(event.kind == CALL_FLAGGED)
+            latency.lap("remove", began)
+        else:
+            raise ValueError(f"Unknown event kind {event.kind} in the trace.")
+    # Waiting for the last writes is part of the cost of the session.
+    began = latency.start()
+    log_manager.close()
+    queue.close()
+    if persistence is not None:
+        persistence.close()
+    latency.lap("close", began)
+    return time.perf_counter() - start, latency
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a recorded CoolCall session.")
+    parser.add_argument("trace", help="session trace file to replay")
+    parser.add_argument("--roster", default=INTERNAL_ROSTER_LOCATION,
+                        help="roster file to make the queue from")
+    parser.add_argument("--pacing", choices=("max", "recorded"), default="max",
+                        help="replay as fast as possible, or at the recorded pace")
+    args = parser.parse_args()
+
+    roster = StudentRoster()
+    error = roster.import_roster_from_file(args.roster)
+    if error:
+        parser.error(f"Cannot import roster file. {error}")
+    seed, events = read_trace(args.trace)
+    seconds, latency = replay(seed, events, roster, args.pacing)
+
+    print(f"{len(events)} events in {seconds:.3f}s ({len(events) / seconds:.0f} events/s)")
+    print(latency.report())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+
+###############################################################################
+"""
+Script Name:    Session Trace Testing Script
+
+Description:    This script can be run at the command line to test recording
+                and replaying session traces. Traces, queues and logs are
+                written to temporary directories.
+
+Author:         CoolCall Team
+
+Last Edited:    10/18/2026
+Last Edit By:   CoolCall Team
+"""
+###############################################################################
+import os
+import random
+import tempfile
+from session_trace import (TraceRecorder, read_trace, replay,
+                           SHIFT_LEFT, SHIFT_RIGHT, CALL, CALL_FLAGGED, MARK)
+from test_support import make_roster, temporary_directory
+###############################################################################
+
+def record_session(num_events):
+    filename = os.path.join(temporary_directory(), "session_trace.dat")
+    recorder = TraceRecorder(filename, seed=422)
+    kinds = [random.choice((SHIFT_LEFT, SHIFT_RIGHT, CALL, CALL_FLAGGED, MARK)) for _ in range(num_events)]
+    for kind in kinds:
+        recorder.record(kind)
+    recorder.close()
+    return filename, kinds
+
+def test_read_trace():
+    filename, kinds = record_session(500)
+    # An event cut short by a crash is ignored.
+    with open(filename, "ab") as f:
+        f.write(b"\x01\x02")
+    seed, events = read_trace(filename)
+    assert seed == 422
+    assert [event.kind for event in events] == kinds
+    offsets = [event.offset_ms for event in events]
+    assert offsets == sorted(offsets)
+
+def test_replay_is_reproducible():
+    filename, kinds = record_session(300)
+    seed, events = read_trace(filename)
+    summaries = []
+    for _ in range(2):
+        directory = temporary_directory()
+        seconds, latency = replay(seed, events, make_roster(30), directory=directory)
+        assert seconds > 0
+        assert latency.histograms["remove"].count == sum(kind in (CALL, CALL_FLAGGED) for kind in kinds)
+        assert latency.histograms["shift"].count == sum(kind in (SHIFT_LEFT, SHIFT_RIGHT) for kind in kinds)
+        assert latency.histograms["mark"].count == kinds.count(MARK)
+        with open(os.path.join(directory, "logs", "summary.txt")) as f:
+            summaries.append(f.read())
+    # The same seed makes the same choices, so the same students are called on.
+    assert summaries[0] == summaries[1]
+
+def test_replay_cleans_up():
+    filename, kinds = record_session(50)
+    seed, events = read_trace(filename)
+    saved = tempfile.tempdir
+    tempfile.tempdir = temporary_directory()
+    try:
+        replay(seed, events, make_roster(30))
+        # The queue and logs of the replay are removed once it is done.
+        assert os.listdir(tempfile.tempdir) == []
+    finally:
+        tempfile.tempdir = saved
+
+if __name__ == "__main__":
+    test_read_trace()
+    test_replay_is_reproducible()
+    test_replay_cleans_up()
@@ -15,6 +15,8 @@ Last Edit By:   Arden Butterfield
 """
 ###############################################################################
 from datetime import date
+from array import array
+import zlib
 ###############################################################################
 
 class Student:
@@ -37,12 +39,17 @@ class Student:
 		A list of datetime objects, one for each date/time that a student has 
 		been cold called..
 
+		To keep the Student small in memory and in the queue file, the call
+		history is stored as an array of date ordinals, with a parallel array
+		of bits recording whether each call was flagged. dates_called builds
+		the list of dates from the array whenever it is read.
+
 	Methods
 	============================================================================
-	call_on(flag)
-		Records that the student was called on during the current day, and
-		increments the number of times the student has been called on (with a
-		flag if flagged=True).
+	call_on(flag, day)
+		Records that the student was called on during the current day (or the
+		given day), and increments the number of times the student has been
+		called on (with a flag if flagged=True).
 
 	get_name()
 		Returns a formatted string of the student
@@ -50,10 +57,32 @@ class Student:
 	include_on_deck()
 		Returns a boolean: is this student marked to be included on-deck?
 
+	fingerprint()
+		Returns a 32-bit number identifying the student in saved data files.
+
+	take_history(other)
+		Copies the call history of another Student object for the same student.
+
+	history_arrays(), restore_history(total_num_flags, call_days, call_flags)
+		Get and set the call history in its stored form, for queue snapshots.
+
+	times_called(), last_called()
+		Return the number of cold calls and the date of the last one, without
+		building the whole dates_called list.
+
+	call_history()
+		Returns a list of (date, flagged) pairs, one for each cold call.
+
 	This class supports comparison for equality, and can be hashed to use in a
-	Python set.
+	Python set. The hash is computed once, so the student's data fields should
+	not be changed after the Student is created.
 	"""
 
+	# Students are stored by the thousand, so they use slots instead of a
+	# __dict__ for their attributes.
+	__slots__ = ("first_name", "last_name", "UO_ID", "email_address", "phonetic_spelling",
+				 "reveal_code", "total_num_flags", "_call_days", "_call_flags", "_hash")
+
 	def __init__(self, fname, lname, sid, email, phonetic, rcode):
 		""" All fields should be passed in as strings."""
 		self.first_name = fname
@@ -63,9 +92,12 @@ class Student:
 		self.phonetic_spelling = phonetic
 		self.reveal_code = rcode
 		self.total_num_flags = 0
-		self.dates_called = []
+		# The ordinal of each date called, and one bit per call for flags.
+		self._call_days = array("I")
+		self._call_flags = bytearray()
+		self._hash = hash(self.__members())
 		
-	def call_on(self, flag):
+	def call_on(self, flag, day=None):
 		"""
 		Stores a new instance of the student being called on. 
 		This method adds the current date to the list of dates called, 
@@ -73,10 +105,50 @@ class Student:
 		(with a flag, if applicable).
 
 		flag: (boolen)
+		day: (date) the day of the cold call, if it was not today. This is
+		used when replaying saved cold calls.
 		"""
 		if(flag):
 			self.total_num_flags += 1
-		self.dates_called.append(date.today())
+		num_calls = len(self._call_days)
+		if num_calls % 8 == 0:
+			self._call_flags.append(0)
+		if flag:
+			self._call_flags[num_calls >> 3] |= 1 << (num_calls & 7)
+		self._call_days.append((day if day else date.today()).toordinal())
+
+	@property
+	def dates_called(self):
+		"""
+		A list of the dates that the student has been cold called on.
+		"""
+		return [date.fromordinal(day) for day in self._call_days]
+
+	@dates_called.setter
+	def dates_called(self, dates):
+		# Flags are not known for dates set this way.
+		self._call_days = array("I", [day.toordinal() for day in dates])
+		self._call_flags = bytearray((len(self._call_days) + 7) // 8)
+
+	def times_called(self):
+		"""
+		Returns the number of times the student has been cold called.
+		"""
+		return len(self._call_days)
+
+	def last_called(self):
+		"""
+		Returns the date of the student's last cold call, or None.
+		"""
+		return date.fromordinal(self._call_days[-1]) if self._call_days else None
+
+	def call_history(self):
+		"""
+		Returns a list of (date, flagged) pairs, one for each cold call, oldest
+		first.
+		"""
+		return [(date.fromordinal(day), bool(self._call_flags[i >> 3] & (1 << (i & 7))))
+				for i, day in enumerate(self._call_days)]
 	
 	def get_name(self):
 		""" 
@@ -89,6 +161,77 @@ class Student:
 		# as communicated by the reveal code.
 		return self.reveal_code == "0"
 
+	def fingerprint(self):
+		"""
+		Returns a 32-bit number identifying the student, so that saved data
+		files can refer to a student without storing the whole Student object.
+		Like the hash, it does not use the UO ID.
+		"""
+		key = f"{self.first_name}\t{self.last_name}\t{self.email_address}"
+		return zlib.crc32(key.encode("utf-8"))
+
+	def take_history(self, other):
+		"""
+		Copies the number of flags and the dates called from another Student
+		object. This is used when a roster is re-imported with new details for a
+		student, so that their call history is kept.
+
+		other: (Student) the old Student object for the same student
+		"""
+		self.total_num_flags = other.total_num_flags
+		self._call_days = array("I", other._call_days)
+		self._call_flags = bytearray(other._call_flags)
+
+	def history_arrays(self):
+		"""
+		Returns the call history as it is stored: an array of date ordinals,
+		and the flag bits packed into bytes. They must not be changed.
+		"""
+		return self._call_days, self._call_flags
+
+	def restore_history(self, total_num_flags, call_days, call_flags):
+		"""
+		Replace the call history, as read from a queue snapshot.
+
+		total_num_flags: (int) the number of flags
+		call_days: (array) the date ordinal of each cold call
+		call_flags: (bytes) the flag bits of each cold call, packed into bytes
+		"""
+		self.total_num_flags = total_num_flags
+		self._call_days = array("I", call_days)
+		self._call_flags = bytearray(call_flags)
+
+	def __getstate__(self):
+		"""
+		The state stored when a Student is pickled: the data fields, followed by
+		the compact call history arrays.
+		"""
+		return (self.first_name, self.last_name, self.UO_ID, self.email_address,
+				self.phonetic_spelling, self.reveal_code, self.total_num_flags,
+				self._call_days.tobytes(), bytes(self._call_flags))
+
+	def __setstate__(self, state):
+		"""
+		Restore a pickled Student. Queue files saved before Students had slots
+		store a dictionary of attributes, with a list of dates called; these
+		are converted to the compact form.
+		"""
+		if isinstance(state, dict):
+			(self.first_name, self.last_name, self.UO_ID, self.email_address,
+			 self.phonetic_spelling, self.reveal_code) = (
+				state["first_name"], state["last_name"], state["UO_ID"], state["email_address"],
+				state["phonetic_spelling"], state["reveal_code"])
+			self.total_num_flags = state["total_num_flags"]
+			self.dates_called = state["dates_called"]
+		else:
+			(self.first_name, self.last_name, self.UO_ID, self.email_address,
+			 self.phonetic_spelling, self.reveal_code, self.total_num_flags,
+			 call_days, call_flags) = state
+			self._call_days = array("I")
+			self._call_days.frombytes(call_days)
+			self._call_flags = bytearray(call_flags)
+		self._hash = hash(self.__members())
+
 	def __members(self):
 		# The __members, __eq__, and __hash__ methods are based on code by Jonas Adler (2007)
 		# published as a Stack Overflow answer here:
@@ -105,9 +248,10 @@ class Student:
 		"""
 		Create a unique hash of the student. See documentation in __members()
 		Having a hash is necessary for storing the students in a set, as we want
-		to do in the StudentRoster class.
+		to do in the StudentRoster class. The hash is computed once, when the
+		Student is created or unpickled.
 		"""
-		return hash(self.__members())
+		return self._hash
 
 	def __eq__(self, other):
 		"""
@@ -117,6 +261,7 @@ class Student:
 
 		other: (Student) the student object to compare with self
 		"""
-		return isinstance(other, Student) and self.__members() == other.__members() and self.UO_ID == other.UO_ID
+		return (isinstance(other, Student) and self._hash == other._hash and
+				self.__members() == other.__members() and self.UO_ID == other.UO_ID)
 
 
@@ -22,8 +22,18 @@ Last Edit By:   Quinn Fetrow
 ################################################################################
 import random
 import pickle
+import time
+import zlib
+from datetime import date
 from student import Student
 from student_roster import StudentRoster
+from order_statistic_tree import OrderStatisticTree
+from queue_journal import QueueJournal, CALLED, FLAGGED
+from cool_call_database import open_database, database_location
+from persistence_worker import write_file_atomically
+from queue_snapshot import SnapshotError
+import queue_snapshot
+import threading
 import os
 from constants import *
 ################################################################################
@@ -34,23 +44,53 @@ class StudentQueue:
 	
 	There are two ways we can load a queue at startup: 
 	- It can be created fresh from a StudentRoster.
-	- Or, it can be loaded from a stored pickle file (which is preferable, since the 
-	  order of students in the queue will be saved in the pickle file) 
+	- Or, it can be loaded from a stored queue file (which is preferable, since the 
+	  order of students in the queue will be saved in the queue file) 
+
+	The queue file is a binary snapshot (see queue_snapshot.py) of the queue
+	order and call history, which is joined with the roster when it is loaded.
+	Queue files from older versions, which pickled the Student objects, can
+	still be loaded, and are replaced by a snapshot the next time the queue
+	is saved.
+
+	When QUEUE_PERSISTENCE_MODE is "journal", the queue file is a snapshot of
+	the queue, and each cold call after the snapshot is appended to a
+	QueueJournal stored next to it. Loading the queue replays the journal
+	on top of the snapshot. When it is "sqlite", the queue is saved to a
+	CoolCallDatabase instead, with one transaction per cold call.
+
+	If the queue is given a PersistenceWorker, the snapshot and journal files
+	are written on the worker's thread. The snapshot is encoded straight away, so
+	the worker is only handed bytes that can't change.
 	
 	Attributes
 	============================================================================
 	student_queue[]
-		A list of Student objects, for storing the students in the order that 
-		they will be added to the on-deck display.
+		An OrderStatisticTree of Student objects, for storing the students in
+		the order that they will be added to the on-deck display. It behaves
+		like a list, but finding, removing and inserting a student take
+		O(log n) time, so large queues stay fast.
+	queue_location
+		The file that the queue is saved to after every change.
+	journal
+		The QueueJournal for the saved queue file, or None before the queue
+		has been saved or loaded.
+	database
+		The CoolCallDatabase the queue is saved to in "sqlite" mode, or None.
+	persistence
+		The PersistenceWorker that writes the queue's files, or None to write
+		them straight away.
 
 	Methods
 	============================================================================
 	queue_from_roster(roster)
 		Fills out the queue from a StudentRoster object.
-	load_queue_from_file(filename)
-		Load a saved queue from a pickle file.
+	merge_roster(changes)
+		Updates the queue in place for a re-imported roster.
+	load_queue_from_file(filename, roster)
+		Load a saved queue from a queue file.
 	save_queue_to_file(filename)
-		Save a queue to a pickle file.
+		Save a queue to a queue file.
 	get_on_deck()
 		Get a list of the Students who are currently on-deck
 	shuffle_queue()
@@ -58,14 +98,18 @@ class StudentQueue:
 	shuffle_front_and_back()
 		Shuffle the front and back of the queue separately. This occurs at the
 		start of a lecture.
-	take_off_deck(student)
+	take_off_deck(student, flag)
 		Remove a Student from on deck, and re-insert the student into the queue.
+	take_off_deck_batch(pairs)
+		Take several on-deck Students off deck, and save the queue once.
 	randomized_enqueue(student)
 		Insert a Student into a random position in the back portion of the queue.
 	dequeue_student(student)
 		Remove a specific Student from the queue.
 	queue_size()
 		Return the number of students in the queue.
+	close()
+		Close the queue's journal and database files.
 	print_queue(), print_on_deck()
 		Debugging methods for printing a list of students that are stored in the queue 
 		and on deck.
@@ -73,11 +117,29 @@ class StudentQueue:
 	"""
 
 	# Basic constructor for the student queue.
-	def __init__(self):
+	def __init__(self, queue_location=None, persistence=None):
 		"""
-		Before importing from a roster or pickle file, the student queue is empty.
+		Before importing from a roster or queue file, the student queue is empty.
+
+		queue_location: (string) the file to save the queue to after every
+		change; INTERNAL_QUEUE_LOCATION by default.
+		persistence: (PersistenceWorker) writes the queue's files in the
+		background, if given.
 		"""
-		self.student_queue = []
+		self.queue_location = queue_location or INTERNAL_QUEUE_LOCATION
+		self.student_queue = OrderStatisticTree()
+		self.journal = None
+		self.database = None
+		self.persistence = persistence
+		# Journal records waiting for the persistence worker. The worker takes
+		# them all at once, so a burst of cold calls is one write.
+		self._journal_records = []
+		self._journal_lock = threading.Lock()
+		# The roster index of each student in the queue, and the roster
+		# fingerprint, for saving snapshots. They are worked out again when
+		# the students in the queue change.
+		self._roster_indices = None
+		self._roster_fingerprint = None
 
 	def queue_from_roster(self, roster):
 		"""
@@ -86,44 +148,273 @@ class StudentQueue:
 
 		roster: a StudentRoster object
 		"""
-		self.student_queue = []
+		students = []
 		for student in roster.students:
 			if student.include_on_deck():
 				# Some of the students are marked to not be stored on deck; we
 				# do not include them in the queue.
-				self.student_queue.append(student)
+				students.append(student)
+		self._roster_indices = None
+		self.student_queue = OrderStatisticTree(students)
 		# Randomize the queue order to make the system more fair.
 		self.shuffle_queue()
 		# After every change to the queue, including creating the queue from a
 		# roster, we want to save it to the file. That way the program can be shut
 		# down at any moment without loss of data.
-		self.save_queue_to_file(INTERNAL_QUEUE_LOCATION)
+		self.save_queue_to_file(self.queue_location)
+
+	def merge_roster(self, changes):
+		"""
+		Update the queue in place when a new roster is imported, instead of
+		making a new queue. Everyone else keeps their place in the queue, so
+		re-importing a roster does not reset the fairness of cold calls.
+
+		- Removed students, and students who are now hidden, leave the queue.
+		- New students, and students who are no longer hidden, are inserted
+		  into a random position in the back part of the queue.
+		- Students whose data changed keep their position and call history.
+
+		changes: (RosterDiff) the differences between the old and new roster.
+		"""
+		self._roster_indices = None
+		for student in changes.removed:
+			if student in self.student_queue:
+				self.dequeue_student(student)
+		for change in changes.changed:
+			# The queue holds the Student object with the call history, which
+			# is equal to the one in the old roster.
+			queued = self.student_queue.find(change.old)
+			if queued is not None:
+				change.new.take_history(queued)
+			if not change.new.include_on_deck():
+				if queued is not None:
+					self.dequeue_student(queued)
+			elif queued is not None:
+				self.student_queue.replace(queued, change.new)
+			else:
+				self._enqueue_new_student(change.new)
+		for student in changes.added:
+			if student.include_on_deck():
+				self._enqueue_new_student(student)
+		self.save_queue_to_file(self.queue_location)
+
+	def _enqueue_new_student(self, student):
+		"""
+		Add a student who was not in the queue before. They go into the back
+		part of the queue, like a student who was just called on.
 
-	def load_queue_from_file(self, filename):
+		student: (Student)
 		"""
-		Fills the queue using saved queue data from a file.
+		if self.queue_size() == 0:
+			self.student_queue.insert(0, student)
+		else:
+			self.randomized_enqueue(student)
 
-		filename: (string) the name of the pickle file.
-		returns: (boolean) was the file read successfully?
+	def load_queue_from_file(self, filename, roster=None):
 		"""
+		Fills the queue using saved queue data from a file, replaying any cold
+		calls that were journaled after the file was saved.
+
+		filename: (string) the name of the queue file.
+		roster: (StudentRoster) the roster that the queue was saved with. A
+		snapshot can only be loaded with its roster; older pickle files don't
+		need one.
+		returns: (boolean) was the file read successfully? False if it is
+		missing, damaged, or belongs to a different roster.
+		"""
+		if self.persistence is not None:
+			self.persistence.flush()
+		self._roster_indices = None
 		try:
-			infile = open(filename, 'rb')
-			self.student_queue = pickle.load(infile, encoding='latin1')
-			infile.close()
+			if QUEUE_PERSISTENCE_MODE == "sqlite":
+				students = self._get_database(filename).load_queue()
+				if students:
+					self.student_queue = OrderStatisticTree(students)
+					self.shuffle_front_and_back()
+					self.save_queue_to_file(filename)
+					return True
+				# Nothing is in the database yet, so fall back to the queue file.
+			with open(filename, 'rb') as infile:
+				data = infile.read()
+			self.student_queue = OrderStatisticTree(self._read_students(data, roster))
+			replayed = self._replay_journal(filename, zlib.crc32(data))
 			self.shuffle_front_and_back()
+			if replayed or QUEUE_PERSISTENCE_MODE == "journal":
+				# Journal records refer to positions in the saved queue, so the
+				# shuffled queue needs a fresh snapshot before anything is
+				# journaled on top of it.
+				self.save_queue_to_file(filename)
 			return True
-		except Exception as e:
+		except (OSError, EOFError, pickle.UnpicklingError, SnapshotError):
 			return False
 
+	def _read_students(self, data, roster):
+		"""
+		Read the students in a queue file, in order.
+
+		data: (bytes) the contents of the queue file.
+		roster: (StudentRoster) the roster to join a snapshot with, or None.
+		returns: (list) the Students in the queue, front to back.
+		"""
+		if not queue_snapshot.is_snapshot(data):
+			# A queue file from an older version, with pickled Students. A file
+			# that can't be unpickled, or doesn't hold a list of Students, is
+			# treated like a damaged snapshot, so the queue is rebuilt.
+			try:
+				students = pickle.loads(data, encoding='latin1')
+			except (pickle.UnpicklingError, EOFError, AttributeError, ImportError,
+					IndexError, KeyError, TypeError, ValueError):
+				raise SnapshotError("The queue file is damaged.")
+			if not (isinstance(students, list) and all(isinstance(student, Student) for student in students)):
+				raise SnapshotError("The queue file does not hold a list of students.")
+			return students
+		if roster is None:
+			raise SnapshotError("A roster is needed to load the queue file.")
+		return queue_snapshot.decode(data, queue_snapshot.roster_order(
+			student for student in roster.students if student.include_on_deck()))
+
 	def save_queue_to_file(self, filename):
 		"""
-		Save the queue to a pickle file.
+		Save the queue to a queue file. The file is written under a temporary
+		name first, so a crash can never leave a half-written queue file.
+
+		filename: (string) the file to save the queue to.
+		"""
+		if QUEUE_PERSISTENCE_MODE == "sqlite":
+			# The database connection belongs to this thread, and each
+			# transaction is small, so it is never handed to the worker.
+			self._get_database(filename).save_queue(list(self.student_queue))
+			return
+		if self._roster_indices is None:
+			ordered = queue_snapshot.roster_order(self.student_queue)
+			self._roster_indices = {student: i for i, student in enumerate(ordered)}
+			self._roster_fingerprint = queue_snapshot.roster_fingerprint(ordered)
+		data = queue_snapshot.encode(self.student_queue, self._roster_indices, self._roster_fingerprint)
+		journal = self._get_journal(filename)
+		if self.persistence is None:
+			self._write_snapshot(filename, data, journal)
+			return
+		with self._journal_lock:
+			# The snapshot already holds the cold calls that are waiting.
+			self._journal_records = []
+		# A newer snapshot of the same file replaces one that is still waiting.
+		self.persistence.submit(filename, self._write_snapshot, filename, data, journal)
+
+	def _write_snapshot(self, filename, data, journal):
+		"""
+		Write a snapshot of the queue, and start its journal over.
 
 		filename: (string) the file to save the queue to.
+		data: (bytes) the encoded snapshot.
+		journal: (QueueJournal) the journal that belongs to the file.
+		"""
+		write_file_atomically(filename, data)
+		if QUEUE_PERSISTENCE_MODE == "journal":
+			# The snapshot now holds every cold call, so the journal starts over.
+			journal.reset(zlib.crc32(data))
+		elif os.path.exists(journal.filename):
+			journal.close()
+			os.remove(journal.filename)
+
+	def _get_journal(self, filename):
+		"""
+		Get the QueueJournal that belongs to a saved queue file.
+
+		filename: (string) the name of the queue file.
+		"""
+		journal_filename = filename + QUEUE_JOURNAL_SUFFIX
+		if self.journal is None or self.journal.filename != journal_filename:
+			if self.journal is not None:
+				self.journal.close()
+			self.journal = QueueJournal(journal_filename)
+		return self.journal
+
+	def _get_database(self, filename):
+		"""
+		Get the CoolCallDatabase that a queue file is saved to in "sqlite" mode.
+		It is shared with the roster of the same course.
+
+		filename: (string) the name of the queue file.
 		"""
-		outfile = open(filename, 'wb')
-		pickle.dump(self.student_queue, outfile)
-		outfile.close()
+		database_filename = database_location(filename)
+		if self.database is None or self.database.filename != database_filename:
+			if self.database is not None:
+				self.database.close()
+			self.database = open_database(database_filename)
+		return self.database
+
+	def _replay_journal(self, filename, snapshot_checksum):
+		"""
+		Re-apply the journaled cold calls to a queue that was just loaded from
+		its snapshot. Replay stops early if a record does not match the queue.
+
+		filename: (string) the name of the queue file.
+		snapshot_checksum: (int) the CRC-32 of the queue file's contents.
+		returns: (int) the number of records replayed.
+		"""
+		replayed = 0
+		for record in self._get_journal(filename).read(snapshot_checksum):
+			if (record.old_position >= self.queue_size() or
+					self.student_queue[record.old_position].fingerprint() != record.student_ref):
+				break
+			student = self.student_queue.pop(record.old_position)
+			self.student_queue.insert(record.new_position, student)
+			if record.flags & CALLED:
+				student.call_on(bool(record.flags & FLAGGED), date.fromtimestamp(record.timestamp))
+			replayed += 1
+		return replayed
+
+	def _save_moves(self, moves):
+		"""
+		Save the queue after one or more students have been moved, saving the
+		whole queue at most once. In journal mode, this appends one record per
+		move to the journal, and only saves the whole queue once the journal is
+		long enough. Otherwise, the whole queue is saved.
+
+		moves: (list) a (student, old_position, new_position, flag) tuple for
+		each move, in the order the moves were made. The flag is whether the
+		cold call was flagged, or None if the student was not called on.
+		"""
+		if QUEUE_PERSISTENCE_MODE == "sqlite":
+			database = self.database
+			if (database is None or database.filename != database_location(self.queue_location)
+					or not database.record_moves(self.student_queue, moves)):
+				self.save_queue_to_file(self.queue_location)
+			return
+		journal = self.journal
+		if (QUEUE_PERSISTENCE_MODE != "journal" or journal is None or
+				journal.filename != self.queue_location + QUEUE_JOURNAL_SUFFIX or
+				journal.num_records + len(self._journal_records) >= QUEUE_JOURNAL_COMPACT_INTERVAL):
+			self.save_queue_to_file(self.queue_location)
+			return
+		now = time.time()
+		records = []
+		for student, old_position, new_position, flag in moves:
+			flags = 0
+			if flag is not None:
+				flags |= CALLED
+				if flag:
+					flags |= FLAGGED
+			records.append((student.fingerprint(), old_position, new_position, flags, now))
+		if self.persistence is None:
+			for record in records:
+				journal.append(*record)
+			return
+		with self._journal_lock:
+			self._journal_records.extend(records)
+		self.persistence.submit(journal.filename, self._write_journal_records, journal)
+
+	def _write_journal_records(self, journal):
+		"""
+		Append the journal records that are waiting, on the persistence
+		worker's thread.
+
+		journal: (QueueJournal) the journal to append to.
+		"""
+		with self._journal_lock:
+			records, self._journal_records = self._journal_records, []
+		for record in records:
+			journal.append(*record)
 
 	def get_on_deck(self):
 		"""
@@ -135,16 +426,15 @@ class StudentQueue:
 		if there are not enough students in the class whose reveal code permits
 		them to be on-deck.
 		"""
-		on_deck = []
-		for i in range(min(NUM_ON_DECK, len(self.student_queue))):
-			on_deck.append(self.student_queue[i])
-		return on_deck
+		return self.student_queue.head(min(NUM_ON_DECK, len(self.student_queue)))
 
 	def shuffle_queue(self):
 		"""
 		Randomize the order of the entire queue.
 		"""
-		random.shuffle(self.student_queue)
+		students = list(self.student_queue)
+		random.shuffle(students)
+		self.student_queue = OrderStatisticTree(students)
 
 	def shuffle_front_and_back(self):
 		"""
@@ -156,29 +446,71 @@ class StudentQueue:
 		on-deck right away.
 		"""
 		midpoint = int(self.queue_size() * INSERT_DELAY)
-		front = self.student_queue[:midpoint]
-		back = self.student_queue[midpoint:]
+		students = list(self.student_queue)
+		front = students[:midpoint]
+		back = students[midpoint:]
 		random.shuffle(front)
 		random.shuffle(back)
-		self.student_queue = front + back
+		self.student_queue = OrderStatisticTree(front + back)
 
 
-	def take_off_deck(self, student):
+	def take_off_deck(self, student, flag=None):
 		"""
 		Remove a student from on-deck and re-insert them into the student
-		queue.
+		queue. If the student was called on, the caller records the cold call
+		with Student.call_on() first.
 
 		student: (Student) the student to be taken off deck
+		flag: (boolean) if the student was just called on, was the cold call
+		flagged? This is recorded in the journal, so the call can be replayed.
+		Raises ValueError if the student is not on deck.
 		"""
 		# Wouldn't want to remove somebody from on-deck who isn't on deck...
-		on_deck = self.get_on_deck()
-		assert student in on_deck
-		self.dequeue_student(student)
-		self.randomized_enqueue(student)
+		if student not in self.get_on_deck():
+			raise ValueError(f"{student.get_name()} is not on deck.")
+		moves = self._move_off_deck(student, flag)
 		# After every change to the queue, we want to save it to the file so
 		# the program can be shut down at any moment without loss of data.
-		self.save_queue_to_file(INTERNAL_QUEUE_LOCATION)
-	
+		self._save_moves(moves)
+
+	def take_off_deck_batch(self, pairs):
+		"""
+		Take several on-deck students off deck at once, such as a team called
+		on in a group activity. Each student is re-inserted into the queue as
+		by take_off_deck(), but the queue is saved once for the whole batch. As
+		for take_off_deck(), the caller records each cold call with
+		Student.call_on() first.
+
+		pairs: (list) a (student, flag) pair for each on-deck student, where
+		flag is whether their cold call was flagged.
+		Raises ValueError, before the queue is changed, if a student is not
+		on deck or is in the batch twice.
+		"""
+		on_deck = self.get_on_deck()
+		students = [student for student, _ in pairs]
+		for student in students:
+			if student not in on_deck:
+				raise ValueError(f"{student.get_name()} is not on deck.")
+		if len(set(students)) != len(students):
+			raise ValueError("A student can only be taken off deck once in a batch.")
+		moves = []
+		for student, flag in pairs:
+			moves += self._move_off_deck(student, flag)
+		self._save_moves(moves)
+
+	def _move_off_deck(self, student, flag):
+		"""
+		Move an on-deck student back into the queue, without saving.
+
+		student: (Student) the student to be taken off deck
+		flag: (boolean) was their cold call flagged? None if not called on.
+		returns: (list) the moves made, for _save_moves().
+		"""
+		old_position = self.student_queue.index(student)
+		self.dequeue_student(student)
+		new_position = self.randomized_enqueue(student)
+		return [(student, old_position, new_position, flag)]
+
 
 	def randomized_enqueue(self, student):
 		"""
@@ -190,6 +522,7 @@ class StudentQueue:
 		we don't want to enqueue a student.
 
 		student: (Student) the student to be added to the queue
+		returns: (int) the position the student was inserted at.
 		"""
 		# Set the insert delay such that a student can never be re-inserted into
 		# an on-deck position if the queue_size > NUM_ON_DECK.
@@ -200,6 +533,7 @@ class StudentQueue:
 		stop = self.queue_size()
 		rand_index = random.randint(start, stop)
 		self.student_queue.insert(rand_index, student)
+		return rand_index
 
 	def dequeue_student(self, student):
 		"""
@@ -217,12 +551,25 @@ class StudentQueue:
 		"""
 		return len(self.student_queue)
 	
+	def close(self):
+		"""
+		Close the queue's journal and database files, once any waiting writes
+		have been made. The queue can still be used afterwards.
+		"""
+		if self.persistence is not None:
+			self.persistence.flush()
+		if self.journal is not None:
+			self.journal.close()
+		if self.database is not None:
+			self.database.close()
+			self.database = None
+
 	def print_queue(self):
 		"""
 		Debugging function: prints out the students in the queue.
 		"""
-		for i in range(len(self.student_queue)):
-			print(i, " ", self.student_queue[i].get_name())
+		for i, student in enumerate(self.student_queue):
+			print(i, " ", student.get_name())
 			
 	def print_on_deck(self):
 		"""
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+
+###############################################################################
+"""
+Script Name:    StudentQueue Testing Script
+
+Description:    This script can be run at the command line to test the
+                StudentQueue class. The queue is saved to a temporary
+                directory, so the internal queue file is never touched.
+
+Author:         CoolCall Team
+
+Last Edited:    10/18/2026
+Last Edit By:   CoolCall Team
+"""
+###############################################################################
+import os
+import pickle
+import zlib
+from student import Student
+from student_roster import StudentRoster
+from student_queue import StudentQueue
+from order_statistic_tree import OrderStatisticTree
+from roster_diff import diff_rosters
+from test_support import make_roster, temporary_queue_file, call_students, history
+###############################################################################
+
+def test_take_off_deck():
+	queue = StudentQueue(temporary_queue_file())
+	queue.queue_from_roster(make_roster(30))
+	for _ in range(100):
+		on_deck = queue.get_on_deck()
+		assert len(on_deck) == 4
+		queue.take_off_deck(on_deck[0])
+		# A student who was just called is never put straight back on deck.
+		assert on_deck[0] not in queue.get_on_deck()
+		assert queue.queue_size() == 30
+
+def test_take_off_deck_batch():
+	filename = temporary_queue_file()
+	queue = StudentQueue(filename)
+	queue.queue_from_roster(make_roster(30))
+	for _ in range(40):
+		on_deck = queue.get_on_deck()
+		calls = [(on_deck[0], True), (on_deck[2], False)]
+		for student, flag in calls:
+			student.call_on(flag)
+		queue.take_off_deck_batch(calls)
+		# Nobody who was just called is put straight back on deck.
+		assert not {student for student, _ in calls} & set(queue.get_on_deck())
+		assert queue.queue_size() == 30
+	assert sum(len(s.dates_called) for s in queue.student_queue) == 80
+	assert sum(s.total_num_flags for s in queue.student_queue) == 40
+	# A bad batch is rejected before the queue is changed.
+	order = list(queue.student_queue)
+	on_deck = queue.get_on_deck()
+	for calls in ([(on_deck[0], False), (order[-1], False)], [(on_deck[1], False), (on_deck[1], True)]):
+		try:
+			queue.take_off_deck_batch(calls)
+			assert False, "a bad batch was taken off deck"
+		except ValueError:
+			pass
+		assert list(queue.student_queue) == order
+	queue.close()
+
+	loaded = StudentQueue(filename)
+	assert loaded.load_queue_from_file(filename, make_roster(30))
+	assert history(loaded) == history(queue)
+
+def test_journal_replay():
+	filename = temporary_queue_file()
+	queue = StudentQueue(filename)
+	queue.queue_from_roster(make_roster(30))
+	call_students(queue, 50)
+
+	with open(filename, "rb") as f:
+		data = f.read()
+	replayed = StudentQueue(filename)
+	replayed.student_queue = OrderStatisticTree(replayed._read_students(data, make_roster(30)))
+	assert replayed._replay_journal(filename, zlib.crc32(data)) == 50
+	assert [s.get_name() for s in replayed.student_queue] == [s.get_name() for s in queue.student_queue]
+	assert history(replayed) == history(queue)
+
+def test_torn_record():
+	filename = temporary_queue_file()
+	queue = StudentQueue(filename)
+	queue.queue_from_roster(make_roster(30))
+	call_students(queue, 10)
+	queue.journal.close()
+	journal_filename = queue.journal.filename
+	size = os.path.getsize(journal_filename)
+	with open(journal_filename, "ab") as f:
+		f.write(b"\x01\x02\x03")
+
+	loaded = StudentQueue(filename)
+	assert loaded.load_queue_from_file(filename, make_roster(30))
+	assert history(loaded) == history(queue)
+	# Loading compacts the journal into a new snapshot.
+	assert os.path.getsize(journal_filename) < size
+
+def test_merge_roster():
+	old_roster = make_roster(30)
+	queue = StudentQueue(temporary_queue_file())
+	queue.queue_from_roster(old_roster)
+	call_students(queue, 40)
+	before = [s.UO_ID for s in queue.student_queue]
+	histories = {s.UO_ID: (s.total_num_flags, list(s.dates_called)) for s in queue.student_queue}
+
+	new_roster = StudentRoster()
+	for student in old_roster.students:
+		uo_id = student.UO_ID
+		if uo_id == "951000000":
+			continue  # removed
+		email = "new@uoregon.edu" if uo_id == "951000001" else student.email_address
+		reveal_code = "1" if uo_id == "951000002" else "0"
+		new_roster.add_student(Student(student.first_name, student.last_name, uo_id, email,
+									   student.phonetic_spelling, reveal_code))
+	new_roster.add_student(Student("New", "Student", "951000099", "ns@uoregon.edu", "new", "0"))
+	queue.merge_roster(diff_rosters(old_roster, new_roster))
+
+	after = [s.UO_ID for s in queue.student_queue]
+	# Everyone who stayed keeps their relative order.
+	kept = [uo_id for uo_id in before if uo_id not in ("951000000", "951000002")]
+	assert [uo_id for uo_id in after if uo_id != "951000099"] == kept
+	assert "951000099" in after[int(0.35 * 28):]
+	for student in queue.student_queue:
+		if student.UO_ID in histories:
+			assert (student.total_num_flags, list(student.dates_called)) == histories[student.UO_ID]
+		if student.UO_ID == "951000001":
+			assert student.email_address == "new@uoregon.edu"
+
+def test_snapshot_needs_its_roster():
+	filename = temporary_queue_file()
+	roster = make_roster(30)
+	# A hidden student is on the roster, but never in the queue.
+	roster.add_student(Student("Hidden", "Student", "951000099", "hs@uoregon.edu", "hidden", "1"))
+	queue = StudentQueue(filename)
+	queue.queue_from_roster(roster)
+	call_students(queue, 30)
+	queue.save_queue_to_file(filename)
+	# Only the queue order and call history are stored, not the students' details.
+	assert os.path.getsize(filename) < 30 * 20 + 30 * 4 + 64
+
+	assert not StudentQueue(filename).load_queue_from_file(filename)
+	assert not StudentQueue(filename).load_queue_from_file(filename, make_roster(31))
+	loaded = StudentQueue(filename)
+	assert loaded.load_queue_from_file(filename, roster)
+	assert history(loaded) == history(queue)
+
+def test_pickle_file_is_converted():
+	filename = temporary_queue_file()
+	queue = StudentQueue(filename)
+	queue.queue_from_roster(make_roster(30))
+	call_students(queue, 30)
+	with open(filename, "wb") as f:
+		f.write(pickle.dumps(list(queue.student_queue)))
+	os.remove(queue.journal.filename)
+
+	loaded = StudentQueue(filename)
+	assert loaded.load_queue_from_file(filename)
+	assert history(loaded) == history(queue)
+	# Loading saves a new snapshot in the binary format.
+	reloaded = StudentQueue(filename)
+	assert reloaded.load_queue_from_file(filename, make_roster(30))
+	assert history(reloaded) == history(queue)
+
+class MissingClass:
+	pass
+
+class OldStudent:
+	def __reduce__(self):
+		return (Student.__new__, (Student,), {"first_name": "A"})
+
+def test_bad_pickle_file_is_not_loaded():
+	filename = temporary_queue_file()
+	# A list of something other than Students, a pickled class that no longer
+	# exists, and a Student pickled without all of its fields.
+	for data in (pickle.dumps([1, 2, 3]), pickle.dumps(3),
+				 pickle.dumps([MissingClass()]).replace(b"student_queue_test", b"missing_module_xyz"),
+				 pickle.dumps([OldStudent()]), b"not a pickle"):
+		with open(filename, "wb") as f:
+			f.write(data)
+		assert not StudentQueue(filename).load_queue_from_file(filename, make_roster(30))
+
+if __name__ == "__main__":
+	test_take_off_deck()
+	test_take_off_deck_batch()
+	test_journal_replay()
+	test_torn_record()
+	test_merge_roster()
+	test_snapshot_needs_its_roster()
+	test_pickle_file_is_converted()
+	test_bad_pickle_file_is_not_loaded()
@@ -17,6 +17,8 @@ Last Edit By:   Madison Werries
 """
 ###############################################################################
 from student import Student
+from roster_diff import diff_rosters
+from cool_call_database import open_database, database_location
 from os.path import exists
 from constants import *
 ###############################################################################
@@ -28,9 +30,20 @@ class StudentRoster:
 		Attributes
 		=======================================================================
 		students
-			a list of Student objects
-		lines
-			the lines read in from the roster txt file
+			a set of Student objects
+		roster_location
+			the internal file that the roster is saved to
+		source_filename
+			the roster file that the students were imported from, or None if
+			no roster has been imported
+		errors
+			a list of (line number, error message) pairs, one for each badly
+			formatted line found by the last import
+		heading
+			the first line of the roster file, which is not a student
+		
+		In "sqlite" persistence mode, the roster is saved to and loaded from the
+		CoolCallDatabase next to roster_location, instead of a text file.
 		
 		Methods
 		=======================================================================
@@ -40,6 +53,8 @@ class StudentRoster:
 			Saves the roster data to an internal file.
 		compare()
 			Compares the contents of two rosters, returning the differences.
+		diff(new_roster)
+			Returns the students added, removed and changed by a new roster.
 		export_roster_to_file(directory)
 			Exports the roster to a file in the specified directory.
 		add_student(student)
@@ -49,68 +64,147 @@ class StudentRoster:
 		num_students()
 			Returns the number of students currently in the queue.
 		get_errors()
-			Returns any errors with the format of a provided roster file.
+			Returns any errors with the format of the last imported roster file.
+		close()
+			Closes the roster's database, in "sqlite" mode.
 	"""
 	
-	# Constructs an empty student roster object.
-	def __init__(self):
+	# Constructs an empty student roster object. The roster is saved internally
+	# to roster_location, INTERNAL_ROSTER_LOCATION by default.
+	def __init__(self, roster_location=None):
 		self.students = set()
-		try:
-			with open(INTERNAL_ROSTER_LOCATION, "r") as f:
-				self.lines = f.readlines()
-		except FileNotFoundError:
-			self.lines = []
+		self.errors = []
+		self.roster_location = roster_location or INTERNAL_ROSTER_LOCATION
+		self.heading = ""
+		# The students in the order of the roster file, for saving and exporting.
+		self._file_order = []
+		self._database = None
+		if exists(self.roster_location):
+			self.source_filename = self.roster_location
+		else:
+			self.source_filename = None
 
 	def import_roster_from_file(self, filename):
 		"""
 		Creates a new roster from student data in the specified file.
 		If not possible, return a descriptive error.
 
+		The file is read one line at a time, checking each line and creating
+		its Student in a single pass, so memory use does not depend on the size
+		of the file. Every badly formatted line is reported, not just the first.
+
 		filename: (string) The file path of the roster we want to import.
 		returns: (string) a descriptive error, or an empty string if the
 		import is successful.
 		"""
+		if QUEUE_PERSISTENCE_MODE == "sqlite" and filename == self.roster_location:
+			heading, students = self._get_database().load_roster()
+			if heading is not None:
+				for student in students:
+					self.add_student(student)
+				self.heading = heading
+				self._file_order = students
+				self.source_filename = self.roster_location
+				return ""
+			# Nothing is in the database yet, so fall back to the roster file.
 		try:
 			file = open(filename, 'r')
 		except (FileNotFoundError, IsADirectoryError):
 			return "Unable to open file."
-		try:
-			self.lines = file.readlines()
-		except UnicodeDecodeError:
-			return "Invalid start byte. Are you sure this is a text file?"
-
-		# Check the file format before parsing any data
-		error = self.get_errors()
-		if error:
-			return error
-
-		# The first line of the roster file is a comment, and so is not parsed
-		# when reading in student data.
-		for line in self.lines[1:]:
-			# Get rid of any whitespace and parse the fields per-line
-			line = line.strip()
-			fields = line.split("\t")
-
-			# Read in the student's data from the roster file
-			first = fields[0]
-			last = fields[1]
-			UO_ID = fields[2]
-			email = fields[3]
-			phonetic = fields[4]
-			reveal_code = fields[5]
-
-			# Create a new instance of the student class and add them to the roster
-			student = Student(first, last, UO_ID, email, phonetic, reveal_code)
+
+		students = []
+		line_numbers = []
+		self.errors = []
+		with file:
+			try:
+				for line_number, line in enumerate(file, start=1):
+					# The first line of the roster file is a comment, and so is not
+					# parsed when reading in student data.
+					if line_number == 1:
+						self.heading = line.rstrip("\r\n")
+						continue
+					# Get rid of any whitespace and parse the fields per-line
+					fields = line.strip().split(ROSTER_DELIMITER)
+					error = self._check_fields(fields)
+					if error:
+						self.errors.append((line_number, error))
+					elif not self.errors:
+						# Read in the student's data from the roster file.
+						# Once there is an error, the import will fail, so we
+						# only keep checking the remaining lines.
+						first, last, UO_ID, email, phonetic, reveal_code = fields
+						students.append(Student(first, last, UO_ID, email, phonetic, reveal_code))
+						line_numbers.append(line_number)
+			except UnicodeDecodeError:
+				self.errors = []
+				return "Invalid start byte. Are you sure this is a text file?"
+
+		if not self.errors:
+			self.errors = self._check_duplicate_ids(students, line_numbers)
+		if self.errors:
+			return self.get_errors()
+
+		# Add the new Students to the roster
+		for student in students:
 			self.add_student(student)
+		self._file_order = students
+		self.source_filename = filename
 		return ""
 
+	def _get_database(self):
+		"""
+		Get the CoolCallDatabase the roster is saved to in "sqlite" mode. It is
+		shared with the queue of the same course.
+		"""
+		if self._database is None:
+			self._database = open_database(database_location(self.roster_location))
+		return self._database
+
+	def close(self):
+		"""
+		Let go of the roster's share of the database, once the roster is no
+		longer used.
+		"""
+		if self._database is not None:
+			self._database.close()
+			self._database = None
+
+	def _students_in_file_order(self):
+		"""
+		returns: (list) the students, in the order of the roster file, followed
+		by any students added since.
+		"""
+		ordered = [student for student in self._file_order if student in self.students]
+		listed = set(ordered)
+		ordered.extend(student for student in self.students if student not in listed)
+		return ordered
+
 	def save_internally(self):
 		""" 
-		Saves the roster data to an internal file. 
+		Saves the roster data to an internal file, written from the students
+		that were imported, so it always matches them even if the original
+		file has since been changed or moved. In "sqlite" mode, the roster is
+		saved to the database instead.
+		"""
+		if QUEUE_PERSISTENCE_MODE == "sqlite":
+			self._get_database().save_roster(self.heading, self._students_in_file_order())
+		else:
+			self._write_roster_file(self.roster_location)
+		self.source_filename = self.roster_location
+
+	def _write_roster_file(self, path):
+		"""
+		Write the heading and the students to a roster file, in the order of
+		the roster file they were imported from, and in the same format.
+
+		path: (string) the file to write
 		"""
-		with open(INTERNAL_ROSTER_LOCATION, "w") as internal_file:
-			for line in self.lines:
-				internal_file.write(line)
+		with open(path, "w") as file:
+			file.write(self.heading + "\n")
+			for student in self._students_in_file_order():
+				file.write(ROSTER_DELIMITER.join([
+					student.first_name, student.last_name, student.UO_ID,
+					student.email_address, student.phonetic_spelling, student.reveal_code]) + "\n")
 
 	def compare(self, other_roster):
 		""" 
@@ -127,6 +221,17 @@ class StudentRoster:
 		"""
 		return self.students.symmetric_difference(other_roster.students)
 
+	def diff(self, new_roster):
+		"""
+		Finds the students who would be added, removed, or changed by replacing
+		this roster with a new one. Unlike compare(), a student whose email
+		address changes is reported once, as a changed student.
+
+		new_roster: (Roster) the roster that would replace self
+		returns: (RosterDiff) see roster_diff.py
+		"""
+		return diff_rosters(self, new_roster)
+
 	def export_roster_to_file(self, directory):
 		""" 
 		Exports the roster to a file, called roster.txt or roster<i>.txt,
@@ -136,9 +241,7 @@ class StudentRoster:
 		returns: (string) the path of the specified directory
 		"""
 		path = self._get_path_name(directory)
-		with open(path, "w") as f:
-			for line in self.lines:
-				f.write(line)
+		self._write_roster_file(path)
 		return path
 
 	def _get_path_name(self, directory):
@@ -190,36 +293,66 @@ class StudentRoster:
 
 	def get_errors(self):
 		""" 
-		This function checks that a roster file is in the correct format.
+		Describes the errors found in the format of the last imported roster
+		file, each with the line it was found on. Long lists of errors are
+		shortened to the first ROSTER_ERRORS_SHOWN errors.
+
+		returns: (string) a descriptive error message, or an empty string
+		"""
+		if not self.errors:
+			return ""
+		if len(self.errors) == 1:
+			line_number, error = self.errors[0]
+			return f"Line {line_number}: {error}"
+		shown = [f"Line {line_number}: {error}" for line_number, error in self.errors[:ROSTER_ERRORS_SHOWN]]
+		message = f"{len(self.errors)} lines are incorrectly formatted.\n" + "\n".join(shown)
+		if len(self.errors) > ROSTER_ERRORS_SHOWN:
+			message += f"\n...and {len(self.errors) - ROSTER_ERRORS_SHOWN} more."
+		return message
+
+	def _check_duplicate_ids(self, students, line_numbers):
+		"""
+		Checks that no two students in a roster file share a UO ID, as every
+		stored record of a student's cold calls is kept under their UO ID. The
+		students are sorted by UO ID, so that the UO ID is never used as a
+		dictionary key.
+
+		students: (list) the Students read from the file
+		line_numbers: (list) the line that each Student was read from
+		returns: (list) a (line number, error message) pair for each student
+		whose UO ID is already used on an earlier line
+		"""
+		errors = []
+		by_id = sorted(zip(students, line_numbers), key=lambda pair: (pair[0].UO_ID, pair[1]))
+		for (earlier, first_line), (student, line_number) in zip(by_id, by_id[1:]):
+			if student.UO_ID == earlier.UO_ID:
+				errors.append((line_number, f"UO ID {student.UO_ID} is already used on line {first_line}."))
+		return sorted(errors)
+
+	def _check_fields(self, fields):
+		""" 
+		This function checks that one line of a roster file is in the correct format.
 		Namely, it must contain the correct number of fields (6). 
 		The function checks that these fields are of the correct type and/or format. 
 
+		fields: (list) the fields of the line, split on the delimiter
 		returns: (string) a descriptive error message, or an empty string
 		"""
-		# The first line of the roster file is a comment, and so is not parsed
-		# when reading in student data.
-		for line in self.lines[1:]:
-			# Each line is separated by a line-feed character, which is not part
-			# of any data field
-			line = line.strip()
-			# The data fields are separated by a character (tab by default)
-			# specified in the constants file.
-			fields = line.split(ROSTER_DELIMITER)
-			if len(fields) != 6:
-				return ("Incorrect number of fields in the roster file. Each entry in the roster file should "
-								"be formatted in the following manner: <first_name><delimiter><last_name><delimiter><UO "
-								"ID><delimiter><email_address><delimiter><phonetic_spelling><delimiter><reveal_code><LF>")
-			else:
-				UO_ID = fields[2]
-				if len(UO_ID) != 9:
-					return "UO IDs must be 9 digits long."
-				if not UO_ID.isnumeric():
-					return "UO IDs must only contain digits"
-				email_address = fields[3]
-				""""  @uoregon.edujosh@gmail.com """
-				if not (email_address.endswith("@uoregon.edu") or email_address.endswith("cs.uoregon.edu")):
-					return "Incorrect email address format."
-				reveal_code = fields[5]
-				if not reveal_code.isdigit():
-					return "Reveal codes must be 0 for 'display', or any other value for 'do not display'"
+		# The data fields are separated by a character (tab by default)
+		# specified in the constants file.
+		if len(fields) != 6:
+			return ("Incorrect number of fields in the roster file. Each entry in the roster file should "
+							"be formatted in the following manner: <first_name><delimiter><last_name><delimiter><UO "
+							"ID><delimiter><email_address><delimiter><phonetic_spelling><delimiter><reveal_code><LF>")
+		UO_ID = fields[2]
+		if len(UO_ID) != 9:
+			return "UO IDs must be 9 digits long."
+		if not UO_ID.isnumeric():
+			return "UO IDs must only contain digits"
+		email_address = fields[3]
+		if not (email_address.endswith("@uoregon.edu") or email_address.endswith("cs.uoregon.edu")):
+			return "Incorrect email address format."
+		reveal_code = fields[5]
+		if not reveal_code.isdigit():
+			return "Reveal codes must be 0 for 'display', or any other value for 'do not display'"
 		return ""
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+
+###############################################################################
+"""
+Script Name:    StudentRoster Testing Script
+
+Description:    This script can be run at the command line to test importing
+                roster files with the StudentRoster class.
+
+Author:         CoolCall Team
+
+Last Edited:    10/18/2026
+Last Edit By:   CoolCall Team
+"""
+###############################################################################
+import os
+from student_roster import StudentRoster
+from student import Student
+from test_support import temporary_directory
+###############################################################################
+
+def write_roster(lines):
+	filename = os.path.join(temporary_directory(), "roster.txt")
+	with open(filename, "w") as f:
+		f.write("Example Roster\n")
+		for line in lines:
+			f.write(line + "\n")
+	return filename
+
+def test_import():
+	filename = write_roster([
+		"Abby\tAbbyson\t951000000\taabbyson@uoregon.edu\ta-bee\t0",
+		"Adam\tAdamson\t951000001\taadamson@uoregon.edu\ta-duhm\t1"])
+	roster = StudentRoster()
+	assert roster.import_roster_from_file(filename) == ""
+	assert roster.num_students() == 2
+	names = sorted(student.get_name() for student in roster.students)
+	assert names == ["Abby Abbyson", "Adam Adamson"]
+
+def test_all_errors_reported():
+	filename = write_roster([
+		"Abby\tAbbyson\t95100000\taabbyson@uoregon.edu\ta-bee\t0",
+		"Adam\tAdamson\t951000001\taadamson@uoregon.edu\ta-duhm\t0",
+		"Bob\tBobson\t951000002\tbob@gmail.com\tbob\t0",
+		"Cat\tCatson"])
+	roster = StudentRoster()
+	error = roster.import_roster_from_file(filename)
+	assert [line_number for line_number, _ in roster.errors] == [2, 4, 5]
+	assert "Line 4: Incorrect email address format." in error
+	# A roster with errors is not imported at all.
+	assert roster.num_students() == 0
+
+def test_duplicate_ids_rejected():
+	filename = write_roster([
+		"Abby\tAbbyson\t951000000\taabbyson@uoregon.edu\ta-bee\t0",
+		"Adam\tAdamson\t951000001\taadamson@uoregon.edu\ta-duhm\t0",
+		"Bob\tBobson\t951000000\tbbobson@uoregon.edu\tbob\t0",
+		"Cat\tCatson\t951000000\tccatson@uoregon.edu\tcat\t0"])
+	roster = StudentRoster()
+	error = roster.import_roster_from_file(filename)
+	assert [line_number for line_number, _ in roster.errors] == [4, 5]
+	assert "Line 4: UO ID 951000000 is already used on line 2." in error
+	assert roster.num_students() == 0
+
+def test_diff():
+	old = StudentRoster()
+	old.import_roster_from_file(write_roster([
+		"Abby\tAbbyson\t951000000\taabbyson@uoregon.edu\ta-bee\t0",
+		"Adam\tAdamson\t951000001\taadamson@uoregon.edu\ta-duhm\t0",
+		"Bob\tBobson\t951000002\tbbobson@uoregon.edu\tbob\t0"]))
+	new = StudentRoster()
+	new.import_roster_from_file(write_roster([
+		"Abby\tAbbyson\t951000000\taabbyson@uoregon.edu\ta-bee\t0",
+		"Adam\tAdamson\t951000001\tadam@uoregon.edu\ta-duhm\t0",
+		"Cat\tCatson\t951000003\tccatson@uoregon.edu\tcat\t0"]))
+	changes = old.diff(new)
+	assert [s.get_name() for s in changes.added] == ["Cat Catson"]
+	assert [s.get_name() for s in changes.removed] == ["Bob Bobson"]
+	assert len(changes.changed) == 1
+	assert changes.changed[0].new.email_address == "adam@uoregon.edu"
+	assert changes.changed[0].fields == ["email_address"]
+	assert len(changes) == 3
+	assert len(old.diff(old)) == 0
+
+def test_diff_with_shared_ids():
+	# Rosters built in code can have students who share a UO ID. They can't be
+	# matched up, whichever roster they are in.
+	abby = Student("Abby", "Abbyson", "951000000", "aabbyson@uoregon.edu", "a-bee", "0")
+	twin = Student("Twin", "Twinson", "951000000", "ttwinson@uoregon.edu", "twin", "0")
+	adam = Student("Adam", "Adamson", "951000001", "aadamson@uoregon.edu", "a-duhm", "0")
+	one, two = StudentRoster(), StudentRoster()
+	for student in (abby, adam):
+		one.add_student(student)
+	for student in (abby, twin, adam):
+		two.add_student(student)
+	for old, new in ((one, two), (two, one)):
+		changes = old.diff(new)
+		assert sorted(s.get_name() for s in changes.added) == sorted(
+			s.get_name() for s in new.students if s is not adam)
+		assert sorted(s.get_name() for s in changes.removed) == sorted(
+			s.get_name() for s in old.students if s is not adam)
+		assert changes.changed == []
+
+def test_save_uses_the_imported_students():
+	lines = ["Abby\tAbbyson\t951000000\taabbyson@uoregon.edu\ta-bee\t0",
+			 "Adam\tAdamson\t951000001\taadamson@uoregon.edu\ta-duhm\t1"]
+	filename = write_roster(lines)
+	internal = os.path.join(temporary_directory(), "roster.txt")
+	roster = StudentRoster(internal)
+	assert roster.import_roster_from_file(filename) == ""
+	# The file is deleted after it was imported, but before it is saved.
+	os.remove(filename)
+	roster.save_internally()
+	exported = roster.export_roster_to_file(temporary_directory())
+	for path in (internal, exported):
+		with open(path) as f:
+			assert f.read() == "Example Roster\n" + "".join(line + "\n" for line in lines)
+
+if __name__ == "__main__":
+	test_import()
+	test_all_errors_reported()
+	test_duplicate_ids_rejected()
+	test_diff()
+	test_diff_with_shared_ids()
+	test_save_uses_the_imported_students()
@@ -14,6 +14,8 @@ Last Edit By:   Amy Reichhold
 """
 ###############################################################################
 from student import Student
+from datetime import date
+import pickle
 ###############################################################################
 
 # Set of tests for the student class
@@ -56,7 +58,42 @@ def test_call_on():
     print(a.total_num_flags)
     print(a.dates_called)
 
+def test_call_history():
+    f = Student(
+        "First", "Last", "950000001", "student@uoregon.edu", "first", "0")
+    f.call_on(True, date(2022, 1, 28))
+    f.call_on(False, date(2022, 1, 30))
+    assert f.total_num_flags == 1
+    assert f.times_called() == 2
+    assert f.last_called() == date(2022, 1, 30)
+    assert f.call_history() == [(date(2022, 1, 28), True), (date(2022, 1, 30), False)]
+
+def test_pickle():
+    f = Student(
+        "First", "Last", "950000001", "student@uoregon.edu", "first", "0")
+    for day in range(1, 20):
+        f.call_on(day % 3 == 0, date(2022, 1, day))
+    g = pickle.loads(pickle.dumps(f))
+    assert g == f and hash(g) == hash(f)
+    assert g.call_history() == f.call_history()
+    assert g.total_num_flags == f.total_num_flags
+
+def test_unpickle_old_format():
+    # Queue files saved before Students had slots store a dictionary.
+    g = Student.__new__(Student)
+    g.__setstate__({
+        "first_name": "First", "last_name": "Last", "UO_ID": "950000000",
+        "email_address": "student@uoregon.edu", "phonetic_spelling": "first",
+        "reveal_code": "0", "total_num_flags": 1,
+        "dates_called": [date(2022, 1, 28), date(2022, 1, 30)]})
+    assert g == a
+    assert g.dates_called == [date(2022, 1, 28), date(2022, 1, 30)]
+    assert g.total_num_flags == 1
+
 if __name__ == "__main__":
     test_equality()
     test_include_on_deck()
-    test_call_on()
\ No newline at end of file
+    test_call_on()
+    test_call_history()
+    test_pickle()
+    test_unpickle_old_format()
\ No newline at end of file
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+
+###############################################################################
+"""
+Script Name:    Summary Store
+
+Description:    The SummaryStore Class for the CoolCall Program.
+                Keeps per-student cold call statistics in a binary file of
+                fixed-width records, one record per student. Recording a cold
+                call patches a single record in place, so the cost of a cold
+                call does not grow with the size of the class or the number of
+                calls. The human-readable summary file is produced from these
+                statistics by the LogManager, only when it is needed.
+
+                Each record is stored with the student's UO ID, as in the call
+                history log. When the store is reopened, the records are sorted
+                by UO ID and matched with the students by binary search, so the
+                UO ID is never used as a dictionary key.
+
+Authors:        CoolCall Team
+
+Last Edited:    10/18/2026
+Last Edit By:   CoolCall Team
+"""
+###############################################################################
+from bisect import bisect_left
+import struct
+import os
+###############################################################################
+
+# The file starts with a magic string and format version.
+HEADER = struct.Struct("<4sH")
+MAGIC = b"CCSS"
+VERSION = 3
+
+# One record per student: the student's UO ID, the number of times they have
+# been called on and flagged, and the ordinal of the last day they were
+# called on (0 if they have never been called on).
+RECORD = struct.Struct("<IIII")
+
+
+class SummaryStore():
+    """
+    A class for keeping an indexed, fixed-width record of each student's
+    cold call statistics.
+
+    Attributes
+    =======================================================================
+    filename
+        The path of the binary store file.
+
+    Methods
+    =======================================================================
+    bind(students)
+        Make sure that every student has a record, matching the student's
+        call history.
+
+    record_call(student, flagged, day)
+        Update a student's record after a cold call.
+
+    stats(student)
+        Returns the statistics recorded for a student.
+
+    close()
+        Close the store file.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        # Maps each Student to its record: [slot, UO ID, times called, times
+        # flagged, last day called]. Every Student gets its own slot.
+        self._records = {}
+        # The records read from the file, sorted by UO ID, as [UO ID, slot,
+        # times called, times flagged, last day called]. The slot is set to
+        # None once a Student has claimed the record.
+        self._stored = []
+        self._stored_ids = []
+        self._num_slots = 0
+        if os.path.exists(filename):
+            self._file = open(filename, "r+b")
+            self._load()
+        else:
+            self._file = open(filename, "w+b")
+            self._file.write(HEADER.pack(MAGIC, VERSION))
+            self._file.flush()
+
+    def _load(self):
+        """
+        Read all of the records in an existing store file. They are matched
+        with Students by the next bind(). A store with a bad header, or a
+        record cut short by a crash, is cleared and rebuilt by the next bind().
+        """
+        data = self._file.read()
+        if len(data) < HEADER.size or HEADER.unpack_from(data) != (MAGIC, VERSION):
+            self._file.seek(0)
+            self._file.truncate()
+            self._file.write(HEADER.pack(MAGIC, VERSION))
+            self._file.flush()
+            return
+        self._num_slots = (len(data) - HEADER.size) // RECORD.size
+        for slot in range(self._num_slots):
+            uo_id, called, flagged, last_day = RECORD.unpack_from(
+                data, HEADER.size + slot * RECORD.size)
+            self._stored.append([uo_id, slot, called, flagged, last_day])
+        self._stored.sort()
+        self._stored_ids = [stored[0] for stored in self._stored]
+        self._file.truncate(HEADER.size + self._num_slots * RECORD.size)
+
+    def _claim(self, student, stats):
+        """
+        Give a student a record of their own: a record in the file with the
+        student's UO ID, if there is one that has not been claimed, or else a
+        new record holding the given statistics.
+
+        student: (Student)
+        stats: (list) the times called, times flagged and last day called
+        for a new record
+        returns: (list) the student's record
+        """
+        uo_id = int(student.UO_ID)
+        record = None
+        i = bisect_left(self._stored_ids, uo_id)
+        while i < len(self._stored) and self._stored_ids[i] == uo_id:
+            stored = self._stored[i]
+            if stored[1] is not None:
+                record = [stored[1], uo_id] + stored[2:]
+                stored[1] = None
+                break
+            i += 1
+        if record is None:
+            record = [self._num_slots, uo_id] + stats
+            self._num_slots += 1
+            self._write_record(record)
+        self._records[student] = record
+        return record
+
+    def _write_record(self, record):
+        self._file.seek(HEADER.size + record[0] * RECORD.size)
+        self._file.write(RECORD.pack(*record[1:]))
+
+    def bind(self, students):
+        """
+        Make sure that every student has a record, and that each record
+        matches the call history stored with the student. This is done once
+        when the set of students changes, not on every cold call.
+
+        students: (iterable) the Student objects to keep records for
+        """
+        for student in students:
+            called = student.times_called()
+            last_day = student.last_called().toordinal() if called else 0
+            expected = [called, student.total_num_flags, last_day]
+            record = self._records.get(student)
+            if record is None:
+                record = self._claim(student, expected)
+            if record[2:] != expected:
+                record[2:] = expected
+                self._write_record(record)
+        self._file.flush()
+
+    def record_call(self, student, flagged: bool, day):
+        """
+        Update a student's record after a cold call, patching the one record
+        in the store file.
+
+        student: (Student) the student that has been cold called
+        flagged: (boolean) has a flag been set for this cold call?
+        day: (date) the day of the cold call
+        """
+        record = self._records.get(student)
+        if record is None:
+            record = self._claim(student, [0, 0, 0])
+        record[2] += 1
+        if flagged:
+            record[3] += 1
+        record[4] = day.toordinal()
+        self._write_record(record)
+        self._file.flush()
+
+    def stats(self, student):
+        """
+        Returns the statistics recorded for a student.
+
+        student: (Student)
+        returns: (tuple) the number of times the student has been called on,
+        the number of times they have been flagged, and the ordinal of the
+        last day they were called on (0 if never).
+        """
+        record = self._records.get(student)
+        if record is None:
+            return (0, 0, 0)
+        return tuple(record[2:])
+
+    def close(self):
+        """
+        Close the store file.
+        """
+        self._file.close()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+
+###############################################################################
+"""
+Script Name:    SummaryStore Testing Script
+
+Description:    This script can be run at the command line to test the summary
+                store, and the summary file that the LogManager writes from it
+                after a pause in cold calls. All files are written to temporary
+                directories.
+
+Author:         CoolCall Team
+
+Last Edited:    10/18/2026
+Last Edit By:   CoolCall Team
+"""
+###############################################################################
+import os
+from datetime import date
+from summary_store import SummaryStore
+from log_manager import LogManager
+from instructor_interaction_model import InstructorInteractionModel
+from latency_recorder import LatencyRecorder
+from student import Student
+from test_support import make_roster, temporary_directory
+from constants import SUMMARY_DEBOUNCE_MS
+###############################################################################
+
+def colliding_students():
+    # These two students have the same 32-bit fingerprint.
+    return [Student(f"First{i}", f"Last{i}", str(951000000 + i), f"s{i}@uoregon.edu", "", "0")
+            for i in (50225, 274866)]
+
+def read_summary(logs_location):
+    with open(os.path.join(logs_location, "summary.txt")) as f:
+        return [line.split("\t")[:3] for line in f.readlines()[2:]]
+
+def test_students_never_share_a_record():
+    students = colliding_students()
+    assert students[0].fingerprint() == students[1].fingerprint()
+    filename = os.path.join(temporary_directory(), "summary_store.dat")
+    store = SummaryStore(filename)
+    store.bind(students)
+    day = date(2026, 10, 5)
+    students[0].call_on(True, day)
+    store.record_call(students[0], True, day)
+    assert store.stats(students[0]) == (1, 1, day.toordinal())
+    assert store.stats(students[1]) == (0, 0, 0)
+    store.close()
+
+    # Each student gets their own record back when the store is reopened.
+    store = SummaryStore(filename)
+    store.bind(students)
+    assert store.stats(students[0]) == (1, 1, day.toordinal())
+    assert store.stats(students[1]) == (0, 0, 0)
+    assert os.path.getsize(filename) == 6 + 2 * 16
+    # Even students built in code with the same UO ID get their own records.
+    twin = Student("Twin", "Twinson", students[0].UO_ID, "twin@uoregon.edu", "", "0")
+    store.record_call(twin, False, day)
+    assert store.stats(twin) == (1, 0, day.toordinal())
+    assert store.stats(students[0]) == (1, 1, day.toordinal())
+    store.close()
+
+def test_bind_follows_the_students():
+    students = sorted(make_roster(20).students, key=lambda student: student.UO_ID)
+    filename = os.path.join(temporary_directory(), "summary_store.dat")
+    store = SummaryStore(filename)
+    store.bind(students)
+    # Calls made while the store was closed are picked up by the next bind.
+    store.close()
+    day = date(2026, 10, 6)
+    for student in students[:5]:
+        student.call_on(False, day)
+    store = SummaryStore(filename)
+    store.bind(students)
+    assert [store.stats(student)[0] for student in students] == [1] * 5 + [0] * 15
+    store.close()
+
+    # A store in an unknown format is rebuilt from the students.
+    with open(filename, "wb") as f:
+        f.write(b"CCSS\x01\x00" + bytes(40))
+    store = SummaryStore(filename)
+    store.bind(students)
+    assert [store.stats(student)[0] for student in students] == [1] * 5 + [0] * 15
+    store.close()
+
+def test_summary_file():
+    logs_location = temporary_directory()
+    students = colliding_students()
+    log_manager = LogManager("summary.txt", logs_location)
+    students[0].call_on(True)
+    log_manager.write(students, students[0], True)
+    # The summary is only written when it is asked for.
+    assert not os.path.exists(os.path.join(logs_location, "summary.txt"))
+    assert log_manager.summary_dirty
+    log_manager.write_summary()
+    assert read_summary(logs_location) == [["1", "1", "First50225"], ["0", "0", "First274866"]]
+    students[1].call_on(False)
+    log_manager.write(students, students[1], False)
+    # Closing writes the cold calls that haven't made it to the summary yet.
+    log_manager.close()
+    assert read_summary(logs_location) == [["1", "1", "First50225"], ["1", "0", "First274866"]]
+
+class FakeWindow:
+    def __init__(self):
+        self.jobs = {}
+        self.next_job = 0
+
+    def after(self, ms, function):
+        self.next_job += 1
+        self.jobs[self.next_job] = (ms, function)
+        return self.next_job
+
+    def after_cancel(self, job):
+        del self.jobs[job]
+
+class FakeDisplay:
+    def __init__(self):
+        self.main_window = FakeWindow()
+
+def test_summary_write_is_debounced():
+    logs_location = temporary_directory()
+    students = colliding_students()
+    model = InstructorInteractionModel.__new__(InstructorInteractionModel)
+    model.display = FakeDisplay()
+    model.log_manager = LogManager("summary.txt", logs_location)
+    model.latency = LatencyRecorder(False)
+    model.summary_job = None
+    for student in students * 3:
+        student.call_on(False)
+        model.log_manager.write(students, student, False)
+        model._schedule_summary_write()
+    # A burst of cold calls leaves a single pending rewrite of the summary.
+    jobs = model.display.main_window.jobs
+    assert len(jobs) == 1
+    (ms, function), = jobs.values()
+    assert ms == SUMMARY_DEBOUNCE_MS
+    assert not os.path.exists(os.path.join(logs_location, "summary.txt"))
+    function()
+    assert model.summary_job is None
+    assert not model.log_manager.summary_dirty
+    assert read_summary(logs_location) == [["3", "0", "First50225"], ["3", "0", "First274866"]]
+    model.log_manager.close()
+
+if __name__ == "__main__":
+    test_students_never_share_a_record()
+    test_bind_follows_the_students()
+    test_summary_file()
+    test_summary_write_is_debounced()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+
+###############################################################################
+"""
+Script Name:    Test Support
+
+Description:    Helpers shared by the testing scripts, for making rosters,
+                roster files and queues of generated students, calling on
+                them, and making temporary directories that are removed when
+                the tests finish.
+
+Author:         CoolCall Team
+
+Last Edited:    10/18/2026
+Last Edit By:   CoolCall Team
+"""
+###############################################################################
+import os
+import atexit
+import random
+import shutil
+import tempfile
+from student import Student
+from student_roster import StudentRoster
+###############################################################################
+
+def make_roster(size):
+    roster = StudentRoster()
+    for i in range(size):
+        roster.add_student(Student(
+            f"First{i}", f"Last{i}", str(951000000 + i), f"s{i}@uoregon.edu", f"first{i}", "0"))
+    return roster
+
+def write_roster(directory, size):
+    filename = os.path.join(directory, "roster_in.txt")
+    with open(filename, "w") as f:
+        f.write("Roster\n")
+        for i in range(size):
+            f.write(f"First{i}\tLast{i}\t{951000000 + i}\ts{i}@uoregon.edu\tfirst{i}\t0\n")
+    return filename
+
+def temporary_directory():
+    """
+    returns: (string) a new temporary directory, which is removed with
+    everything in it when the tests finish.
+    """
+    directory = tempfile.mkdtemp()
+    atexit.register(shutil.rmtree, directory, ignore_errors=True)
+    return directory
+
+def temporary_queue_file():
+    return os.path.join(temporary_directory(), "student_queue")
+
+def call_students(queue, num_calls):
+    for _ in range(num_calls):
+        student = random.choice(queue.get_on_deck())
+        flag = random.random() < 0.3
+        student.call_on(flag)
+        queue.take_off_deck(student, flag)
+
+def history(queue):
+    return {s.get_name(): (s.total_num_flags, list(s.dates_called)) for s in queue.student_queue}
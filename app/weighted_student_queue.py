@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+
+################################################################################
+"""
+Script Name:    Weighted Student Queue Class
+
+Description:    An optional queue policy for the CoolCall Program, chosen with
+                QUEUE_POLICY in the constants file.
+
+				In the default StudentQueue, a student who is called on goes to
+				a uniformly random position in the back of the queue, and
+				on-deck students are simply the front of the queue. In the
+				WeightedStudentQueue, the student who replaces them on deck is
+				drawn at random, in proportion to a weight that depends on
+				their call history: students who have been called on less often
+				are more likely to be drawn, and flagged students more likely
+				still.
+
+				Students who were just called on wait at the back of the queue
+				for a while before they can be drawn again, like the
+				INSERT_DELAY of the default queue. Everyone else is kept in a
+				FenwickTree of weights, so each draw and each change of weight
+				takes O(log n) time.
+
+Authors:        CoolCall Team
+
+Last Edited:    10/18/2026
+Last Edit By:   CoolCall Team
+"""
+################################################################################
+import random
+from fenwick_tree import FenwickTree
+from order_statistic_tree import OrderStatisticTree
+from student_queue import StudentQueue
+from constants import *
+################################################################################
+
+def student_weight(student):
+	"""
+	The weight of a student in the draw for the next on-deck place.
+
+	student: (Student)
+	returns: (int) a positive weight, higher for students who have been called
+	on less often, and for students who have been flagged more often.
+	"""
+	weight = (1 + QUEUE_FLAG_WEIGHT * student.total_num_flags) / (1 + student.times_called())
+	return max(1, int(QUEUE_WEIGHT_SCALE * weight))
+
+
+def make_student_queue(queue_location=None, persistence=None):
+	"""
+	Make an empty queue with the policy chosen by QUEUE_POLICY.
+
+	queue_location: (string) the file to save the queue to; see StudentQueue.
+	persistence: (PersistenceWorker) writes the queue's files, if given.
+	returns: a StudentQueue or WeightedStudentQueue
+	"""
+	if QUEUE_POLICY == "weighted":
+		return WeightedStudentQueue(queue_location, persistence)
+	return StudentQueue(queue_location, persistence)
+
+
+class WeightedStudentQueue(StudentQueue):
+	"""
+	A StudentQueue that fills on-deck places by a weighted random draw.
+
+	The queue keeps the same order as a StudentQueue, and is saved the same
+	way, so the two policies can be switched between:
+	- The first NUM_ON_DECK students are on deck.
+	- The last cooldown() students were called on most recently, with the most
+	  recent last. They can't be drawn yet.
+	- Everyone in between can be drawn, in proportion to their weight.
+
+	When an on-deck student is taken off deck, they move to the back of the
+	queue, one student leaves the cooldown, and a student drawn by weight
+	moves up to the last on-deck place.
+
+	Attributes
+	============================================================================
+	(as StudentQueue)
+
+	Methods
+	============================================================================
+	(as StudentQueue, and)
+	cooldown()
+		Returns the number of recently called students who can't be drawn.
+	"""
+
+	def __init__(self, queue_location=None, persistence=None):
+		super().__init__(queue_location, persistence)
+		# Each student's slot in the FenwickTree, and the student in each slot.
+		self._slots = {}
+		self._slot_students = []
+		self._weights = FenwickTree()
+
+	def cooldown(self):
+		"""
+		The number of students at the back of the queue who were called on too
+		recently to be drawn. This matches the shortest wait in the default
+		queue, and always leaves at least one student who can be drawn.
+
+		returns: (int)
+		"""
+		size = self.queue_size()
+		return max(0, min(int(size * INSERT_DELAY) - NUM_ON_DECK, size - NUM_ON_DECK - 1))
+
+	def _rebuild_weights(self):
+		"""
+		Give every student a slot in the FenwickTree, with a weight if they can
+		be drawn. Called in O(n) time whenever the whole queue is replaced.
+		"""
+		students = list(self.student_queue)
+		self._slot_students = students
+		self._slots = {student: slot for slot, student in enumerate(students)}
+		drawable_end = len(students) - self.cooldown()
+		self._weights = FenwickTree(
+			student_weight(student) if NUM_ON_DECK <= position < drawable_end else 0
+			for position, student in enumerate(students))
+
+	def queue_from_roster(self, roster):
+		super().queue_from_roster(roster)
+		self._rebuild_weights()
+
+	def merge_roster(self, changes):
+		super().merge_roster(changes)
+		self._rebuild_weights()
+
+	def load_queue_from_file(self, filename, roster=None):
+		loaded = super().load_queue_from_file(filename, roster)
+		self._rebuild_weights()
+		return loaded
+
+	def shuffle_front_and_back(self):
+		"""
+		Shuffle the queue at the start of a lecture. The students in the
+		cooldown stay in order at the back, so they still wait their turn; the
+		rest are shuffled together, which gives a fresh set of on-deck students.
+		"""
+		students = list(self.student_queue)
+		drawable_end = len(students) - self.cooldown()
+		front = students[:drawable_end]
+		random.shuffle(front)
+		self.student_queue = OrderStatisticTree(front + students[drawable_end:])
+
+	def _move_off_deck(self, student, flag):
+		"""
+		Move an on-deck student to the back of the queue, then draw the
+		student who takes the free on-deck place. Used by take_off_deck() and
+		take_off_deck_batch(), which save the moves.
+
+		student: (Student) the student to be taken off deck
+		flag: (boolean) was their cold call flagged? None if not called on.
+		returns: (list) the moves made, for _save_moves().
+		"""
+		size = self.queue_size()
+		old_position = self.student_queue.index(student)
+		self.student_queue.remove(student)
+		self.student_queue.insert(size - 1, student)
+		moves = [(student, old_position, size - 1, flag)]
+		if size <= NUM_ON_DECK:
+			# Everyone is on deck, so there is nobody to draw.
+			return moves
+
+		slot = self._weights.sample(random)
+		if slot is not None:
+			drawn = self._slot_students[slot]
+			self._weights.set(slot, 0)
+			drawn_position = self.student_queue.index(drawn)
+			self.student_queue.remove(drawn)
+			self.student_queue.insert(NUM_ON_DECK - 1, drawn)
+			moves.append((drawn, drawn_position, NUM_ON_DECK - 1, None))
+
+		# The oldest student in the cooldown can now be drawn. If there is no
+		# cooldown, that is the student who was just called on.
+		released = self.student_queue[size - 1 - self.cooldown()]
+		self._weights.set(self._slots[released], student_weight(released))
+		return moves
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+
+###############################################################################
+"""
+Script Name:    WeightedStudentQueue Testing Script
+
+Description:    This script can be run at the command line to test the
+                FenwickTree and the weighted queue policy. The queue is saved to
+                a temporary directory, so the internal queue file is never touched.
+
+Author:         CoolCall Team
+
+Last Edited:    10/18/2026
+Last Edit By:   CoolCall Team
+"""
+###############################################################################
+import random
+from collections import Counter
+from fenwick_tree import FenwickTree
+from weighted_student_queue import WeightedStudentQueue, student_weight
+from test_support import make_roster, temporary_queue_file, call_students
+from constants import NUM_ON_DECK
+###############################################################################
+
+def expected_weights(queue):
+	students = list(queue.student_queue)
+	drawable_end = len(students) - queue.cooldown()
+	return {student: student_weight(student) if NUM_ON_DECK <= i < drawable_end else 0
+			for i, student in enumerate(students)}
+
+def test_fenwick_sampling():
+	weights = [3, 0, 5, 1, 0, 2, 7]
+	tree = FenwickTree(weights)
+	assert [tree.find(t) for t in range(tree.total())] == [
+		i for i, weight in enumerate(weights) for _ in range(weight)]
+	tree.set(2, 0)
+	tree.set(4, 4)
+	weights[2], weights[4] = 0, 4
+	assert [tree.find(t) for t in range(tree.total())] == [
+		i for i, weight in enumerate(weights) for _ in range(weight)]
+	counts = Counter(tree.sample(random) for _ in range(14000))
+	assert counts[2] == 0 and 5000 < counts[6] < 9000
+
+def test_weights_follow_the_queue():
+	for size in (3, 5, 12, 30):
+		queue = WeightedStudentQueue(temporary_queue_file())
+		queue.queue_from_roster(make_roster(size))
+		for _ in range(300):
+			on_deck = queue.get_on_deck()
+			assert len(on_deck) == min(size, NUM_ON_DECK)
+			student = random.choice(on_deck)
+			student.call_on(False)
+			queue.take_off_deck(student, False)
+			assert queue.queue_size() == size
+			if size > NUM_ON_DECK:
+				# The student just called on is never straight back on deck.
+				assert student not in queue.get_on_deck()
+				weights = expected_weights(queue)
+				assert {s: queue._weights.weights[queue._slots[s]] for s in weights} == weights
+
+def test_weights_follow_a_batch():
+	queue = WeightedStudentQueue(temporary_queue_file())
+	queue.queue_from_roster(make_roster(30))
+	for _ in range(100):
+		called = random.sample(queue.get_on_deck(), 3)
+		for student in called:
+			student.call_on(False)
+		queue.take_off_deck_batch([(student, False) for student in called])
+		assert queue.queue_size() == 30
+		assert not set(called) & set(queue.get_on_deck())
+		weights = expected_weights(queue)
+		assert {s: queue._weights.weights[queue._slots[s]] for s in weights} == weights
+
+def test_calls_are_spread_evenly():
+	queue = WeightedStudentQueue(temporary_queue_file())
+	queue.queue_from_roster(make_roster(30))
+	for _ in range(3000):
+		student = random.choice(queue.get_on_deck())
+		student.call_on(False)
+		queue.take_off_deck(student, False)
+	times_called = [student.times_called() for student in queue.student_queue]
+	assert sum(times_called) == 3000
+	# Students who have been called on less often are drawn more often.
+	assert max(times_called) - min(times_called) < 30
+
+def test_reload():
+	filename = temporary_queue_file()
+	queue = WeightedStudentQueue(filename)
+	queue.queue_from_roster(make_roster(30))
+	call_students(queue, 50)
+	cooling = list(queue.student_queue)[-queue.cooldown():]
+
+	loaded = WeightedStudentQueue(filename)
+	assert loaded.load_queue_from_file(filename, make_roster(30))
+	# The journal was replayed, and students who were just called on still wait.
+	assert [s.get_name() for s in list(loaded.student_queue)[-loaded.cooldown():]] == [
+		s.get_name() for s in cooling]
+	assert sum(s.times_called() for s in loaded.student_queue) == 50
+	weights = expected_weights(loaded)
+	assert {s: loaded._weights.weights[loaded._slots[s]] for s in weights} == weights
+
+if __name__ == "__main__":
+	test_fenwick_sampling()
+	test_weights_follow_the_queue()
+	test_weights_follow_a_batch()
+	test_calls_are_spread_evenly()
+	test_reload()